@@ -0,0 +1,70 @@
+"""
+Lookup time by ID and by an indexed attribute in the entity caches, with the linear scan of the former ` CallableUsers ` / ` CallableGuilds ` lists ( before ) and with ` EntityCache ` ( after ), at several cache sizes
+
+Run from the repository root:
+
+  python -m benchmarks.bench_cache [--sizes 1000 10000 100000] [--lookups 200]
+"""
+
+from argparse       import ArgumentParser
+from democord.cache import EntityCache
+from random         import Random
+from time           import perf_counter
+from types          import SimpleNamespace
+from typing         import *
+
+
+class ScanList(list):
+  """
+  Cache as it was before ` EntityCache `: a list filtered by scanning every entity's ` __dict__ `
+  """
+
+  def __call__(
+    self,
+    **kwargs
+  ) -> Optional[Union[List[Any], Any]]:
+    matches : List[Any] = [
+      entity
+      for entity in self
+      if all(
+        entity.__dict__.get(kwarg) == value
+        for kwarg, value in kwargs.items()
+      )
+    ]
+    return (matches[0] if len(matches) == 1 else matches) if matches else None
+
+
+def per_lookup(
+  cache   : Callable[..., Any],
+  queries : List[Dict[str, Any]]
+) -> float:
+  """
+  Returns the mean time of the lookups, in microseconds
+  """
+  started : float = perf_counter()
+  for query in queries: cache(**query)
+  return (perf_counter() - started) / len(queries) * 1_000_000
+
+
+def main() -> None:
+  parser    : ArgumentParser = ArgumentParser(description = __doc__.strip().splitlines()[0])
+  parser.add_argument("--sizes", type = int, nargs = "+", default = [1_000, 10_000, 100_000], help = "numbers of cached users")
+  parser.add_argument("--lookups", type = int, default = 200, help = "lookups per cache and query kind")
+  arguments : Any            = parser.parse_args()
+  random    : Random         = Random(0)
+  print(f"{"users":>8} {"query":>9} {"scan":>12} {"EntityCache":>12}")
+  for size in arguments.sizes:
+    users   : List[SimpleNamespace] = [SimpleNamespace(id = 80351110224678912 + index, username = f"user{index}") for index in range(size)]
+    scan    : ScanList              = ScanList(users)
+    cache   : EntityCache           = EntityCache(indexes = ("username",))
+    for user in users: cache.add(user)
+    picked  : List[SimpleNamespace] = [random.choice(users) for _ in range(arguments.lookups)]
+    for query, queries in (
+      ("id", [{"id": user.id} for user in picked]),
+      ("username", [{"username": user.username} for user in picked])
+    ):
+      print(f"{size:8,} {query:>9} {per_lookup(scan, queries):9,.1f} us {per_lookup(cache, queries):9,.2f} us")
+
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Decode time of GUILD_CREATE and READY frames with the standard library decoding every frame twice, as ` on_message ` did in debug mode ( before ), and with ` JSONCodec ` decoding it once through every installed backend, and ` ETFCodec ` ( after )
+
+Run from the repository root:
+
+  python -m benchmarks.bench_codec [--members 2000] [--guilds 1000] [--repeat 20]
+"""
+
+import json
+
+from argparse       import ArgumentParser
+from benchmarks     import fixtures
+from democord.codec import (
+                           ETFCodec,
+                           JSONCodec
+                           )
+from time           import perf_counter
+from typing         import *
+
+
+def best(
+  decode : Callable[[Any], Any],
+  frame  : Any,
+  repeat : int
+) -> float:
+  """
+  Returns the fastest of ` repeat ` decodes of a frame, in milliseconds
+  """
+  timings : List[float] = []
+  for _ in range(repeat):
+    started : float = perf_counter()
+    decode(frame)
+    timings.append(perf_counter() - started)
+  return min(timings) * 1_000
+
+
+def decoders() -> Iterator[Tuple[str, Callable[[Any], Any], Callable[[Dict[str, Any]], Any]]]:
+  """
+  Yields the name, decode function and frame encoder of every decoder to compare
+  """
+  yield "json.loads twice", lambda frame: (json.loads(frame), json.loads(frame)), json.dumps
+  for backend in ("json", "orjson", "msgspec"):
+    try:
+      codec : JSONCodec = JSONCodec(backend)
+    except ImportError:
+      print(f"{backend} is not installed, skipped")
+      continue
+    yield f"JSONCodec({backend})", codec.decode, json.dumps
+  etf : ETFCodec = ETFCodec()
+  yield "ETFCodec", etf.decode, etf.encode
+
+
+def main() -> None:
+  parser    : ArgumentParser            = ArgumentParser(description = __doc__.strip().splitlines()[0])
+  parser.add_argument("--members", type = int, default = 2_000, help = "members of the GUILD_CREATE fixture")
+  parser.add_argument("--guilds", type = int, default = 1_000, help = "guilds of the READY fixture")
+  parser.add_argument("--repeat", type = int, default = 20, help = "decodes per frame, the fastest one is reported")
+  arguments : Any                       = parser.parse_args()
+  payloads  : Dict[str, Dict[str, Any]] = {
+    "GUILD_CREATE" : fixtures.guild_create(arguments.members),
+    "READY"        : fixtures.ready(arguments.guilds)
+  }
+  print(f"{"":20} {"GUILD_CREATE":>14} {"READY":>14}")
+  for name, decode, encode in decoders():
+    frames  : Dict[str, Any] = {event: encode(payload) for event, payload in payloads.items()}
+    timings : List[float]    = [best(decode, frames[event], arguments.repeat) for event in payloads]
+    print(f"{name:20} " + " ".join(f"{timing:11.2f} ms" for timing in timings))
+  print(f"GUILD_CREATE frame: {len(json.dumps(payloads["GUILD_CREATE"])) / 1_024:,.0f} KiB of JSON")
+
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Requests per second of REST calls against a local HTTP stand-in, sending each call through a module-level ` requests.get ` with headers built per call ( before ) and through the pooled keep-alive ` HTTPClient ` ( after )
+
+The stand-in speaks plain HTTP on the loopback interface, so no TLS handshake is saved and the gap against discord.com is larger. The client's global limit ( 50 requests per second by default ) is lifted, as it would otherwise be all that is measured
+
+Run from the repository root:
+
+  python -m benchmarks.bench_http [--requests 2000]
+"""
+
+import requests
+
+from argparse           import ArgumentParser
+from democord.http      import HTTPClient
+from democord.ratelimit import RateLimiter
+from http.server        import (
+                               BaseHTTPRequestHandler,
+                               ThreadingHTTPServer
+                               )
+from threading          import Thread
+from time               import perf_counter
+from typing             import *
+
+
+class StandIn(BaseHTTPRequestHandler):
+  """
+  Answers every GET with a small JSON body, keeping connections alive like Discord does
+  """
+
+  protocol_version        : str   = "HTTP/1.1"
+  disable_nagle_algorithm : bool  = True
+  body                    : bytes = b'{"id":"80351110224678912","username":"nelly","discriminator":"0"}'
+
+  def do_GET(
+    self
+  ) -> None:
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Length", str(len(self.body)))
+    self.end_headers()
+    self.wfile.write(self.body)
+
+
+  def log_message(
+    self,
+    *args
+  ) -> None:
+    pass
+
+
+def per_call(
+  api   : str,
+  count : int
+) -> float:
+  """
+  Sends ` count ` requests the way the gateway client did before the pooled session, returning the requests per second
+  """
+  started : float = perf_counter()
+  for index in range(count):
+    headers : Dict[str, str] = {
+      "Authorization" : "Bot token",
+      "Content-Type"  : "application/json"
+    }
+    requests.get(f"{api}/users/{index}", headers = headers).json()
+  return count / (perf_counter() - started)
+
+
+def pooled(
+  api   : str,
+  count : int
+) -> float:
+  """
+  Sends ` count ` requests through a pooled keep-alive ` HTTPClient `, returning the requests per second
+  """
+  client             : HTTPClient  = HTTPClient("token")
+  client.api         : str         = api
+  client.ratelimiter : RateLimiter = RateLimiter(global_limit = count)
+  try:
+    started : float = perf_counter()
+    for index in range(count): client.request("GET", f"/users/{index}")
+    return count / (perf_counter() - started)
+  finally:
+    client.close()
+
+
+def main() -> None:
+  parser    : ArgumentParser      = ArgumentParser(description = __doc__.strip().splitlines()[0])
+  parser.add_argument("--requests", type = int, default = 2_000, help = "requests sent by each client")
+  arguments : Any                 = parser.parse_args()
+  server    : ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+  server.daemon_threads : bool = True
+  Thread(target = server.serve_forever, daemon = True).start()
+  api       : str                 = f"http://127.0.0.1:{server.server_port}"
+  try:
+    before : float = per_call(api, arguments.requests)
+    after  : float = pooled(api, arguments.requests)
+  finally:
+    server.shutdown()
+    server.server_close()
+  print(f"requests.get per call : {before:8,.0f} req/s")
+  print(f"pooled HTTPClient     : {after:8,.0f} req/s ( x{after / before:.2f} )")
+
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
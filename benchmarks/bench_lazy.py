@@ -0,0 +1,79 @@
+"""
+Construction time of a members chunk and of a GUILD_CREATE, with every derived field computed up front as the models did before ( eager ), and with the lazy models computing them on first access ( lazy ). A plain copy of each member payload is timed as the floor
+
+Eager construction is reproduced by building the lazy models and reading every derived field once, which is the work the former ` from_data ` methods did
+
+Run from the repository root:
+
+  python -m benchmarks.bench_lazy [--members 250000] [--guild-members 2000]
+"""
+
+from argparse        import ArgumentParser
+from benchmarks      import fixtures
+from democord.cache  import EntityCache
+from democord.guild  import Guild
+from democord.member import Member
+from time            import perf_counter
+from types           import SimpleNamespace
+from typing          import *
+
+
+USER_FIELDS  : Tuple[str, ...] = ("avatar", "discriminator", "global_name", "user_flags")
+GUILD_FIELDS : Tuple[str, ...] = ("default_message_notifications", "explicit_content_filter", "icon", "mfa_level", "nsfw_level", "premium_tier", "system_channel_flags", "verification_level")
+
+
+def fake_ws() -> SimpleNamespace:
+  return SimpleNamespace(app = SimpleNamespace(cache_policies = {}, users = EntityCache(), user = None, logger = None))
+
+
+def materialize(
+  member : Member
+) -> Member:
+  """
+  Reads every derived field of a member and of its user
+  """
+  member.role_ids
+  for field in USER_FIELDS: getattr(member.user, field)
+  return member
+
+
+def timed(
+  function : Callable[[], Any]
+) -> float:
+  """
+  Returns the time a call takes, in milliseconds
+  """
+  started : float = perf_counter()
+  function()
+  return (perf_counter() - started) * 1_000
+
+
+def eager_guild(
+  data : Dict[str, Any]
+) -> Guild:
+  guild : Guild = Guild.from_data(fake_ws(), data)
+  for field in GUILD_FIELDS: getattr(guild, field)
+  for member in guild.members: materialize(member)
+  return guild
+
+
+def main() -> None:
+  parser    : ArgumentParser       = ArgumentParser(description = __doc__.strip().splitlines()[0])
+  parser.add_argument("--members", type = int, default = 250_000, help = "members of the chunk")
+  parser.add_argument("--guild-members", type = int, default = 2_000, help = "members of the GUILD_CREATE")
+  arguments : Any                  = parser.parse_args()
+  ws        : SimpleNamespace      = fake_ws()
+  roles     : List[str]            = [str(197038439483310086 + index) for index in range(20)]
+  chunk     : List[Dict[str, Any]] = [fixtures.member(80351110224678912 + index, roles) for index in range(arguments.members)]
+  guild     : Dict[str, Any]       = fixtures.guild_create(arguments.guild_members)["d"]
+  print(f"members chunk ( {arguments.members:,} members )")
+  print(f"  dict copy : {timed(lambda: [dict(data) for data in chunk]):9,.1f} ms")
+  print(f"  eager     : {timed(lambda: [materialize(Member.from_data(ws, data)) for data in chunk]):9,.1f} ms")
+  print(f"  lazy      : {timed(lambda: [Member.from_data(ws, data) for data in chunk]):9,.1f} ms")
+  print(f"GUILD_CREATE ( {arguments.guild_members:,} members )")
+  print(f"  eager     : {timed(lambda: eager_guild(guild)):9,.1f} ms")
+  print(f"  lazy      : {timed(lambda: Guild.from_data(fake_ws(), guild)):9,.1f} ms")
+
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Bytes retained per cached User and Member, measured with tracemalloc, with the former models writing every payload field and precomputed URL into the instance ` __dict__ ` ( before ) and with the slotted models ( after )
+
+Two figures are reported per object. ` retained ` builds each object from a freshly decoded payload and keeps only the objects, so the payload a slotted model keeps as ` _data ` is counted against it. ` object ` builds the objects from payloads decoded before the measurement, as when the payloads are held anyway, and counts only what the object adds
+
+Run from the repository root:
+
+  python -m benchmarks.bench_memory [--count 1000000]
+"""
+
+import gc
+import tracemalloc
+
+from argparse        import ArgumentParser
+from benchmarks      import fixtures
+from democord.flags  import UserFlags
+from democord.member import Member
+from democord.user   import User
+from types           import SimpleNamespace
+from typing          import *
+
+
+class DictUser:
+  """
+  User as it was before the slotted models: every field in the instance ` __dict__ `, with the avatar URLs and flag names computed up front
+  """
+
+  @classmethod
+  def from_data(
+    cls,
+    data : Dict[str, Any]
+  ) -> Self:
+    user : Self = cls()
+    for attribute, value in data.items():
+      match attribute:
+        case "id" | "discriminator": user.__dict__[attribute] = int(value)
+        case "global_name":          user.__dict__[attribute] = value or data["username"]
+        case "avatar":
+          user.__dict__[attribute] = f"https://cdn.discordapp.com/avatars/{data["id"]}/{value}.{"gif" if value.startswith("a_") else "png"}" if value else ""
+          user.default_avatar      = f"https://cdn.discordapp.com/embed/avatars/{(int(data["id"]) >> 22) % 6}.png"
+          user.avatar_decoration   = f"https://cdn.discordapp.com/avatar-decoration-presets/{data["avatar_decoration_data"]["asset"]}.png" if data.get("avatar_decoration_data") else ""
+        case "public_flags":         user.__dict__["user_flags"] = [name for name, flag in UserFlags._member_map_.items() if (value & flag.value) == flag.value]
+        case _:                      user.__dict__[attribute] = value
+    return user
+
+
+class DictMember:
+  """
+  Member as a ` __dict__ ` of every payload field, with its user built as a ` DictUser `
+  """
+
+  @classmethod
+  def from_data(
+    cls,
+    data : Dict[str, Any]
+  ) -> Self:
+    member : Self = cls()
+    for attribute, value in data.items():
+      member.__dict__[attribute] = DictUser.from_data(value) if attribute == "user" else value
+    return member
+
+
+def measure(
+  build    : Callable[[Dict[str, Any]], Any],
+  payload  : Callable[[int], Dict[str, Any]],
+  count    : int,
+  retained : bool
+) -> float:
+  """
+  Returns the bytes per object once ` count ` objects are built, counting their payloads if ` retained `, otherwise only what the objects add to them
+  """
+  payloads : Optional[List[Dict[str, Any]]] = None if retained else [payload(index) for index in range(count)]
+  gc.collect()
+  tracemalloc.start()
+  baseline : int       = tracemalloc.get_traced_memory()[0]
+  objects  : List[Any] = [build(payload(index)) for index in range(count)] if retained else [build(data) for data in payloads]
+  gc.collect()
+  used     : int       = tracemalloc.get_traced_memory()[0] - baseline
+  tracemalloc.stop()
+  del objects, payloads
+  return used / count
+
+
+def main() -> None:
+  parser    : ArgumentParser  = ArgumentParser(description = __doc__.strip().splitlines()[0])
+  parser.add_argument("--count", type = int, default = 1_000_000, help = "objects of each kind to build")
+  arguments : Any             = parser.parse_args()
+  ws        : SimpleNamespace = SimpleNamespace(app = None)
+  roles     : List[str]       = [str(197038439483310086 + index) for index in range(20)]
+  first     : int             = 80351110224678912
+  print(f"{arguments.count:,} objects of each kind, bytes per object")
+  for name, payload, before, after in (
+    ("User", lambda index: fixtures.user(first + index), DictUser.from_data, User.from_data),
+    ("Member", lambda index: fixtures.member(first + index, roles), DictMember.from_data, lambda data: Member.from_data(ws, data))
+  ):
+    for retained in (True, False):
+      old : float = measure(before, payload, arguments.count, retained)
+      new : float = measure(after, payload, arguments.count, retained)
+      print(f"{name:6} {"retained" if retained else "object":8} {old:7,.0f} -> {new:7,.0f} ( {(new - old) * arguments.count / 1_048_576:+,.0f} MiB in total )")
+
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
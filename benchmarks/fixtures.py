@@ -0,0 +1,109 @@
+"""
+Gateway payloads shaped like the ones Discord sends, sized for benchmarks
+"""
+
+from typing import *
+
+
+def user(
+  user_id : int
+) -> Dict[str, Any]:
+  return {
+    "id"                     : str(user_id),
+    "username"               : f"user{user_id}",
+    "global_name"            : f"User {user_id} ✨",
+    "discriminator"          : "0",
+    "avatar"                 : "8342729096ea3675442027381ff50dfe" if user_id % 3 else None,
+    "avatar_decoration_data" : None,
+    "bot"                    : False,
+    "public_flags"           : 64 if user_id % 5 else 0
+  }
+
+
+def member(
+  user_id : int,
+  roles   : List[str]
+) -> Dict[str, Any]:
+  return {
+    "user"                         : user(user_id),
+    "nick"                         : f"nick {user_id}" if user_id % 4 == 0 else None,
+    "avatar"                       : None,
+    "roles"                        : roles[:user_id % len(roles)],
+    "joined_at"                    : "2023-01-01T00:00:00.000000+00:00",
+    "premium_since"                : None,
+    "deaf"                         : False,
+    "mute"                         : False,
+    "flags"                        : 0,
+    "pending"                      : False,
+    "communication_disabled_until" : None
+  }
+
+
+def guild_create(
+  members  : int = 2_000,
+  channels : int = 50,
+  roles    : int = 20
+) -> Dict[str, Any]:
+  """
+  Returns a GUILD_CREATE dispatch of a guild with the given number of members, channels and roles, with a presence for every tenth member
+  """
+  guild_id : int       = 197038439483310086
+  role_ids : List[str] = [str(guild_id + index) for index in range(roles)]
+  return {"op": 0, "s": 2, "t": "GUILD_CREATE", "d": {
+    "id"                            : str(guild_id),
+    "name"                          : "Benchmark Guild",
+    "icon"                          : "a_8342729096ea3675442027381ff50dfe",
+    "owner_id"                      : "73193882359173120",
+    "afk_timeout"                   : 300,
+    "member_count"                  : members,
+    "large"                         : members > 250,
+    "unavailable"                   : False,
+    "verification_level"            : 2,
+    "default_message_notifications" : 1,
+    "explicit_content_filter"       : 2,
+    "mfa_level"                     : 1,
+    "nsfw_level"                    : 0,
+    "premium_tier"                  : 3,
+    "system_channel_flags"          : 0,
+    "features"                      : ["ANIMATED_ICON", "COMMUNITY", "NEWS"],
+    "joined_at"                     : "2023-01-01T00:00:00.000000+00:00",
+    "roles"                         : [
+      {"id": role_id, "name": f"role {index}", "permissions": str(1071698660929 if index else 1024), "position": index, "color": index * 4_000, "hoist": bool(index % 2), "managed": False, "mentionable": True}
+      for index, role_id in enumerate(role_ids)
+    ],
+    "channels"                      : [
+      {
+        "id"                    : str(guild_id + 1_000 + index),
+        "type"                  : 0,
+        "name"                  : f"channel-{index}",
+        "position"              : index,
+        "parent_id"             : None,
+        "nsfw"                  : False,
+        "topic"                 : "A channel used by the benchmarks",
+        "permission_overwrites" : [{"id": role_ids[index % roles], "type": 0, "allow": "1024", "deny": "2048"}]
+      }
+      for index in range(channels)
+    ],
+    "members"                       : [member(80351110224678912 + index, role_ids) for index in range(members)],
+    "presences"                     : [
+      {"user": {"id": str(80351110224678912 + index)}, "status": "online", "activities": [{"name": "Testing", "type": 0, "created_at": 1700000000000}], "client_status": {"desktop": "online"}}
+      for index in range(0, members, 10)
+    ]
+  }}
+
+
+def ready(
+  guilds : int = 1_000
+) -> Dict[str, Any]:
+  """
+  Returns the READY dispatch of a shard with the given number of unavailable guilds
+  """
+  return {"op": 0, "s": 1, "t": "READY", "d": {
+    "v"                  : 10,
+    "user"               : {**user(80351110224678912), "bot": True},
+    "guilds"             : [{"id": str(197038439483310086 + index), "unavailable": True} for index in range(guilds)],
+    "session_id"         : "d4c1fe1a8cda3e5ac1c5e37b7de4b0ab",
+    "resume_gateway_url" : "wss://gateway-us-east1-b.discord.gg",
+    "shard"              : [0, 1],
+    "application"        : {"id": "80351110224678912", "flags": 8953856}
+  }}
\ No newline at end of file
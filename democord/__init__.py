@@ -1,5 +1,7 @@
 from .            import errors
 from .app         import App
+from .cache       import CachePolicy
+from .cluster     import Cluster
 from .color       import Color
 from .enums       import (
                          DefaultMessageNotification,
@@ -16,26 +18,47 @@ from .enums       import (
 from .file        import File
 from .flags       import (
                          ApplicationFlags,
+                         ApplicationFlagSet,
+                         FlagSet,
                          SystemChannelFlags,
-                         UserFlags
+                         SystemChannelFlagSet,
+                         UserFlags,
+                         UserFlagSet
                          )
 from .intents     import Intents
 from .locales     import Locale
-from .permissions import Permissions
+from .permissions import (
+                         PermissionResolver,
+                         Permissions
+                         )
 from typing       import TYPE_CHECKING
 
 if TYPE_CHECKING:
-  from .appinfo  import AppInfo
-  from .asset    import Asset
-  from .channels import GuildChannel
-  from .emoji    import Emoji
-  from .guild    import (
-                        Guild,
-                        GuildPreview
-                        )
-  from .logger   import Logger
-  from .member   import Member
-  from .role     import Role
-  from .sticker  import Sticker
-  from .user     import User
-  from .ws       import DiscordWebSocket
\ No newline at end of file
+  from .appinfo   import AppInfo
+  from .asset     import Asset
+  from .cache     import (
+                         EntityCache,
+                         MemberCache
+                         )
+  from .channels  import GuildChannel
+  from .cluster   import ClusterClient
+  from .emoji     import Emoji
+  from .guild     import (
+                         Guild,
+                         GuildPreview
+                         )
+  from .http      import HTTPClient
+  from .iterators import (
+                         MemberChunk,
+                         MemberChunkIterator,
+                         MemberIterator
+                         )
+  from .logger    import Logger
+  from .member    import (
+                         BulkEditResult,
+                         Member
+                         )
+  from .role      import Role
+  from .sticker   import Sticker
+  from .user      import User
+  from .ws        import DiscordWebSocket
\ No newline at end of file
@@ -1,88 +1,77 @@
-from .appinfo  import AppInfo
-from .channels import GuildChannel
-from .enums    import (
-                      DefaultMessageNotification,
-                      ExplicitContentFilter,
-                      VerificationLevel
-                      )
-from .errors   import APILimit
-from .events   import AppEvents
-from .flags    import SystemChannelFlags
-from .guild    import Guild
-from .intents  import Intents
-from .logger   import Logger
-from .reqs     import GET, POST
-from .role     import Role
-from .user     import User
-from .ws       import DiscordWebSocket
-from dotenv    import load_dotenv
-from os        import getenv
-from threading import Thread
-from typing    import *
-
-
-class CallableGuilds(list):
-  def __call__(self, **kwargs) -> Optional[List[Guild] | Guild]:
-    """
-    Filter the returned list of Guild objects
+import rel
+
+from .appinfo    import AppInfo
+from .cache      import (
+                        CachePolicy,
+                        EntityCache
+                        )
+from .channels   import GuildChannel
+from .dispatcher import Dispatcher
+from .enums      import (
+                        DefaultMessageNotification,
+                        ExplicitContentFilter,
+                        GatewayEvents,
+                        VerificationLevel
+                        )
+from .errors     import APILimit
+from .events     import AppEvents
+from .flags      import SystemChannelFlags
+from .guild      import Guild
+from .http       import HTTPClient
+from .intents    import Intents
+from .logger     import Logger
+from .reqs       import GET, POST
+from .role       import Role
+from .sharding   import (
+                        IdentifyLimiter,
+                        shard_id_for
+                        )
+from .user       import User
+from .ws         import DiscordWebSocket
+from asyncio     import Semaphore
+from dotenv      import load_dotenv
+from itertools   import count
+from os          import getenv
+from threading   import Thread
+from typing      import *
+
+if TYPE_CHECKING:
+  from .cluster import ClusterClient
 
-    Parameters
-    ----------
-    **kwargs
-      Keyword arguments of Guild attributes and values used to filter the results
 
-    Returns
-    -------
-    Optional[List[Guild] | Guild]
-    """
-    if not kwargs: return self
-    matches : List[Guild] = [
-      guild
-      for guild in self
-      if all(
-        guild.__dict__[kwarg] == kwargs[kwarg]
-        for kwarg in kwargs
-        if guild.__dict__.get(kwarg)
-      )
-    ]
-    return (matches[0] if len(matches) == 1 else matches) if matches else None
+class App:
+  """
+  Represents a Discord application
 
+  Attributes
+  ----------
+  cache_policies : Dict[str, CachePolicy]
+    Eviction policies of the ` guilds `, ` users `, ` members ` and ` channels ` caches, keyed by cache name
 
-class CallableUsers(list):
-  def __call__(self, **kwargs) -> Optional[List[User] | User]:
-    """
-    Filter the returned list of User objects
+  cluster : Optional[ClusterClient]
+    IPC channel to the other workers, if the application is run by a Cluster
 
-    Parameters
-    ----------
-    **kwargs
-      User attributes used to filter the returned list of Users
+  compress : bool
+    Whether ` zlib-stream ` transport compression is enabled for the gateway connection
 
-    Returns
-    -------
-    Optional[List[User] | User]
-    """
-    if not kwargs: return self
-    matches : List[User] = [
-      user
-      for user in self
-      if all(
-        user.__dict__[kwarg] == kwargs[kwarg]
-        for kwarg in kwargs
-        if user.__dict__.get(kwarg)
-      )
-    ]
-    return (matches[0] if len(matches) == 1 else matches) if matches else None
+  dispatcher : Dispatcher
+    Long-lived event loop the event listeners run on
 
+  encoding : str
+    Encoding of the gateway payloads, either ` json ` or ` etf `
 
-class App:
-  """
-  Represents a Discord application
+  gateway : Dict[str, Any]
+    Gateway information returned by ` /gateway/bot `
 
-  Attributes
-  ----------
-  guilds  : List[Guild]
-    List of guilds the application has access to
+
+  guilds  : EntityCache
+    Cache of guilds the application has access to, keyed by guild ID
+
+  http    : HTTPClient
+    Pooled HTTP session used for every REST call of the application
+
+  identify_limiter : IdentifyLimiter
+    Limiter spacing out the IDENTIFY payloads of every shard
 
   info    : AppInfo
     The application's info data
@@ -93,24 +82,40 @@ class App:
   logger  : Optional[Logger]
     The logger initiated for the application, if enabled
 
+  member_nonces : Iterator[int]
+    Counter the nonces of the application's member requests are drawn from
+
+  shard_count : int
+    Total number of shards of the application
+
+  shards : Dict[int, DiscordWebSocket]
+    Gateway connections of the application, keyed by shard ID
+
   user    : User
     Corresponding User object of the application
 
-  users   : List[User]
-    List of users the application has access to
+  users   : EntityCache
+    Cache of users the application has access to, keyed by user ID
 
   ws      : DiscordWebSocket
-    WebSocket used for connecting the application to Discord API
+    WebSocket of the first shard, used for connecting the application to Discord API
   """
 
-  users : list[User] = CallableUsers()
-
   def __init__(
     self,
     *,
-    intents    : Intents = None,
-    logger     : bool    = False,
-    debug_mode : bool    = False
+    intents        : Intents                          = None,
+    logger         : bool                             = False,
+    debug_mode     : bool                             = False,
+    pool_size      : int                              = 10,
+    keep_alive     : bool                             = True,
+    compress       : bool                             = False,
+    encoding       : str                              = "json",
+    shard_count    : Optional[int]                    = None,
+    shard_ids      : Optional[List[int]]              = None,
+    cache_policies : Optional[Dict[str, CachePolicy]] = None,
+    member_request_concurrency : int                  = 2,
+    response_ttls  : Optional[Dict[str, float]]       = None
   ) -> None:
     """
     Parameters
@@ -123,22 +128,77 @@ class App:
 
     debug_mode : Optional[bool]
       Whether to enable debug mode of the logger. This is ignored if logger is False. Defaults to
+
+    pool_size : Optional[int]
+      Maximum number of keep-alive connections pooled per host for REST calls. Defaults to 10
+
+    keep_alive : Optional[bool]
+      Whether to reuse REST connections between calls. Defaults to True
+
+    compress : Optional[bool]
+      Whether to enable ` zlib-stream ` transport compression for the gateway connection. Defaults to False
+
+    encoding : Optional[str]
+      Encoding of the gateway payloads, either ` json ` or ` etf `. Defaults to ` json `
+
+    shard_count : Optional[int]
+      Total number of shards. Defaults to the number recommended by ` /gateway/bot `
+
+    shard_ids : Optional[List[int]]
+      IDs of the shards this application runs. Defaults to every shard
+
+    cache_policies : Optional[Dict[str, CachePolicy]]
+      Eviction policies keyed by cache name, among ` guilds `, ` users `, ` members ` and ` channels `. Caches without a policy keep every entity
+
+    member_request_concurrency : Optional[int]
+      Maximum number of gateway member requests awaiting their chunks at once, across every guild. Defaults to 2
+
+    response_ttls : Optional[Dict[str, float]]
+      Seconds the responses of a GET route stay cached, keyed by route template, e.g. ` {"GET /users/{id}": 30.0} `. Identical concurrent GET requests share one call whether or not their route is cached. Defaults to caching no route
     """
     load_dotenv()
     self.__app_events         : AppEvents        = AppEvents(self)
     self.__token              : str              = getenv("TOKEN")
     if not self.__token:
       raise Exception("No TOKEN environment variable was found.")
+    if encoding not in ("json", "etf"):
+      raise ValueError("encoding must either be 'json' or 'etf'")
+    if cache_policies and not set(cache_policies) <= {"guilds", "users", "members", "channels"}:
+      raise ValueError(f"Unknown caches: {", ".join(set(cache_policies) - {"guilds", "users", "members", "channels"})}")
+    if member_request_concurrency < 1:
+      raise ValueError("member_request_concurrency must be 1 or greater")
+    self.cache_policies       : Dict[str, CachePolicy] = dict(cache_policies or {})
+    self.cluster              : Optional[ClusterClient] = None
+    self.compress             : bool             = compress
+    self.encoding             : str              = encoding
     self._appinfo             : AppInfo          = None
+    self._dispatcher          : Dispatcher       = Dispatcher()
     self._guild_join_requests : List             = []
+    self._http                : HTTPClient       = HTTPClient(
+      self.__token,
+      pool_maxsize  = pool_size,
+      keep_alive    = keep_alive,
+      response_ttls = response_ttls
+    )
     self._presences           : List             = []
     self._private_channels    : List             = []
     self._relationships       : List             = []
-    self._ws                  : DiscordWebSocket = DiscordWebSocket(self)
-    self.guilds               : List[Guild]      = CallableGuilds()
+    self._gateway             : Dict[str, Any]   = self._http.request("GET", "/gateway/bot")
+    self._ready_shards        : Set[int]         = set()
+    self.identify_limiter     : IdentifyLimiter  = IdentifyLimiter.from_gateway(self._gateway["session_start_limit"])
+    self.shard_count          : int              = shard_count or self._gateway["shards"]
+    self.shards               : Dict[int, DiscordWebSocket] = {
+      shard_id: DiscordWebSocket(self, shard_id, self.shard_count)
+      for shard_id in (shard_ids if shard_ids is not None else range(self.shard_count))
+    }
+    self._ws                  : DiscordWebSocket = next(iter(self.shards.values()))
+    self.guilds               : EntityCache      = EntityCache(indexes = ("name",), policy = self.cache_policies.get("guilds"))
     self.intents              : Intents          = intents if intents else Intents.none()
     self.logger               : Optional[Logger] = Logger(debug_mode = debug_mode) if logger else None
+    self.member_nonces        : Iterator[int]    = count()
+    self.member_requests      : Semaphore        = Semaphore(member_request_concurrency)
     self.user                 : User             = None
+    self.users                : EntityCache      = EntityCache(indexes = ("username",), policy = self.cache_policies.get("users"))
 
 
   @property
@@ -153,10 +213,58 @@ class App:
     return self._appinfo
 
 
+  @property
+  def dispatcher(self) -> Dispatcher:
+    """
+    Long-lived event loop the event listeners run on
+
+    Returns
+    -------
+    Dispatcher
+    """
+    return self._dispatcher
+
+
+  @property
+  def events(self) -> AppEvents:
+    """
+    Registry of the application's event listeners
+
+    Returns
+    -------
+    AppEvents
+    """
+    return self.__app_events
+
+
+  @property
+  def gateway(self) -> Dict[str, Any]:
+    """
+    Gateway information returned by ` /gateway/bot `, holding the gateway URL, the recommended shard count and the session start limits
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+    return self._gateway
+
+
+  @property
+  def http(self) -> HTTPClient:
+    """
+    Pooled HTTP session used for every REST call of the application
+
+    Returns
+    -------
+    HTTPClient
+    """
+    return self._http
+
+
   @property
   def ws(self) -> DiscordWebSocket:
     """
-    WebSocket used for connecting to Discord API
+    WebSocket of the first shard, used for connecting to Discord API
 
     Returns
     -------
@@ -169,15 +277,96 @@ class App:
     """
     Login and connect to the gateway
     """
-    self.ws.connect()
+    try:
+      self.dispatcher.start()
+      for shard in self.shards.values(): shard.connect()
+      rel.signal(
+        2,
+        rel.abort
+      )
+      rel.dispatch()
+    finally:
+      self.close()
+
+
+  def close(self) -> None:
+    """
+    Closes every gateway connection, the event loop and every pooled REST connection
+    """
+    for shard in self.shards.values(): shard.close()
+    self.dispatcher.stop()
+    self.http.close()
 
 
-  def listen(self, event_name = None) -> Callable:
-    def wrapper(function : Callable) -> None:
+  def shard_for(self, guild_id : int) -> Optional[DiscordWebSocket]:
+    """
+    Returns the shard that receives the events of a guild, if it is run by this application
+
+    Parameters
+    ----------
+    guild_id : int
+      ID of the guild
+
+    Returns
+    -------
+    Optional[DiscordWebSocket]
+    """
+    return self.shards.get(shard_id_for(guild_id, self.shard_count))
+
+
+  def listen(self, event_name : Optional[Union[GatewayEvents, str]] = None) -> Callable:
+    """
+    Registers a coroutine as an event listener, e.g. ` on_message_create ` for ` MESSAGE_CREATE ` events
+
+    Parameters
+    ----------
+    event_name : Optional[Union[GatewayEvents, str]]
+      Listener name, event name or event to listen to. Defaults to the coroutine's name
+    """
+    def wrapper(function : Callable) -> Callable:
       self.__app_events.add(event_name or function.__name__, function)
+      return function
     return wrapper
 
 
+  async def wait_for(
+    self,
+    event    : Union[GatewayEvents, str],
+    *,
+    check    : Optional[Callable[..., bool]] = None,
+    timeout  : Optional[float]               = None,
+    guild_id : Optional[int]                 = None
+  ) -> Any:
+    """
+    Waits for the next event that passes a check, e.g. ` await app.wait_for("guild_create", check = lambda guild: guild.id == guild_id, timeout = 30) `
+
+    Parameters
+    ----------
+    event : Union[GatewayEvents, str]
+      Listener name, event name or event to wait for
+
+    check : Optional[Callable[..., bool]]
+      Called with the event's listener arguments. Defaults to accepting the first event
+
+    timeout : Optional[float]
+      Seconds to wait before raising TimeoutError. Defaults to waiting forever
+
+    guild_id : Optional[int]
+      Only wait for events of this guild, without checking the events of other guilds. Defaults to any guild
+
+    Returns
+    -------
+    Any
+      The event's listener argument, or a tuple of them if there are several
+
+    Raises
+    ------
+    TimeoutError
+      No matching event happened within ` timeout ` seconds
+    """
+    return await self.__app_events.wait_for(event, check = check, timeout = timeout, guild_id = guild_id)
+
+
   async def create_guild(
     self,
     name : str,
@@ -242,7 +431,7 @@ class App:
             if not isinstance(attributes[attribute], VerificationLevel):
               raise TypeError("Guild.verification_level must be of type <VerificationLevel>")
             data[attribute] : int = attributes[attribute].value
-      response : Dict[str, Any] = self.ws.post(
+      response : Dict[str, Any] = await self.ws.post(
         POST.guilds,
         data = data
       )
@@ -273,8 +462,8 @@ class App:
     """
     assert isinstance(with_counts, bool), "with_counts argument must be a boolean"
     return Guild.from_data(
-      self.ws,
-      self.ws.get(
+      self.shard_for(guild_id) or self.ws,
+      await self.ws.get(
         GET.guild(
           guild_id,
           with_counts
@@ -285,7 +474,7 @@ class App:
 
   async def fetch_guild(self, guild_id : int, /, *, with_counts : bool = False) -> Guild | None:
     assert isinstance(with_counts, bool), "with_counts argument must be a boolean"
-    return Guild.from_data(self.ws, self.ws.get(GET.guild(guild_id, with_counts)))
+    return Guild.from_data(self.shard_for(guild_id) or self.ws, await self.ws.get(GET.guild(guild_id, with_counts)))
 
 
   async def on_ready(self) -> None:
@@ -1,10 +1,11 @@
-from .flags import  (
-                    ApplicationFlags
-                    )
+from .flags  import (
+                   ApplicationFlags,
+                   ApplicationFlagSet
+                   )
 from typing import *
 
 
-class AppInfoFlags(int):
+class AppInfoFlags(ApplicationFlagSet):
   """
   Callable property for AppInfo.flags
   """
@@ -17,17 +18,7 @@ class AppInfoFlags(int):
     -------
     List[str]
     """
-    return [
-      name
-      for name, flag in ApplicationFlags._member_map_.items()
-      if ( self & flag.value ) == flag.value
-    ]
-
-  def __int__(self) -> int:
-    """
-    The bitfield value of the application's flags
-    """
-    return self
+    return list(self.names)
 
 
 class AppInfo:
@@ -122,7 +113,7 @@ class AppInfo:
   ) -> None:
     for attribute in attributes:
       match attribute:
-        case "flags"                 : self.__dict__["flags"]              : Union[int, List[str]] = AppInfoFlags(attributes[attribute])
+        case "flags"                 : self.__dict__["flags"]              : AppInfoFlags          = AppInfoFlags(attributes[attribute])
         case "bot_public"            : self.__dict__["public"]             : bool                  = attributes[attribute]
         case "bot_require_code_grant": self.__dict__["require_code_grant"] : bool                  = attributes[attribute]
         case _                       : self.__dict__[attribute]            : Any                   = attributes[attribute]
@@ -159,7 +150,7 @@ class AppInfo:
 
     flag : ApplicationFlags = ApplicationFlags._member_map_.get(name)
     if not flag: raise AttributeError(f"There is no such Application Flag named: {name}")
-    return ( self.value & flag.value ) == flag.value
+    return flag in self.flags
 
 
   @property
@@ -171,7 +162,7 @@ class AppInfo:
     -------
     int
     """
-    return self._flags_value
+    return int(self.flags)
 
 
   @classmethod
@@ -18,6 +18,8 @@ class Asset:
     URL of the asset
   """
 
+  __slots__ : Tuple[str, ...] = ("key", "url")
+
   def __hash__(self) -> str:
     """
     Utilizes the built-in hash() function that returns the hash of the asset
@@ -0,0 +1,466 @@
+from collections import OrderedDict
+from threading   import Lock
+from time        import monotonic
+from typing      import *
+
+
+class CachePolicy:
+  """
+  Eviction policy of an entity cache. A policy may be shared by several caches, e.g. the member caches of every guild: ` max_entries ` then caps each of them, while ` max_total ` caps them all together
+
+
+  Attributes
+  ----------
+  lru : bool
+    Whether reading an entity counts as using it. If enabled, the least recently used entity is evicted first, otherwise the oldest one
+
+  max_entries : Optional[int]
+    Maximum number of entities cached in each cache using the policy, e.g. per guild for member caches
+
+  max_total : Optional[int]
+    Maximum number of entities cached across every cache using the policy. The least recently added ( or used, if ` lru ` is enabled ) entity is evicted first, whichever cache holds it
+
+  member_threshold : Optional[int]
+    Only cache the members of guilds with fewer members than this. Only applies to member caches
+
+  ttl : Optional[float]
+    Seconds an entity stays cached after it was added ( or last used, if ` lru ` is enabled )
+  """
+
+  def __init__(
+    self,
+    *,
+    max_entries      : Optional[int]   = None,
+    max_total        : Optional[int]   = None,
+    ttl              : Optional[float] = None,
+    lru              : bool            = False,
+    member_threshold : Optional[int]   = None
+  ) -> None:
+    """
+    Parameters
+    ----------
+    max_entries : Optional[int]
+      Maximum number of entities cached in each cache using the policy. Defaults to no limit
+
+    max_total : Optional[int]
+      Maximum number of entities cached across every cache using the policy. Defaults to no limit
+
+    ttl : Optional[float]
+      Seconds an entity stays cached. Defaults to no expiry
+
+    lru : Optional[bool]
+      Whether to evict the least recently used entity first instead of the oldest one. Defaults to ` False `
+
+    member_threshold : Optional[int]
+      Only cache the members of guilds with fewer members than this. Defaults to no threshold
+    """
+    if max_entries is not None and max_entries < 1: raise ValueError("max_entries must be 1 or greater")
+    if max_total is not None and max_total < 1: raise ValueError("max_total must be 1 or greater")
+    if ttl is not None and ttl <= 0: raise ValueError("ttl must be greater than 0")
+    self.lru              : bool                                         = lru
+    self.max_entries      : Optional[int]                                = max_entries
+    self.max_total        : Optional[int]                                = max_total
+    self.member_threshold : Optional[int]                                = member_threshold
+    self.ttl              : Optional[float]                              = ttl
+    self._entries         : OrderedDict[Tuple["EntityCache", int], None] = OrderedDict()
+    self._lock            : Lock                                         = Lock()
+
+
+  def _track(
+    self,
+    cache     : "EntityCache",
+    entity_id : int
+  ) -> None:
+    """
+    Records that a cache added or used an entity, then evicts the least recent entities over ` max_total `
+    """
+    with self._lock:
+      self._entries[cache, entity_id] = None
+      self._entries.move_to_end((cache, entity_id))
+      overflow : List[Tuple["EntityCache", int]] = [
+        self._entries.popitem(last = False)[0]
+        for _ in range(len(self._entries) - self.max_total)
+      ]
+    for owner, owned_id in overflow: owner._evict(owned_id)
+
+
+  def _forget(
+    self,
+    cache     : "EntityCache",
+    entity_id : int
+  ) -> None:
+    """
+    Records that a cache no longer holds an entity
+    """
+    with self._lock:
+      self._entries.pop((cache, entity_id), None)
+
+
+class EntityCache:
+  """
+  Keyed store of cached entities ( guilds, users, members, channels ), indexed by snowflake and optionally by other attributes
+
+  Calling the cache filters it by attribute values, e.g. ` app.guilds(id = 1234) ` or ` guild.members(nick = "demo") `. Filters on ` id ` or on an indexed attribute are resolved in constant time, other filters scan the cache
+
+  Entities are kept in the order they were added ( or used, with an LRU policy ), so evicting the oldest entity or the expired ones only ever looks at the front of the cache
+
+
+  Attributes
+  ----------
+  evictions : int
+    Number of entities evicted by the policy
+
+  hits : int
+    Number of lookups by ID that found a cached entity
+
+  indexes : Tuple[str, ...]
+    Names of the attributes with a secondary index
+
+  misses : int
+    Number of lookups by ID that found no cached entity
+
+  policy : Optional[CachePolicy]
+    Eviction policy of the cache, if any
+  """
+
+  def __init__(
+    self,
+    *,
+    indexes : Iterable[str]         = (),
+    policy  : Optional[CachePolicy] = None
+  ) -> None:
+    """
+    Parameters
+    ----------
+    indexes : Optional[Iterable[str]]
+      Names of the attributes to keep a secondary index on
+
+    policy : Optional[CachePolicy]
+      Eviction policy of the cache. Defaults to keeping every entity
+    """
+    self.evictions : int                                  = 0
+    self.hits      : int                                  = 0
+    self.indexes   : Tuple[str, ...]                      = tuple(indexes)
+    self.misses    : int                                  = 0
+    self.policy    : Optional[CachePolicy]                = policy
+    self._items    : OrderedDict[int, Any]                = OrderedDict()
+    self._expiry   : Dict[int, float]                     = {}
+    self._keys     : Dict[int, Tuple[Any, ...]]           = {}
+    self._indexes  : Dict[str, Dict[Any, Dict[int, Any]]] = {
+      name: {}
+      for name in self.indexes
+    }
+
+
+  def __call__(
+    self,
+    **kwargs
+  ) -> Optional[Union[List[Any], Any]]:
+    """
+    Filter the cached entities by attribute values
+
+    Parameters
+    ----------
+    **kwargs
+      Keyword arguments of entity attributes and values used to filter the results
+
+    Returns
+    -------
+    Optional[Union[List[Any], Any]]
+      The matching entity if there is exactly one, a list of them if there are several, otherwise ` None `
+    """
+    if not kwargs: return self
+    if "id" in kwargs:
+      entity     : Any      = self.get(kwargs["id"])
+      candidates : Iterable = (entity,) if entity is not None else ()
+    else:
+      indexed    : Optional[str] = next((name for name in kwargs if name in self._indexes), None)
+      candidates : Iterable      = self._indexes[indexed].get(kwargs[indexed], {}).values() if indexed else self._items.values()
+    matches : List[Any] = [
+      entity
+      for entity in candidates
+      if all(
+        getattr(entity, kwarg, None) == kwargs[kwarg]
+        for kwarg in kwargs
+      )
+    ]
+    return (matches[0] if len(matches) == 1 else matches) if matches else None
+
+
+  def __contains__(
+    self,
+    entity : Union[Any, int]
+  ) -> bool:
+    """
+    Checks whether an entity, or an entity with the given ID, is cached
+
+    Returns
+    -------
+    bool
+    """
+    self._expire()
+    return int(entity) in self._items if isinstance(entity, int) else getattr(entity, "id", None) in self._items
+
+
+  def __getitem__(
+    self,
+    entity_id : int
+  ) -> Any:
+    """
+    Returns the cached entity with the given ID
+
+    Returns
+    -------
+    Any
+    """
+    entity : Any = self.get(entity_id)
+    if entity is None: raise KeyError(entity_id)
+    return entity
+
+
+  def __iter__(
+    self
+  ) -> Iterator[Any]:
+    self._expire()
+    return iter(list(self._items.values()))
+
+
+  def __len__(
+    self
+  ) -> int:
+    self._expire()
+    return len(self._items)
+
+
+  def __repr__(
+    self
+  ) -> str:
+    return f"EntityCache({list(self._items.values())})"
+
+
+  def get(
+    self,
+    entity_id : int,
+    default   : Any = None
+  ) -> Any:
+    """
+    Returns the cached entity with the given ID, if any
+
+    Parameters
+    ----------
+    entity_id : int
+      ID of the entity
+
+    default : Any
+      Value returned if no entity is cached with that ID
+
+    Returns
+    -------
+    Any
+    """
+    self._expire()
+    entity_id : int = int(entity_id)
+    entity    : Any = self._items.get(entity_id)
+    if entity is None:
+      self.misses += 1
+      return default
+    self.hits += 1
+    if self.policy and self.policy.lru:
+      self._items.move_to_end(entity_id)
+      if self.policy.ttl: self._expiry[entity_id] = monotonic() + self.policy.ttl
+      if self.policy.max_total: self.policy._track(self, entity_id)
+    return entity
+
+
+  def add(
+    self,
+    entity : Any
+  ) -> Any:
+    """
+    Caches an entity, replacing any cached entity with the same ID. Adding an entity again also refreshes its secondary indexes, e.g. after it was updated in place
+
+    Parameters
+    ----------
+    entity : Any
+      Entity to cache
+
+    Returns
+    -------
+    Any
+      The cached entity
+    """
+    self.discard(entity.id)
+    self._items[entity.id] = entity
+    if self._indexes:
+      keys : Tuple[Any, ...] = tuple(getattr(entity, name, None) for name in self._indexes)
+      self._keys[entity.id] = keys
+      for key, index in zip(keys, self._indexes.values()):
+        index.setdefault(key, {})[entity.id] = entity
+    if self.policy:
+      if self.policy.ttl: self._expiry[entity.id] = monotonic() + self.policy.ttl
+      self._expire()
+      if self.policy.max_entries:
+        while len(self._items) > self.policy.max_entries:
+          self._evict(next(iter(self._items)))
+      if self.policy.max_total: self.policy._track(self, entity.id)
+    return entity
+
+  append = add
+
+
+  def discard(
+    self,
+    entity : Union[Any, int]
+  ) -> Optional[Any]:
+    """
+    Removes an entity, or the entity with the given ID, if it is cached
+
+    Parameters
+    ----------
+    entity : Union[Any, int]
+      Entity or ID of the entity to remove
+
+    Returns
+    -------
+    Optional[Any]
+      The removed entity, if any
+    """
+    entity_id : int           = entity if isinstance(entity, int) else entity.id
+    removed   : Optional[Any] = self._items.pop(entity_id, None)
+    if removed is None: return None
+    if self.policy and self.policy.max_total: self.policy._forget(self, entity_id)
+    self._expiry.pop(entity_id, None)
+    keys : Tuple[Any, ...] = self._keys.pop(entity_id, ())
+    for key, index in zip(keys, self._indexes.values()):
+      entries : Dict[int, Any] = index.get(key, {})
+      entries.pop(entity_id, None)
+      if not entries: index.pop(key, None)
+    return removed
+
+
+  def remove(
+    self,
+    entity : Union[Any, int]
+  ) -> None:
+    """
+    Removes an entity, or the entity with the given ID
+
+    Parameters
+    ----------
+    entity : Union[Any, int]
+      Entity or ID of the entity to remove
+
+    Raises
+    ------
+    ValueError
+      The entity is not cached
+    """
+    if self.discard(entity) is None: raise ValueError(f"No cached entity with an ID: {int(entity) if isinstance(entity, int) else entity.id}")
+
+
+  def clear(
+    self
+  ) -> None:
+    """
+    Removes every cached entity
+    """
+    if self.policy and self.policy.max_total:
+      for entity_id in self._items: self.policy._forget(self, entity_id)
+    self._items.clear()
+    self._expiry.clear()
+    self._keys.clear()
+    for index in self._indexes.values(): index.clear()
+
+
+  def _evict(
+    self,
+    entity_id : int
+  ) -> None:
+    """
+    Evicts the entity with the given ID
+    """
+    self.discard(entity_id)
+    self.evictions += 1
+
+
+  def _expire(
+    self
+  ) -> None:
+    """
+    Evicts the expired entities at the front of the cache
+    """
+    if not self._expiry: return
+    now : float = monotonic()
+    while self._items:
+      entity_id : int = next(iter(self._items))
+      if self._expiry.get(entity_id, now + 1) > now: return
+      self._evict(entity_id)
+
+
+class MemberCache(EntityCache):
+  """
+  Member cache of a guild. While the guild has as many members as the policy's ` member_threshold ` or more, members are not cached, and members already cached are dropped as they are added again
+  """
+
+  def __init__(
+    self,
+    guild   : Any,
+    *,
+    indexes : Iterable[str]         = (),
+    policy  : Optional[CachePolicy] = None
+  ) -> None:
+    """
+    Parameters
+    ----------
+    guild : Guild
+      Guild the members belong to
+
+    indexes : Optional[Iterable[str]]
+      Names of the attributes to keep a secondary index on
+
+    policy : Optional[CachePolicy]
+      Eviction policy of the cache. Defaults to keeping every member
+    """
+    super().__init__(indexes = indexes, policy = policy)
+    self.guild : Any = guild
+
+
+  @property
+  def admits(
+    self
+  ) -> bool:
+    """
+    Whether the guild is small enough for its members to be cached, judged by its ` member_count ` or, if unknown, by the number of cached members
+
+    Returns
+    -------
+    bool
+    """
+    threshold : Optional[int] = self.policy.member_threshold if self.policy else None
+    if not threshold: return True
+    count     : Optional[int] = (self.guild._data or {}).get("member_count")
+    return (count if count is not None else len(self._items)) < threshold
+
+
+  def add(
+    self,
+    entity : Any
+  ) -> Any:
+    """
+    Caches a member if the guild is below the member threshold, otherwise drops any cached member with the same ID
+
+    Parameters
+    ----------
+    entity : Member
+      Member to cache
+
+    Returns
+    -------
+    Member
+      The given member
+    """
+    if self.admits: return super().add(entity)
+    self.discard(entity.id)
+    return entity
+
+  append = add
\ No newline at end of file
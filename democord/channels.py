@@ -1,9 +1,85 @@
+from .model import (
+                   Model,
+                   lazy_property
+                   )
 from typing import *
 
+if TYPE_CHECKING:
+  from .guild import Guild
+  from .ws    import DiscordWebSocket
 
-class GuildChannel:
+
+class GuildChannel(Model):
   """
   Represents a guild channel. This can be further classified as TextChannel, VoiceChannel, ForumChannel, StageChannel, and Thread, when subclassed.
+
+
+  Attributes
+  ----------
+  guild : Optional[Guild]
+    Guild the channel belongs to
+
+  id : int
+    ID of the channel
   """
 
-  pass
\ No newline at end of file
+  __slots__ : Tuple[str, ...] = (
+    "_overwrites",
+    "guild",
+    "id",
+    "ws"
+  )
+
+  @lazy_property
+  def overwrites(
+    self
+  ) -> Dict[int, Tuple[int, int]]:
+    """
+    Permission overwrites of the channel, as allowed and denied bitfields keyed by role or member ID
+
+
+    Returns
+    -------
+    Dict[int, Tuple[int, int]]
+    """
+
+    return {
+      int(overwrite["id"]): (int(overwrite["allow"]), int(overwrite["deny"]))
+      for overwrite in self._data.get("permission_overwrites", ())
+    }
+
+
+  @classmethod
+  def from_data(
+    cls,
+    ws    : "DiscordWebSocket",
+    data  : Dict[str, Any],
+    guild : Optional["Guild"] = None
+  ) -> Self:
+    """
+    Construct a GuildChannel object from a dictionary payload. The payload is kept as is and read from on access
+
+
+    Parameters
+    ----------
+    ws : DiscordWebSocket
+      Active websocket of the discord gateway connection
+
+    data : Dict[str, Any]
+      Dictionary payload of a channel
+
+    guild : Optional[Guild]
+      Guild the channel belongs to
+
+
+    Returns
+    -------
+    GuildChannel
+    """
+
+    channel       : Self               = cls()
+    channel._data : Dict[str, Any]     = data
+    channel.guild : Optional["Guild"]  = guild
+    channel.id    : int                = int(data["id"])
+    channel.ws    : "DiscordWebSocket" = ws
+    return channel
\ No newline at end of file
@@ -0,0 +1,528 @@
+import multiprocessing
+
+from .errors            import ClusterError
+from .http              import HTTPClient
+from .logger            import Logger
+from .sharding          import (
+                               IdentifyLimiter,
+                               shard_id_for
+                               )
+from asyncio            import (
+                               iscoroutine,
+                               run_coroutine_threadsafe,
+                               wait_for,
+                               wrap_future
+                               )
+from concurrent.futures import Future
+from dotenv             import load_dotenv
+from itertools          import count
+from os                 import (
+                               cpu_count,
+                               getenv
+                               )
+from threading          import (
+                               Event,
+                               Lock,
+                               Thread
+                               )
+from time               import (
+                               monotonic,
+                               sleep
+                               )
+from typing             import *
+
+if TYPE_CHECKING:
+  from .app             import App
+
+
+class ClusterClient:
+  """
+  IPC channel of a cluster worker, used to ask the worker that runs a guild's shard for guild-scoped data
+
+
+  Attributes
+  ----------
+  app : App
+    Application run by this worker
+
+  handlers : Dict[str, Callable]
+    Request handlers of this worker, keyed by name
+
+  shard_count : int
+    Total number of shards of the cluster
+
+  worker_id : int
+    ID of this worker
+  """
+
+  def __init__(
+    self,
+    app          : "App",
+    worker_id    : int,
+    shard_count  : int,
+    shard_ranges : List[List[int]],
+    inboxes      : List[multiprocessing.Queue],
+    supervisor   : Optional[multiprocessing.Queue] = None
+  ) -> None:
+    self.app         : "App"                                        = app
+    self.handlers    : Dict[str, Callable]                          = {}
+    self.shard_count : int                                          = shard_count
+    self.worker_id   : int                                          = worker_id
+    self._grants     : Dict[int, Tuple[Event, List[Optional[int]]]] = {}
+    self._inboxes    : List[multiprocessing.Queue]                  = inboxes
+    self._supervisor : Optional[multiprocessing.Queue]              = supervisor
+    self._lock       : Lock                                         = Lock()
+    self._nonces     : Iterator[int]                                = count()
+    self._pending    : Dict[int, Future]                            = {}
+    self._workers    : Dict[int, int]                               = {
+      shard_id: worker
+      for worker, shard_ids in enumerate(shard_ranges)
+      for shard_id in shard_ids
+    }
+
+
+  def handle(
+    self,
+    name : Optional[str] = None
+  ) -> Callable:
+    """
+    Registers a function or coroutine as a request handler. Its arguments and return value must be picklable
+
+    Parameters
+    ----------
+    name : Optional[str]
+      Name the handler is requested by. Defaults to the function's name
+    """
+    def wrapper(function : Callable) -> Callable:
+      self.handlers[name or function.__name__] = function
+      return function
+    return wrapper
+
+
+  def worker_for(
+    self,
+    guild_id : int
+  ) -> int:
+    """
+    Returns the ID of the worker that runs a guild's shard
+
+    Parameters
+    ----------
+    guild_id : int
+      ID of the guild
+
+    Returns
+    -------
+    int
+    """
+    return self._workers[shard_id_for(guild_id, self.shard_count)]
+
+
+  async def request(
+    self,
+    guild_id : int,
+    name     : str,
+    *args    : Any,
+    timeout  : Optional[float] = 10.0
+  ) -> Any:
+    """
+    Calls a handler on the worker that runs a guild's shard and returns its result
+
+    Parameters
+    ----------
+    guild_id : int
+      ID of the guild the request is about
+
+    name : str
+      Name of the handler to call
+
+    *args : Any
+      Arguments passed to the handler after the guild ID
+
+    timeout : Optional[float]
+      Seconds to wait for the response. Defaults to ` 10.0 `
+
+    Returns
+    -------
+    Any
+    """
+    future : Future = Future()
+    with self._lock:
+      nonce : int = next(self._nonces)
+      self._pending[nonce] = future
+    self._inboxes[self.worker_for(guild_id)].put(("request", self.worker_id, nonce, name, (guild_id, *args)))
+    try:
+      return await wait_for(wrap_future(future), timeout)
+    finally:
+      self._pending.pop(nonce, None)
+
+
+  def identify(
+    self,
+    shard_id : int
+  ) -> Optional[int]:
+    """
+    Blocks until the cluster's supervisor lets a shard identify, so identifies are spaced and counted once across every worker
+
+    Parameters
+    ----------
+    shard_id : int
+      ID of the shard about to identify
+
+    Returns
+    -------
+    Optional[int]
+      Number of session starts left in the budget, if it is known
+    """
+    grant : Tuple[Event, List[Optional[int]]] = (Event(), [None])
+    with self._lock: self._grants[shard_id] = grant
+    self._supervisor.put(("identify", self.worker_id, shard_id))
+    grant[0].wait()
+    with self._lock: self._grants.pop(shard_id, None)
+    return grant[1][0]
+
+
+  def start(
+    self
+  ) -> None:
+    """
+    Starts listening for requests and responses from the other workers
+    """
+    Thread(
+      target = self._listen,
+      name   = "democord-cluster",
+      daemon = True
+    ).start()
+
+
+  def _listen(
+    self
+  ) -> None:
+    """
+    Answers requests and resolves responses arriving in this worker's inbox
+    """
+    inbox : multiprocessing.Queue = self._inboxes[self.worker_id]
+    while True:
+      message : Tuple = inbox.get()
+      match message:
+        case ("request", sender, nonce, name, args):
+          handler : Optional[Callable] = self.handlers.get(name)
+          if not handler:
+            self._respond(sender, nonce, error = f"Worker {self.worker_id} has no handler named: {name}")
+            continue
+          try:
+            result : Any = handler(*args)
+          except Exception as error:
+            self._respond(sender, nonce, error = repr(error))
+            continue
+          if iscoroutine(result):
+            run_coroutine_threadsafe(result, self.app.dispatcher.loop).add_done_callback(
+              lambda future, sender = sender, nonce = nonce: self._respond(
+                sender,
+                nonce,
+                result = None if future.exception() else future.result(),
+                error  = repr(future.exception()) if future.exception() else None
+              )
+            )
+          else:
+            self._respond(sender, nonce, result = result)
+        case ("identify", shard_id, remaining):
+          grant : Optional[Tuple[Event, List[Optional[int]]]] = self._grants.get(shard_id)
+          if not grant: continue
+          grant[1][0] = remaining
+          grant[0].set()
+        case ("stop",):
+          return
+        case ("response", nonce, result, error):
+          future : Optional[Future] = self._pending.get(nonce)
+          if not future or future.done(): continue
+          if error: future.set_exception(ClusterError(error))
+          else:     future.set_result(result)
+
+
+  def _respond(
+    self,
+    sender : int,
+    nonce  : int,
+    *,
+    result : Any           = None,
+    error  : Optional[str] = None
+  ) -> None:
+    """
+    Sends the response of a request back to the worker that asked
+    """
+    self._inboxes[sender].put(("response", nonce, result, error))
+
+
+class ClusterIdentifyLimiter:
+  """
+  Identify limiter of a cluster worker, which asks the supervisor's limiter for every identify instead of keeping its own
+
+
+  Attributes
+  ----------
+  remaining : Optional[int]
+    Number of session starts left in the cluster's budget, as of the last identify
+  """
+
+  def __init__(
+    self,
+    client    : ClusterClient,
+    remaining : Optional[int] = None
+  ) -> None:
+    self.remaining : Optional[int] = remaining
+    self._client   : ClusterClient = client
+
+
+  def acquire(
+    self,
+    shard_id : int
+  ) -> None:
+    """
+    Blocks until the supervisor lets the shard identify
+
+    Parameters
+    ----------
+    shard_id : int
+      ID of the shard about to identify
+    """
+    self.remaining : Optional[int] = self._client.identify(shard_id)
+
+
+def _run_worker(
+  factory      : Callable[..., "App"],
+  worker_id    : int,
+  shard_count  : int,
+  shard_ranges : List[List[int]],
+  inboxes      : List[multiprocessing.Queue],
+  supervisor   : multiprocessing.Queue
+) -> None:
+  """
+  Entry point of a worker process
+  """
+  app : "App" = factory(
+    shard_ids   = shard_ranges[worker_id],
+    shard_count = shard_count
+  )
+  app.cluster          : ClusterClient          = ClusterClient(app, worker_id, shard_count, shard_ranges, inboxes, supervisor)
+  app.identify_limiter : ClusterIdentifyLimiter = ClusterIdentifyLimiter(app.cluster, app.identify_limiter.remaining)
+  app.cluster.start()
+  app.run()
+
+
+class Cluster:
+  """
+  Runs the shards of an application across several worker processes, restarting any worker that exits
+
+  The supervisor keeps the only identify limiter of the cluster, and workers ask it for every identify, so the ` max_concurrency ` buckets and the session start budget hold across processes
+
+
+  Attributes
+  ----------
+  identify_limiter : IdentifyLimiter
+    Identify limiter shared by every worker
+
+  max_restart_delay : float
+    Upper bound of the delay before restarting a worker
+
+  processes : int
+    Number of worker processes
+
+  restart_delay : float
+    Seconds to wait before restarting a worker that exited. The delay doubles every time the worker exits again within ` max_restart_delay ` seconds of its restart
+
+  shard_count : int
+    Total number of shards of the cluster
+
+  shard_ranges : List[List[int]]
+    Contiguous ranges of shard IDs run by each worker
+  """
+
+  def __init__(
+    self,
+    factory           : Callable[..., "App"],
+    *,
+    shard_count       : Optional[int]             = None,
+    processes         : Optional[int]             = None,
+    restart_delay     : float                     = 5.0,
+    max_restart_delay : float                     = 300.0,
+    identify_limiter  : Optional[IdentifyLimiter] = None,
+    logger            : bool                      = False
+  ) -> None:
+    """
+    Parameters
+    ----------
+    factory : Callable[..., App]
+      Top-level function building the App of a worker. Called with the ` shard_ids ` and ` shard_count ` keyword arguments, which must be passed on to App
+
+    shard_count : Optional[int]
+      Total number of shards. Defaults to the number recommended by ` /gateway/bot `
+
+    processes : Optional[int]
+      Number of worker processes. Defaults to the number of CPU cores, capped at the shard count
+
+    restart_delay : Optional[float]
+      Seconds to wait before restarting a worker that exited. Defaults to ` 5.0 `
+
+    max_restart_delay : Optional[float]
+      Upper bound of the delay before restarting a worker that keeps exiting. Defaults to ` 300.0 `
+
+    identify_limiter : Optional[IdentifyLimiter]
+      Identify limiter shared by every worker. Defaults to one built from ` /gateway/bot `
+
+    logger : Optional[bool]
+      Whether to log worker restarts. Defaults to False
+    """
+    if not shard_count or not identify_limiter:
+      load_dotenv()
+      token : Optional[str] = getenv("TOKEN")
+      if not token:
+        raise Exception("No TOKEN environment variable was found.")
+      http    : HTTPClient     = HTTPClient(token)
+      gateway : Dict[str, Any] = http.request("GET", "/gateway/bot")
+      http.close()
+      shard_count      : int             = shard_count or gateway["shards"]
+      identify_limiter : IdentifyLimiter = identify_limiter or IdentifyLimiter.from_gateway(gateway["session_start_limit"])
+    self.factory           : Callable[..., "App"]          = factory
+    self.identify_limiter  : IdentifyLimiter               = identify_limiter
+    self.logger            : Optional[Logger]              = Logger() if logger else None
+    self.max_restart_delay : float                         = max_restart_delay
+    self.processes         : int                           = max(1, min(processes or cpu_count() or 1, shard_count))
+    self.restart_delay     : float                         = restart_delay
+    self.shard_count       : int                           = shard_count
+    self.shard_ranges      : List[List[int]]               = [
+      list(range(worker * shard_count // self.processes, (worker + 1) * shard_count // self.processes))
+      for worker in range(self.processes)
+    ]
+    self._context          : Any                           = multiprocessing.get_context("spawn")
+    self._inboxes          : List[multiprocessing.Queue]   = [self._context.Queue() for _ in range(self.processes)]
+    self._supervisor       : multiprocessing.Queue         = self._context.Queue()
+    self._crashes          : List[int]                     = [0] * self.processes
+    self._restarts         : Dict[int, float]              = {}
+    self._started          : List[float]                   = [0.0] * self.processes
+    self._workers          : List[multiprocessing.Process] = []
+
+
+  def _spawn(
+    self,
+    worker_id : int
+  ) -> multiprocessing.Process:
+    """
+    Starts the process of a worker
+    """
+    process : multiprocessing.Process = self._context.Process(
+      target = _run_worker,
+      args   = (self.factory, worker_id, self.shard_count, self.shard_ranges, self._inboxes, self._supervisor),
+      name   = f"democord-worker-{worker_id}",
+      daemon = False
+    )
+    process.start()
+    self._started[worker_id] = monotonic()
+    return process
+
+
+  def restart_delay_for(
+    self,
+    worker_id : int
+  ) -> float:
+    """
+    Returns the delay before restarting a worker that just exited, doubling it for every exit that followed its restart within ` max_restart_delay ` seconds
+
+    Parameters
+    ----------
+    worker_id : int
+      ID of the worker
+
+    Returns
+    -------
+    float
+    """
+    if monotonic() - self._started[worker_id] >= self.max_restart_delay: self._crashes[worker_id] = 0
+    delay : float = min(self.max_restart_delay, self.restart_delay * 2 ** self._crashes[worker_id])
+    self._crashes[worker_id] += 1
+    return delay
+
+
+  def supervise(
+    self
+  ) -> None:
+    """
+    Checks every worker once: schedules a restart for the ones that exited, and restarts the ones whose delay is over. Never waits
+    """
+    now : float = monotonic()
+    for worker_id, process in enumerate(self._workers):
+      if process.is_alive(): continue
+      restart_at : Optional[float] = self._restarts.get(worker_id)
+      if restart_at is None:
+        delay : float = self.restart_delay_for(worker_id)
+        self._restarts[worker_id] = now + delay
+        if self.logger: self.logger.warn(f"Worker {worker_id} ( shards {self.shard_ranges[worker_id]} ) exited with code {process.exitcode}, restarting in {delay}s")
+      elif restart_at <= now:
+        del self._restarts[worker_id]
+        self._workers[worker_id] = self._spawn(worker_id)
+
+
+  def _serve_identifies(
+    self
+  ) -> None:
+    """
+    Answers the identify requests of the workers, each on its own thread so the limiter's buckets are waited on independently
+    """
+    while True:
+      message : Tuple = self._supervisor.get()
+      match message:
+        case ("identify", worker_id, shard_id):
+          Thread(
+            target = self._grant,
+            args   = (worker_id, shard_id),
+            name   = f"democord-identify-{shard_id}",
+            daemon = True
+          ).start()
+        case ("stop",):
+          return
+
+
+  def _grant(
+    self,
+    worker_id : int,
+    shard_id  : int
+  ) -> None:
+    """
+    Waits for the shard's identify bucket and budget, then lets the worker identify
+    """
+    self.identify_limiter.acquire(shard_id)
+    self._inboxes[worker_id].put(("identify", shard_id, self.identify_limiter.remaining))
+
+
+  def run(
+    self
+  ) -> None:
+    """
+    Starts every worker and restarts the ones that exit, until interrupted
+    """
+    Thread(
+      target = self._serve_identifies,
+      name   = "democord-identify",
+      daemon = True
+    ).start()
+    self._workers : List[multiprocessing.Process] = [self._spawn(worker_id) for worker_id in range(self.processes)]
+    try:
+      while True:
+        sleep(1)
+        self.supervise()
+    except KeyboardInterrupt:
+      pass
+    finally:
+      self.close()
+
+
+  def close(
+    self
+  ) -> None:
+    """
+    Stops every worker
+    """
+    self._supervisor.put(("stop",))
+    for process in self._workers:
+      if process.is_alive(): process.terminate()
+    for process in self._workers: process.join()
\ No newline at end of file
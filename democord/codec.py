@@ -0,0 +1,331 @@
+import json
+import re
+
+from enum   import Enum
+from struct import (
+                   pack,
+                   unpack_from
+                   )
+from typing import *
+from zlib   import decompress
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+try:
+  import msgspec
+except ImportError:
+  msgspec = None
+
+
+class JSONCodec:
+  """
+  Encodes and decodes JSON payloads for the gateway and the REST API. Uses ` orjson ` or ` msgspec ` when installed, and falls back to the standard library otherwise
+
+
+  Attributes
+  ----------
+  backend : str
+    Name of the library in use, either ` orjson `, ` msgspec ` or ` json `
+
+  binary : bool
+    Whether payloads are sent as binary frames
+
+  decode : Callable[[Union[bytes, str]], Any]
+    Decodes a received payload
+
+  encode : Callable[[Any], Union[bytes, str]]
+    Encodes a payload to send
+
+  encoding : str
+    Name of the encoding, as passed to the gateway URL
+  """
+
+  binary       : bool       = False
+  encoding     : str        = "json"
+  header       : re.Pattern = re.compile(r'\{"t":"([A-Z_]+)","s":(\d+),"op":0,')
+  header_bytes : re.Pattern = re.compile(rb'\{"t":"([A-Z_]+)","s":(\d+),"op":0,')
+
+  def __init__(
+    self,
+    backend : Optional[str] = None
+  ) -> None:
+    """
+    Parameters
+    ----------
+    backend : Optional[str]
+      Name of the library to use. Defaults to the fastest one installed
+    """
+    if not backend: backend = "orjson" if orjson else "msgspec" if msgspec else "json"
+    match backend:
+      case "orjson":
+        if not orjson: raise ImportError("orjson is not installed")
+        self.decode : Callable[[Union[bytes, str]], Any] = orjson.loads
+        self.encode : Callable[[Any], Union[bytes, str]] = orjson.dumps
+      case "msgspec":
+        if not msgspec: raise ImportError("msgspec is not installed")
+        self.decode : Callable[[Union[bytes, str]], Any] = msgspec.json.Decoder().decode
+        self.encode : Callable[[Any], Union[bytes, str]] = msgspec.json.Encoder().encode
+      case "json":
+        self.decode : Callable[[Union[bytes, str]], Any] = json.loads
+        self.encode : Callable[[Any], Union[bytes, str]] = json.dumps
+      case _:
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    self.backend : str = backend
+
+
+  def peek(
+    self,
+    data : Union[bytes, str]
+  ) -> Optional[Tuple[str, int]]:
+    """
+    Reads the event name and sequence number of a Dispatch payload without decoding it, from the ` t `, ` s ` and ` op ` fields the gateway sends first
+
+    Parameters
+    ----------
+    data : Union[bytes, str]
+      JSON encoded payload
+
+    Returns
+    -------
+    Optional[Tuple[str, int]]
+      The event name and sequence number, or ` None ` if the payload is not a Dispatch or does not start with them
+    """
+    if isinstance(data, str):
+      match : Optional[re.Match] = self.header.match(data)
+      return (match[1], int(match[2])) if match else None
+    match : Optional[re.Match] = self.header_bytes.match(data)
+    return (match[1].decode(), int(match[2])) if match else None
+
+class ETFCodec:
+  """
+  Encodes and decodes Erlang Term Format payloads for the gateway. Terms are mapped to the same values the JSON codec produces: atoms become strings ( ` nil `, ` true ` and ` false ` become ` None `, ` True ` and ` False ` ), binaries become strings, maps become dictionaries, and snowflakes arrive as integers
+
+
+  Attributes
+  ----------
+  binary : bool
+    Whether payloads are sent as binary frames
+
+  encoding : str
+    Name of the encoding, as passed to the gateway URL
+  """
+
+  binary   : bool = True
+  encoding : str  = "etf"
+  version  : int  = 131
+
+  atoms    : Dict[str, Any] = {
+    "nil"   : None,
+    "true"  : True,
+    "false" : False
+  }
+
+  def peek(
+    self,
+    data : bytes
+  ) -> None:
+    """
+    Map keys of ETF payloads come in no set order, so the header of a payload cannot be read without decoding it
+    """
+    return None
+
+
+  def decode(
+    self,
+    data : bytes
+  ) -> Any:
+    """
+    Decodes a received payload
+
+    Parameters
+    ----------
+    data : bytes
+      ETF encoded payload
+
+    Returns
+    -------
+    Any
+    """
+    if data[0] != self.version: raise ValueError(f"Unsupported ETF version: {data[0]}")
+    value, _ = self._decode(memoryview(data), 1)
+    return value
+
+
+  def _decode(
+    self,
+    data   : memoryview,
+    offset : int
+  ) -> Tuple[Any, int]:
+    """
+    Decodes the term starting at the given offset
+
+    Parameters
+    ----------
+    data : memoryview
+      ETF encoded payload
+
+    offset : int
+      Offset of the term's tag
+
+    Returns
+    -------
+    Tuple[Any, int]
+      The decoded term and the offset following it
+    """
+    tag    : int = data[offset]
+    offset += 1
+    match tag:
+      case 97:
+        return data[offset], offset + 1
+      case 98:
+        return unpack_from(">i", data, offset)[0], offset + 4
+      case 110 | 111:
+        if tag == 110:
+          length : int = data[offset]
+          offset += 1
+        else:
+          length : int = unpack_from(">I", data, offset)[0]
+          offset += 4
+        sign  : int = data[offset]
+        value : int = int.from_bytes(data[offset + 1 : offset + 1 + length], "little")
+        return -value if sign else value, offset + 1 + length
+      case 70:
+        return unpack_from(">d", data, offset)[0], offset + 8
+      case 99:
+        return float(bytes(data[offset : offset + 31]).rstrip(b"\x00")), offset + 31
+      case 109:
+        length : int = unpack_from(">I", data, offset)[0]
+        offset += 4
+        return str(data[offset : offset + length], "utf-8"), offset + length
+      case 100 | 118 | 115 | 119:
+        if tag in (100, 118):
+          length : int = unpack_from(">H", data, offset)[0]
+          offset += 2
+        else:
+          length : int = data[offset]
+          offset += 1
+        atom : str = str(data[offset : offset + length], "utf-8")
+        return self.atoms.get(atom, atom), offset + length
+      case 116:
+        arity  : int            = unpack_from(">I", data, offset)[0]
+        offset += 4
+        value  : Dict[Any, Any] = {}
+        for _ in range(arity):
+          key, offset        = self._decode(data, offset)
+          value[key], offset = self._decode(data, offset)
+        return value, offset
+      case 108:
+        length : int       = unpack_from(">I", data, offset)[0]
+        offset += 4
+        value  : List[Any] = []
+        for _ in range(length):
+          item, offset = self._decode(data, offset)
+          value.append(item)
+        tail, offset = self._decode(data, offset)
+        if tail != []: value.append(tail)
+        return value, offset
+      case 106:
+        return [], offset
+      case 107:
+        length : int = unpack_from(">H", data, offset)[0]
+        offset += 2
+        return str(data[offset : offset + length], "latin-1"), offset + length
+      case 104 | 105:
+        if tag == 104:
+          arity : int = data[offset]
+          offset += 1
+        else:
+          arity : int = unpack_from(">I", data, offset)[0]
+          offset += 4
+        value : List[Any] = []
+        for _ in range(arity):
+          item, offset = self._decode(data, offset)
+          value.append(item)
+        return tuple(value), offset
+      case 80:
+        size     : int   = unpack_from(">I", data, offset)[0]
+        inflated : bytes = decompress(data[offset + 4 :])
+        if len(inflated) != size: raise ValueError("Corrupted compressed ETF term")
+        value, _ = self._decode(memoryview(inflated), 0)
+        return value, len(data)
+      case _:
+        raise ValueError(f"Unsupported ETF tag: {tag}")
+
+
+  def encode(
+    self,
+    value : Any
+  ) -> bytes:
+    """
+    Encodes a payload to send
+
+    Parameters
+    ----------
+    value : Any
+      Payload to encode
+
+    Returns
+    -------
+    bytes
+    """
+    buffer : bytearray = bytearray((self.version,))
+    self._encode(value, buffer)
+    return bytes(buffer)
+
+
+  def _encode(
+    self,
+    value  : Any,
+    buffer : bytearray
+  ) -> None:
+    """
+    Appends the encoded term to the buffer
+
+    Parameters
+    ----------
+    value : Any
+      Term to encode
+
+    buffer : bytearray
+      Buffer the term is written to
+    """
+    match value:
+      case None:
+        buffer += b"\x77\x03nil"
+      case True:
+        buffer += b"\x77\x04true"
+      case False:
+        buffer += b"\x77\x05false"
+      case int() if 0 <= value <= 255:
+        buffer += pack(">BB", 97, value)
+      case int() if -2 ** 31 <= value < 2 ** 31:
+        buffer += pack(">Bi", 98, value)
+      case int():
+        magnitude : bytes = abs(value).to_bytes((abs(value).bit_length() + 7) // 8, "little")
+        buffer += pack(">BBB", 110, len(magnitude), value < 0) + magnitude
+      case float():
+        buffer += pack(">Bd", 70, value)
+      case str():
+        encoded : bytes = value.encode("utf-8")
+        buffer += pack(">BI", 109, len(encoded)) + encoded
+      case bytes():
+        buffer += pack(">BI", 109, len(value)) + value
+      case dict():
+        buffer += pack(">BI", 116, len(value))
+        for key, item in value.items():
+          self._encode(key, buffer)
+          self._encode(item, buffer)
+      case list() | tuple():
+        if not value:
+          buffer.append(106)
+          return
+        buffer += pack(">BI", 108, len(value))
+        for item in value: self._encode(item, buffer)
+        buffer.append(106)
+      case Enum():
+        self._encode(value.value, buffer)
+      case _:
+        raise TypeError(f"Cannot encode {type(value).__name__} to ETF")
@@ -0,0 +1,67 @@
+from typing import *
+from zlib   import decompressobj
+
+
+class ZlibStream:
+  """
+  Decompressor of a ` zlib-stream ` compressed gateway connection. A single zlib context is shared by every message of the connection, and a payload may be split across several messages, so data is buffered until the Z_SYNC_FLUSH suffix arrives
+
+
+  Attributes
+  ----------
+  compressed_bytes : int
+    Number of bytes received on the wire
+
+  decompressed_bytes : int
+    Number of bytes the received data decompressed to
+  """
+
+  suffix : bytes = b"\x00\x00\xff\xff"
+
+  def __init__(
+    self
+  ) -> None:
+    self.compressed_bytes   : int       = 0
+    self.decompressed_bytes : int       = 0
+    self._buffer            : bytearray = bytearray()
+    self._decompressor      : Any       = decompressobj()
+
+
+  @property
+  def ratio(
+    self
+  ) -> float:
+    """
+    Ratio of decompressed bytes to bytes received on the wire
+
+    Returns
+    -------
+    float
+    """
+    return self.decompressed_bytes / self.compressed_bytes if self.compressed_bytes else 0.0
+
+
+  def feed(
+    self,
+    data : bytes
+  ) -> Optional[bytes]:
+    """
+    Feeds a message received from the connection
+
+    Parameters
+    ----------
+    data : bytes
+      Compressed message data
+
+    Returns
+    -------
+    Optional[bytes]
+      The decompressed payload once it is complete, otherwise ` None `
+    """
+    self.compressed_bytes += len(data)
+    self._buffer.extend(data)
+    if len(self._buffer) < 4 or self._buffer[-4:] != self.suffix: return None
+    payload : bytes = self._decompressor.decompress(self._buffer)
+    self._buffer.clear()
+    self.decompressed_bytes += len(payload)
+    return payload
\ No newline at end of file
@@ -0,0 +1,123 @@
+from asyncio   import (
+                      AbstractEventLoop,
+                      Queue,
+                      Task,
+                      gather,
+                      new_event_loop,
+                      set_event_loop
+                      )
+from threading import (
+                      Event,
+                      Thread
+                      )
+from time      import monotonic
+from typing    import *
+
+
+class Dispatcher(Thread):
+  """
+  Long-lived event loop that runs the application's event listeners. Gateway events are handed over a queue and their listener coroutines are scheduled as tasks on the same loop, so they share state, connections and caches across events
+
+
+  Attributes
+  ----------
+  latency : Optional[float]
+    Seconds the last event waited in the queue before its listeners were scheduled
+
+  loop : AbstractEventLoop
+    The event loop listeners run on
+  """
+
+  def __init__(
+    self
+  ) -> None:
+    super().__init__(
+      name   = "democord-dispatcher",
+      daemon = True
+    )
+    self.latency : Optional[float]   = None
+    self.loop    : AbstractEventLoop = new_event_loop()
+    self._queue  : Queue             = None
+    self._ready  : Event             = Event()
+    self._tasks  : Set[Task]         = set()
+
+
+  @property
+  def queue_depth(
+    self
+  ) -> int:
+    """
+    Number of events waiting to be scheduled
+
+    Returns
+    -------
+    int
+    """
+    return self._queue.qsize() if self._queue else 0
+
+
+  def run(
+    self
+  ) -> None:
+    """
+    Runs the event loop until the dispatcher is stopped
+    """
+    set_event_loop(self.loop)
+    self.loop.run_until_complete(self._consume())
+    for task in self._tasks: task.cancel()
+    self.loop.run_until_complete(gather(*self._tasks, return_exceptions = True))
+    self.loop.close()
+
+
+  async def _consume(
+    self
+  ) -> None:
+    """
+    Schedules every queued coroutine as a task, in the order they were submitted
+    """
+    self._queue : Queue = Queue()
+    self._ready.set()
+    while True:
+      coroutine, queued_at = await self._queue.get()
+      if coroutine is None: break
+      self.latency : float = monotonic() - queued_at
+      task : Task = self.loop.create_task(coroutine)
+      self._tasks.add(task)
+      task.add_done_callback(self._tasks.discard)
+
+
+  def start(
+    self
+  ) -> None:
+    """
+    Starts the event loop and waits until it accepts events
+    """
+    super().start()
+    self._ready.wait()
+
+
+  def submit(
+    self,
+    coroutine : Coroutine
+  ) -> None:
+    """
+    Queues a coroutine to be run on the event loop. Safe to call from any thread
+
+    Parameters
+    ----------
+    coroutine : Coroutine
+      The coroutine to run
+    """
+    self.loop.call_soon_threadsafe(
+      self._queue.put_nowait,
+      (coroutine, monotonic())
+    )
+
+
+  def stop(
+    self
+  ) -> None:
+    """
+    Stops accepting events once the queued ones are scheduled
+    """
+    if self.is_alive(): self.submit(None)
\ No newline at end of file
@@ -4,6 +4,47 @@ from typing import *
 
 class APILimit(Exception): ...
 
+class ClusterError(Exception): ...
+
+class HTTPException(Exception):
+  def __init__(
+    self,
+    code    : int,
+    message : str
+  ) -> None:
+    self.code    : int = code
+    self.message : str = message
+
+  def __str__(self) -> str:
+    return f"{self.code}: {self.message}"
+
+  @classmethod
+  def from_data(
+    cls,
+    data : Optional[Dict[str, Any]]
+  ) -> Self:
+    return cls((data or {}).get("code", 0), (data or {}).get("message", "Unexpected response"))
+
+class RateLimited(HTTPException):
+  def __init__(
+    self,
+    code        : int,
+    message     : str,
+    retry_after : float
+  ) -> None:
+    super().__init__(code, message)
+    self.retry_after : float = retry_after
+
+  def __str__(self) -> str:
+    return f"{self.code}: {self.message} ( retry after {self.retry_after}s )"
+
+  @classmethod
+  def from_data(
+    cls,
+    data : Optional[Dict[str, Any]]
+  ) -> Self:
+    return cls((data or {}).get("code", 0), (data or {}).get("message", "You are being rate limited."), float((data or {}).get("retry_after", 0.0)))
+
 class BotMissingPermissions(Exception):
   def __init__(
     self,
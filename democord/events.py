@@ -1,80 +1,433 @@
+from .channels import GuildChannel
 from .enums    import GatewayEvents
 from .guild    import Guild
+from .member   import Member
+from .role     import Role
+from .user     import User
 from asyncio   import (
-                      create_task,
+                      Future,
+                      TimerHandle,
                       gather,
-                      run as async_run
+                      get_running_loop,
+                      iscoroutinefunction,
+                      run_coroutine_threadsafe,
+                      wrap_future
                       )
-from threading import Thread
+from threading import Lock
 from traceback import TracebackException
 from typing    import *
 
 if TYPE_CHECKING:
-  from .app import App
+  from .app      import App
+  from .payloads import Payload
+  from .ws       import DiscordWebSocket
 
 
 class AppEvents:
   """
-  Events handler for the application
+  Events handler for the application. Listeners are kept in a dictionary from Dispatch event name to a tuple of callbacks, so dispatching an event costs one lookup whatever the number of listeners and event types
+
+  Listener names are either an alias ( ` on_ready `, ` on_guild_available ` ), ` on_ ` followed by the event name in lowercase ( e.g. ` on_message_create ` for ` MESSAGE_CREATE ` ), the event name itself or a ` GatewayEvents ` member
+
+
+  Attributes
+  ----------
+  aliases : Dict[str, str]
+    Event names of the listener names that do not follow the ` on_<event name> ` pattern
+
+  listeners : Dict[str, Tuple[Callable[..., Coroutine], ...]]
+    Listener callbacks, keyed by event name
+
+  parsers : Dict[str, Callable[[DiscordWebSocket, Any], Tuple[Any, ...]]]
+    Functions turning the ` d ` field of an event into its listeners' arguments, keyed by event name. Every ` GatewayEvents ` member has one: events whose payload has no model in this library ( e.g. ` MESSAGE_CREATE ` ) are registered with ` _parse_raw ` and pass the raw ` d ` field, as do event names missing from ` GatewayEvents `
+
+  waiters : Dict[str, Dict[Optional[int], Dict[Future, Tuple[Optional[Callable[..., bool]], Optional[TimerHandle]]]]]
+    Pending ` wait_for ` calls, keyed by event name then guild ID ( ` None ` for any guild ), each mapping its future to its check and timeout handle
   """
 
+  aliases : Dict[str, str]                                                  = {
+    "on_ready"           : GatewayEvents.Ready.value,
+    "on_guild_available" : GatewayEvents.GuildCreate.value
+  }
+  parsers : Dict[str, Callable[["DiscordWebSocket", Any], Tuple[Any, ...]]] = {}
+
   def __init__(
     self,
     app : "App"
   ) -> None:
-    self.app                : App             = app
-    self.ready              : List[Coroutine] = [self.app.on_ready]
-    self.on_guild_available : List[Coroutine] = [self.app.on_guild_available]
+    self.app       : "App"                                                  = app
+    self.listeners : Dict[str, Tuple[Callable[..., Coroutine], ...]]        = {}
+    self.waiters   : Dict[str, Dict[Optional[int], Dict[Future, Tuple]]]    = {}
+    self._lock     : Lock                                                   = Lock()
+    self.add("on_ready", self.app.on_ready)
+    self.add("on_guild_available", self.app.on_guild_available)
+
+
+  @classmethod
+  def parser(
+    cls,
+    *events : GatewayEvents
+  ) -> Callable:
+    """
+    Registers a function as the parser of events. The function takes the receiving connection and the ` d ` field of the event, and returns the arguments of the event's listeners
+
+    Parameters
+    ----------
+    *events : GatewayEvents
+      Events the function parses
+    """
+    def wrapper(function : Callable[["DiscordWebSocket", Any], Tuple[Any, ...]]) -> Callable:
+      for event in events: cls.parsers[event.value] = function
+      return function
+    return wrapper
+
+
+  @classmethod
+  def resolve(
+    cls,
+    name : Union[GatewayEvents, str]
+  ) -> str:
+    """
+    Returns the event name a listener name refers to
+
+    Parameters
+    ----------
+    name : Union[GatewayEvents, str]
+      Listener name, event name or event
+
+    Returns
+    -------
+    str
+    """
+    if isinstance(name, GatewayEvents): return name.value
+    if name in cls.aliases: return cls.aliases[name]
+    return (name[3:] if name.startswith("on_") else name).upper()
 
 
   def add(
     self,
-    name     : str,
-    callback : Coroutine
+    name     : Union[GatewayEvents, str],
+    callback : Callable[..., Coroutine]
   ) -> None:
     """
-    Append the coroutine as an event listener for the application. This is usually called from the @App.listener() decorator
+    Append the coroutine as an event listener for the application. This is usually called from the @App.listen() decorator
 
 
     Parameters
     ----------
-    callback : Coroutine
+    name : Union[GatewayEvents, str]
+      Listener name, event name or event to listen to
+
+    callback : Callable[..., Coroutine]
       Function callback coroutine of the event listener
+
+
+    Raises
+    ------
+    TypeError
+      The callback is not a coroutine function
+    """
+    if not iscoroutinefunction(callback): raise TypeError(f"{getattr(callback, "__name__", callback)}: must be a coroutine function")
+    event : str = self.resolve(name)
+    with self._lock:
+      self.listeners[event] = (*self.listeners.get(event, ()), callback)
+
+
+  def remove(
+    self,
+    name     : Union[GatewayEvents, str],
+    callback : Callable[..., Coroutine]
+  ) -> None:
     """
-    match name:
-      case "on_ready":           self.ready.append(callback)
-      case "on_guild_available": self.on_guild_available.append(callback)
+    Removes an event listener, if it is registered
+
+
+    Parameters
+    ----------
+    name : Union[GatewayEvents, str]
+      Listener name, event name or event the callback listens to
+
+    callback : Callable[..., Coroutine]
+      Function callback coroutine of the event listener
+    """
+    event : str = self.resolve(name)
+    with self._lock:
+      listeners : Tuple[Callable[..., Coroutine], ...] = tuple(listener for listener in self.listeners.get(event, ()) if listener != callback)
+      if listeners: self.listeners[event] = listeners
+      else:         self.listeners.pop(event, None)
+
+
+  def emit(
+    self,
+    ws      : "DiscordWebSocket",
+    payload : "Payload",
+    *args   : Any
+  ) -> None:
+    """
+    Schedules the listeners of a Dispatch event on the dispatcher. Called from the gateway thread, and does nothing if the event has no listener
+
+
+    Parameters
+    ----------
+    ws : DiscordWebSocket
+      Connection that received the event
+
+    payload : Payload
+      Received Dispatch payload
+
+    *args : Any
+      Arguments of the listeners. Defaults to the output of the event's parser
+    """
+    event    : str           = payload.t._value_ if isinstance(payload.t, GatewayEvents) else payload.t
+    if event not in self.listeners and event not in self.waiters: return
+    if not args: args = self.parsers.get(event, _parse_raw)(ws, payload.d)
+    guild_id : Optional[int] = _guild_id(event, payload.d)
+    self.app.dispatcher.submit(self.call(event, *args, guild_id = guild_id))
+
 
   async def call(
     self,
-    event : GatewayEvents,
-    *,
-    guild : Optional[Guild] = None
+    event    : Union[GatewayEvents, str],
+    *args    : Any,
+    guild_id : Optional[int] = None
   ) -> None:
     """
-    Concurrently call all the event's listener callbacks
+    Resolves the matching ` wait_for ` calls, then concurrently call all the event's listener callbacks
 
 
     Parameters
     ----------
-    event : GatewayEvents
+    event : Union[GatewayEvents, str]
       Type of gateway event triggered
 
-    guild : Optional[Guild]
-      Guild object that came with the event
+    *args : Any
+      Arguments passed to every listener
+
+    guild_id : Optional[int]
+      ID of the guild the event happened in, if any. Only the waiters of that guild, and of any guild, are checked
     """
-    try:
-      tasks = []
-      match event:
-        case GatewayEvents.Ready:
-          for callback in self.ready:
-            tasks.append(callback())
-            
-        case GatewayEvents.GuildCreate:
-          for callback in self.on_guild_available:
-            if not self.app.guilds(id = guild.id): self.app.guilds.append(guild)
-            else: tasks.append(callback(guild))
-      await gather(*tasks)
-    except Exception as error:
+    name : str = self.resolve(event)
+    if name in self.waiters:
+      self._resolve(name, None, args)
+      if guild_id is not None: self._resolve(name, guild_id, args)
+    listeners : Tuple[Callable[..., Coroutine], ...] = self.listeners.get(name, ())
+    if not listeners: return
+    results   : List[Any] = await gather(
+      *(callback(*args) for callback in listeners),
+      return_exceptions = True
+    )
+    for error in results:
+      if not isinstance(error, Exception): continue
       tbexc : TracebackException = TracebackException.from_exception(error)
-      if self.app.logger: self.app.logger.error(error, tbexc.stack[1] if len(tbexc.stack) > 1 else tbexc.stack[0])
\ No newline at end of file
+      if self.app.logger: self.app.logger.error(error, tbexc.stack[1] if len(tbexc.stack) > 1 else tbexc.stack[0])
+
+
+  async def wait_for(
+    self,
+    name     : Union[GatewayEvents, str],
+    *,
+    check    : Optional[Callable[..., bool]] = None,
+    timeout  : Optional[float]               = None,
+    guild_id : Optional[int]                 = None
+  ) -> Any:
+    """
+    Waits for the next event that passes a check. Waiters are indexed by event name and guild ID, so an event only checks the waiters that could match it
+
+
+    Parameters
+    ----------
+    name : Union[GatewayEvents, str]
+      Listener name, event name or event to wait for, e.g. ` guild_create `
+
+    check : Optional[Callable[..., bool]]
+      Called with the event's listener arguments, the event is returned once it returns True. Defaults to the first event
+
+    timeout : Optional[float]
+      Seconds to wait before raising TimeoutError. Defaults to waiting forever
+
+    guild_id : Optional[int]
+      Only wait for events of this guild. Defaults to any guild
+
+
+    Returns
+    -------
+    Any
+      The event's listener argument, a tuple of them if there are several, or ` None ` if there are none
+
+
+    Raises
+    ------
+    TimeoutError
+      No matching event happened within ` timeout ` seconds
+    """
+    if get_running_loop() is not self.app.dispatcher.loop:
+      return await wrap_future(
+        run_coroutine_threadsafe(
+          self.wait_for(name, check = check, timeout = timeout, guild_id = guild_id),
+          self.app.dispatcher.loop
+        )
+      )
+    event  : str                   = self.resolve(name)
+    guild  : Optional[int]         = int(guild_id) if guild_id is not None else None
+    future : Future                = self.app.dispatcher.loop.create_future()
+    handle : Optional[TimerHandle] = self.app.dispatcher.loop.call_later(timeout, self._expire, event, guild, future) if timeout is not None else None
+    self.waiters.setdefault(event, {}).setdefault(guild, {})[future] = (check, handle)
+    try:
+      return await future
+    finally:
+      self._discard(event, guild, future)
+
+
+  def _discard(
+    self,
+    event  : str,
+    guild  : Optional[int],
+    future : Future
+  ) -> None:
+    """
+    Removes a waiter from the index, along with the index entries it leaves empty
+    """
+    waiters : Optional[Dict[Optional[int], Dict[Future, Tuple]]] = self.waiters.get(event)
+    if not waiters or guild not in waiters: return
+    entry   : Optional[Tuple] = waiters[guild].pop(future, None)
+    if entry and entry[1]: entry[1].cancel()
+    if not waiters[guild]: del waiters[guild]
+    if not waiters: self.waiters.pop(event, None)
+
+
+  def _expire(
+    self,
+    event  : str,
+    guild  : Optional[int],
+    future : Future
+  ) -> None:
+    """
+    Times out a waiter. Called by the waiter's own timer, so no other waiter is looked at
+    """
+    self._discard(event, guild, future)
+    if not future.done(): future.set_exception(TimeoutError())
+
+
+  def _resolve(
+    self,
+    event : str,
+    guild : Optional[int],
+    args  : Tuple[Any, ...]
+  ) -> None:
+    """
+    Resolves the waiters of an event and guild whose check passes
+    """
+    waiters : Optional[Dict[Future, Tuple]] = self.waiters.get(event, {}).get(guild)
+    if not waiters: return
+    for future, (check, _) in list(waiters.items()):
+      if future.done():
+        self._discard(event, guild, future)
+        continue
+      try:
+        if check and not check(*args): continue
+      except Exception as error:
+        self._discard(event, guild, future)
+        future.set_exception(error)
+        continue
+      self._discard(event, guild, future)
+      future.set_result(args[0] if len(args) == 1 else args or None)
+
+
+def _guild_id(
+  event : str,
+  data  : Any
+) -> Optional[int]:
+  """
+  Returns the ID of the guild an event happened in, if any. Guild events carry it as their ` id `
+  """
+  if not isinstance(data, dict): return None
+  guild_id : Optional[str] = data.get("guild_id") or (data.get("id") if event in ("GUILD_CREATE", "GUILD_UPDATE", "GUILD_DELETE") else None)
+  return int(guild_id) if guild_id else None
+
+
+def _guild(
+  ws   : "DiscordWebSocket",
+  data : Dict[str, Any]
+) -> Optional[Guild]:
+  """
+  Returns the cached guild of an event, if any
+  """
+  return ws.app.guilds.get(data["guild_id"]) if data.get("guild_id") else None
+
+
+@AppEvents.parser(GatewayEvents.GuildUpdate, GatewayEvents.GuildDelete)
+def _parse_guild(
+  ws   : "DiscordWebSocket",
+  data : Dict[str, Any]
+) -> Tuple[Guild]:
+  return (ws.app.guilds.get(data["id"]) or Guild.from_data(ws, data),)
+
+
+@AppEvents.parser(GatewayEvents.ChannelCreate, GatewayEvents.ChannelUpdate, GatewayEvents.ChannelDelete, GatewayEvents.ThreadCreate, GatewayEvents.ThreadUpdate, GatewayEvents.ThreadDelete)
+def _parse_channel(
+  ws   : "DiscordWebSocket",
+  data : Dict[str, Any]
+) -> Tuple[GuildChannel]:
+  guild : Optional[Guild] = _guild(ws, data)
+  return ((guild.channels.get(data["id"]) if guild else None) or GuildChannel.from_data(ws, data, guild),)
+
+
+@AppEvents.parser(GatewayEvents.GuildMemberAdd, GatewayEvents.GuildMemberUpdate)
+def _parse_member(
+  ws   : "DiscordWebSocket",
+  data : Dict[str, Any]
+) -> Tuple[Member]:
+  guild : Optional[Guild] = _guild(ws, data)
+  return ((guild.members.get(data["user"]["id"]) if guild else None) or Member.from_data(ws, data, guild),)
+
+
+@AppEvents.parser(GatewayEvents.GuildMemberRemove, GatewayEvents.GuildBanAdd, GatewayEvents.GuildBanRemove)
+def _parse_guild_user(
+  ws   : "DiscordWebSocket",
+  data : Dict[str, Any]
+) -> Tuple[Optional[Guild], User]:
+  return (_guild(ws, data), User.from_data(data["user"]))
+
+
+@AppEvents.parser(GatewayEvents.GuildRoleCreate, GatewayEvents.GuildRoleUpdate)
+def _parse_role(
+  ws   : "DiscordWebSocket",
+  data : Dict[str, Any]
+) -> Tuple[Role]:
+  guild : Optional[Guild] = _guild(ws, data)
+  return ((guild.roles.get(data["role"]["id"]) if guild else None) or Role.from_data(data["role"], guild),)
+
+
+@AppEvents.parser(GatewayEvents.GuildRoleDelete)
+def _parse_role_delete(
+  ws   : "DiscordWebSocket",
+  data : Dict[str, Any]
+) -> Tuple[Optional[Guild], int]:
+  return (_guild(ws, data), int(data["role_id"]))
+
+
+@AppEvents.parser(GatewayEvents.UserUpdate)
+def _parse_user(
+  ws   : "DiscordWebSocket",
+  data : Dict[str, Any]
+) -> Tuple[User]:
+  return (User.from_data(data),)
+
+
+@AppEvents.parser(GatewayEvents.Ready, GatewayEvents.Resumed)
+def _parse_session(
+  ws   : "DiscordWebSocket",
+  data : Any
+) -> Tuple[()]:
+  return ()
+
+
+@AppEvents.parser(*(event for event in GatewayEvents if event.value not in AppEvents.parsers))
+def _parse_raw(
+  ws   : "DiscordWebSocket",
+  data : Any
+) -> Tuple[Any]:
+  """
+  Passes the raw ` d ` field of the events that have no model in this library
+  """
+  return (data,)
\ No newline at end of file
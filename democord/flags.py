@@ -48,4 +48,171 @@ class UserFlags(Enum):
   verified_developer   = 1 << 17
   certified_moderator  = 1 << 18
   http_bot             = 1 << 19
-  active_developer     = 1 << 22
\ No newline at end of file
+  active_developer     = 1 << 22
+
+
+class FlagSet(int):
+  """
+  Set of flags kept as their raw bitfield. Subclasses set ` flags ` to the enumeration of their flags
+
+  There are only a handful of distinct flag values in practice, so instances are interned per value, unless ` interned ` is disabled. The names of a value are only decoded when first needed, and membership tests work on the raw bitfield, so neither walks the enumeration
+
+
+  Attributes
+  ----------
+  interned : bool
+    Whether instances are interned per value. Subclasses whose values are not bounded in practice disable it, so the table cannot grow forever
+
+  names : Tuple[str, ...]
+    Names of the flags in the set
+  """
+
+  flags      : Type[Enum]
+  interned   : bool = True
+  _instances : Dict[int, Self]
+
+  def __init_subclass__(
+    cls,
+    **kwargs
+  ) -> None:
+    super().__init_subclass__(**kwargs)
+    cls._instances : Dict[int, Self] = {}
+
+
+  def __new__(
+    cls,
+    value : int = 0
+  ) -> Self:
+    flagset : Optional[Self] = cls._instances.get(value)
+    if flagset is not None: return flagset
+    flagset : Self           = super().__new__(cls, value)
+    return cls._instances.setdefault(value, flagset) if cls.interned else flagset
+
+
+  @property
+  def names(
+    self
+  ) -> Tuple[str, ...]:
+    """
+    Names of the flags in the set, decoded on first access
+
+    Returns
+    -------
+    Tuple[str, ...]
+    """
+    try:
+      return self._names
+    except AttributeError:
+      value      : int             = int(self)
+      self._names : Tuple[str, ...] = tuple(
+        name
+        for name, flag in self.flags._member_map_.items()
+        if (value & flag.value) == flag.value
+      )
+      return self._names
+
+
+  def __contains__(
+    self,
+    flag : Union[Enum, int, str]
+  ) -> bool:
+    """
+    Checks whether a flag, given as a member, a name or a value, is in the set
+
+    Returns
+    -------
+    bool
+    """
+    value : int = self._value_of(flag)
+    return (int(self) & value) == value if value else False
+
+
+  def __iter__(
+    self
+  ) -> Iterator[str]:
+    return iter(self.names)
+
+
+  def __len__(
+    self
+  ) -> int:
+    return len(self.names)
+
+
+  def __repr__(
+    self
+  ) -> str:
+    return f"{type(self).__name__}({", ".join(self.names)})"
+
+
+  def __and__(
+    self,
+    other : Union[Enum, int, str]
+  ) -> Self:
+    return type(self)(int(self) & self._value_of(other))
+
+
+  def __or__(
+    self,
+    other : Union[Enum, int, str]
+  ) -> Self:
+    return type(self)(int(self) | self._value_of(other))
+
+
+  def __sub__(
+    self,
+    other : Union[Enum, int, str]
+  ) -> Self:
+    return type(self)(int(self) & ~self._value_of(other))
+
+
+  def __xor__(
+    self,
+    other : Union[Enum, int, str]
+  ) -> Self:
+    return type(self)(int(self) ^ self._value_of(other))
+
+  __rand__ = __and__
+  __ror__  = __or__
+  __rxor__ = __xor__
+
+
+  def _value_of(
+    self,
+    flag : Union[Enum, int, str]
+  ) -> int:
+    """
+    Returns the bitfield value of a flag given as a member, a name or a value
+
+    Returns
+    -------
+    int
+    """
+    match flag:
+      case Enum(): return flag.value
+      case str():
+        member : Optional[Enum] = self.flags._member_map_.get(flag)
+        if not member: raise ValueError(f"There is no such {self.flags.__name__} flag named: {flag}")
+        return member.value
+      case _:      return int(flag)
+
+
+class ApplicationFlagSet(FlagSet):
+  """
+  Set of an application's flags
+  """
+  flags : Type[Enum] = ApplicationFlags
+
+
+class SystemChannelFlagSet(FlagSet):
+  """
+  Set of a system channel's flags
+  """
+  flags : Type[Enum] = SystemChannelFlags
+
+
+class UserFlagSet(FlagSet):
+  """
+  Set of a user's flags
+  """
+  flags : Type[Enum] = UserFlags
\ No newline at end of file
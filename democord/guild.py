@@ -1,43 +1,69 @@
-from .asset    import Asset
-from .channels import (
-                      GuildChannel
-                      )
-from .emoji    import Emoji
-from .enums    import (
-                      DefaultMessageNotification,
-                      ExplicitContentFilter,
-                      ErrorCodes,
-                      GuildFeatures,
-                      MFALevel,
-                      NSFWLevel,
-                      PermissionFlags,
-                      PremiumTier,
-                      VerificationLevel
-                      )
-from .errors   import (
-                      BotMissingPermissions,
-                      MissingPermissions
-                      )
-from .file     import File
-from .flags    import (
-                      SystemChannelFlags
-                      )
-from .locales  import Locale
-from .member   import Member
-from .reqs     import (
-                      DELETE,
-                      GET,
-                      PATCH,
-                      PUT
-                      )
-from .user     import User
-from typing    import *
+from .asset       import Asset
+from .cache       import (
+                         EntityCache,
+                         MemberCache
+                         )
+from .channels    import (
+                         GuildChannel
+                         )
+from .emoji       import Emoji
+from .enums       import (
+                         DefaultMessageNotification,
+                         ExplicitContentFilter,
+                         ErrorCodes,
+                         GuildFeatures,
+                         MFALevel,
+                         NSFWLevel,
+                         PermissionFlags,
+                         PremiumTier,
+                         VerificationLevel
+                         )
+from .errors      import (
+                         BotMissingPermissions,
+                         HTTPException,
+                         MissingPermissions
+                         )
+from .file        import File
+from .flags       import (
+                         SystemChannelFlags,
+                         SystemChannelFlagSet
+                         )
+from .locales     import Locale
+from .member      import (
+                         BulkEditResult,
+                         Member
+                         )
+from .model       import (
+                         Model,
+                         lazy_property
+                         )
+from .permissions import (
+                         PermissionResolver,
+                         Permissions
+                         )
+from .reqs        import (
+                         DELETE,
+                         GET,
+                         PATCH,
+                         PUT
+                         )
+from .role        import Role
+from .user        import User
+from asyncio      import (
+                         Semaphore,
+                         gather
+                         )
+from typing       import *
 
 if TYPE_CHECKING:
-  from .ws     import DiscordWebSocket
+  from .iterators import (
+                         MemberChunkIterator,
+                         MemberIterator
+                         )
+  from .ws        import DiscordWebSocket
 
 
-class CallableSystemChannelFlags(list):
+class CallableSystemChannelFlags(SystemChannelFlagSet):
   """
   Callable property for Guild.system_channel_flags attribute
   """
@@ -55,88 +81,9 @@ class CallableSystemChannelFlags(list):
     bool
     """
 
-    return flag.name in self
+    return flag in self
 
 
-class CallableGuildChannels(list):
-  """
-  Callable property for Guild.channels attribute
-  """
-
-  def __call__(
-    self,
-    **kwargs
-  ) -> Optional[List[GuildChannel] | GuildChannel]:
-    """
-    Filter the returned list by the passed GuildChannel attributes
-
-
-    Parameters
-    ----------
-    **kwargs
-      Keyword arguments of ( or a subclass of ) GuildChannel attributes
-
-
-    Returns
-    -------
-    Optional[List[GuildChannel] | GuildChannel]
-    """
-
-    if not args: return self
-    matches : List[GuildChannel] = [
-      guild_channel
-      for guild_channel in self
-      if all(
-        guild_channel.__dict__[kwarg] == kwargs[kwarg]
-        for kwarg in kwargs
-        if guild_channel.__dict__.get(kwarg)
-      )
-    ]
-    return (matches[0] if len(matches) == 1 else matches) if matches else None
-
-
-class CallableGuildMembers(list):
-  """
-  Callable property for Guild.members attribute
-  """
-
-  def __call__(
-    self,
-    **kwargs
-  ) -> Optional[List[Member] | Member]:
-    """
-    Filter the result by the passed Member attributes
-
-
-    Parameters
-    ----------
-    **kwargs
-      Keyword arguments that are used to filter the result
-
-
-    Returns
-    -------
-    Optional[List[Member] | Member]
-    """
-
-    if not args: return self
-    matches : list[Member] = [
-      member
-      for member in self
-      if all(
-        member.__dict__[kwarg] == kwargs[kwarg]
-        for kwarg in kwargs
-        if member.__dict__.get(kwarg)
-      )
-    ]
-    return (matches[0] if len(matches) == 1 else matches) if matches else None
-
-  
-  def __contains__(self, member : Union[Member, int]) -> bool:
-    if not isinstance(member, (Member, int)): raise TypeError("member: must be of type <Member> or <int>")
-    return int(member) in self
-  
-
 class GuildPreview:
 
   @classmethod
@@ -156,12 +103,56 @@ class GuildPreview:
     return preview
 
 
-class Guild:
+class Guild(Model):
   """
   Represents a Discord guild, called " servers " in the UI
+
+
+  Attributes
+  ----------
+  channels : EntityCache
+    Cache of the guild's channels, keyed by channel ID
+
+  entity_fields : FrozenSet[str]
+    Fields of a guild payload listing entities, which are parsed into their caches or dropped rather than kept in the payload
+
+  members : MemberCache
+    Cache of the guild's members, keyed by user ID
+
+  roles : EntityCache
+    Cache of the guild's roles, keyed by role ID
   """
 
-  members : list = CallableGuildMembers()
+  __slots__ : Tuple[str, ...] = (
+    "_default_message_notifications",
+    "_discovery_splash",
+    "_explicit_content_filter",
+    "_icon",
+    "_mfa_level",
+    "_nsfw_level",
+    "_premium_tier",
+    "_resolver",
+    "_splash",
+    "_system_channel_flags",
+    "_verification_level",
+    "channels",
+    "id",
+    "members",
+    "roles",
+    "ws"
+  )
+
+  entity_fields : FrozenSet[str] = frozenset((
+    "channels",
+    "guild_scheduled_events",
+    "members",
+    "presences",
+    "roles",
+    "soundboard_sounds",
+    "stage_instances",
+    "threads",
+    "voice_states"
+  ))
 
   def __eq__(
     self,
@@ -241,9 +232,298 @@ class Guild:
     return self.name
 
 
+  @lazy_property
+  def default_message_notifications(
+    self
+  ) -> str:
+    """
+    Default message notification level of the guild
+
+
+    Returns
+    -------
+    str
+    """
+
+    return DefaultMessageNotification(self._data["default_message_notifications"]).name
+
+
+  @lazy_property
+  def discovery_splash(
+    self
+  ) -> Optional[Asset]:
+    """
+    Discovery splash of the guild, if any
+
+
+    Returns
+    -------
+    Optional[Asset]
+    """
+
+    return Asset.from_guild("discovery_splash", self._data) if self._data.get("discovery_splash") else None
+
+
+  @lazy_property
+  def explicit_content_filter(
+    self
+  ) -> str:
+    """
+    Explicit content filter level of the guild
+
+
+    Returns
+    -------
+    str
+    """
+
+    return ExplicitContentFilter(self._data["explicit_content_filter"]).name
+
+
+  @lazy_property
+  def icon(
+    self
+  ) -> Optional[Asset]:
+    """
+    Icon of the guild, if any
+
+
+    Returns
+    -------
+    Optional[Asset]
+    """
+
+    return Asset.from_guild("icon", self._data) if self._data.get("icon") else None
+
+
+  @lazy_property
+  def mfa_level(
+    self
+  ) -> str:
+    """
+    Required MFA level of the guild
+
+
+    Returns
+    -------
+    str
+    """
+
+    return MFALevel(self._data["mfa_level"]).name
+
+
+  @lazy_property
+  def nsfw_level(
+    self
+  ) -> str:
+    """
+    NSFW level of the guild
+
+
+    Returns
+    -------
+    str
+    """
+
+    return NSFWLevel(self._data["nsfw_level"]).name
+
+
+  @property
+  def owner(
+    self
+  ) -> Optional[User]:
+    """
+    Owner of the guild, if cached. Never sends a request, use ` fetch_owner ` to fetch an uncached owner
+
+
+    Returns
+    -------
+    Optional[User]
+    """
+
+    owner_id : int            = int(self._data["owner_id"])
+    user     : Optional[User] = self.ws.app.users.get(owner_id)
+    if user: return user
+    member   : Optional[Member] = self.members.get(owner_id)
+    return member.user if member else None
+
+
+  @lazy_property
+  def premium_tier(
+    self
+  ) -> str:
+    """
+    Boost tier of the guild
+
+
+    Returns
+    -------
+    str
+    """
+
+    return PremiumTier(self._data["premium_tier"]).name
+
+
+  @lazy_property
+  def resolver(
+    self
+  ) -> PermissionResolver:
+    """
+    Permission resolver of the guild, memoizing the permissions of its members
+
+
+    Returns
+    -------
+    PermissionResolver
+    """
+
+    return PermissionResolver(self)
+
+
+  @lazy_property
+  def splash(
+    self
+  ) -> Optional[Asset]:
+    """
+    Invite splash of the guild, if any
+
+
+    Returns
+    -------
+    Optional[Asset]
+    """
+
+    return Asset.from_guild("splash", self._data) if self._data.get("splash") else None
+
+
+  @lazy_property
+  def system_channel_flags(
+    self
+  ) -> CallableSystemChannelFlags:
+    """
+    Names of the system channel flags of the guild
+
+
+    Returns
+    -------
+    CallableSystemChannelFlags
+    """
+
+    return CallableSystemChannelFlags(self._data["system_channel_flags"])
+
+
+  @lazy_property
+  def verification_level(
+    self
+  ) -> str:
+    """
+    Verification level required to talk in the guild
+
+
+    Returns
+    -------
+    str
+    """
+
+    return VerificationLevel(self._data["verification_level"]).name
+
+
   @property
   def me(self) -> Optional[Member]:
-    return self.members(id = self.ws.app.info.id)
+    """
+    Member of the bot user in the guild, if cached. ` None ` before READY, as the bot user is not known yet
+
+
+    Returns
+    -------
+    Optional[Member]
+    """
+
+    if self.ws.app.user is None: return None
+    return self.members.get(self.ws.app.user.id)
+
+
+  def check_permissions(
+    self,
+    *permissions : PermissionFlags,
+    channel      : Optional[GuildChannel] = None
+  ) -> None:
+    """
+    Checks that the bot user has every given permission before a request is sent. Nothing is checked before READY, or if the bot's member is not cached, and Discord enforces the permissions instead
+
+
+    Parameters
+    ----------
+    *permissions : PermissionFlags
+      Permissions the request needs
+
+    channel : Optional[GuildChannel]
+      Channel the request acts in. Defaults to the guild-level permissions
+
+
+    Raises
+    ------
+    BotMissingPermissions
+      The bot user lacks one of the permissions
+    """
+
+    me : Optional[Member] = self.me
+    if not me: return
+    granted : Permissions           = self.permissions_for(me, channel)
+    missing : List[PermissionFlags] = [permission for permission in permissions if permission not in granted]
+    if missing: raise BotMissingPermissions(*missing)
+
+
+  def permissions_for(
+    self,
+    member  : Member,
+    channel : Optional[GuildChannel] = None
+  ) -> Permissions:
+    """
+    Returns the effective permissions of a member in the guild, or in one of its channels. Results are memoized until a role, overwrite or member update affects them
+
+
+    Parameters
+    ----------
+    member : Member
+      Member of the guild
+
+    channel : Optional[GuildChannel]
+      Channel to apply the permission overwrites of. Defaults to the guild-level permissions
+
+
+    Returns
+    -------
+    Permissions
+    """
+
+    return self.resolver.compute(member, channel)
+
+
+  def _update(
+    self,
+    data : Dict[str, Any],
+    *,
+    lazy : bool = True
+  ) -> None:
+    """
+    Applies a GUILD_UPDATE payload in place, keeping the member and channel caches. Memoized permissions are dropped along with the other lazy fields
+
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+      Dictionary payload of the updated guild
+
+    lazy : Optional[bool]
+      Whether to drop the lazy fields. Defaults to True
+    """
+
+    super()._update({key: value for key, value in data.items() if key not in self.entity_fields}, lazy = lazy)
+    if "roles" in data:
+      self.roles.clear()
+      for role in data["roles"]:
+        self.roles.add(Role.from_data(role, self))
 
 
   async def add_member(
@@ -265,7 +545,7 @@ class Guild:
       else: raise TypeError("roles: must be of type <list> containing <Role> objects")
       if not isinstance(mute, bool): raise TypeError("mute: must be of type <bool>")
       if not isinstance(deaf, bool): raise TypeError("deaf: must be of type <bool>")
-      response : Dict[str, Any] = self.ws.put(
+      response : Dict[str, Any] = await self.ws.put(
         PUT.member(self.id, user.id),
         data = {
           "access_token": access_token,
@@ -275,7 +555,7 @@ class Guild:
           "deaf": deaf
         }
       )
-      return Member.from_data(self.ws, response)
+      return Member.from_data(self.ws, response, self)
       if response.get("code"):
         match ErrorCodes(response.get("code")):
           case ErrorCodes.MissingPermissions:
@@ -288,8 +568,9 @@ class Guild:
     try:
       if self.id != self.ws.app.appinfo.id:
         raise BotMissingPermissions("Bot must be the guild owner in order to delete the guild.")
-      self.ws.delete(DELETE.guild(self.id))
-      self.ws.app.guilds.remove(self.ws.app.guilds(id = self.id)[0])
+      await self.ws.delete(DELETE.guild(self.id))
+      self.ws.app.guilds.discard(self.id)
+      self.members.clear()
       return None
     except Exception as error:
       if self.ws.app.logger: self.ws.app.logger.error(error)
@@ -443,7 +724,7 @@ class Guild:
             data[attribute] : int = attributes[attribute].value
 
       reason : str = str(attributes.get("reason"))
-      response : dict = self.ws.patch(
+      response : dict = await self.ws.patch(
         PATCH.guild(self.id),
         data   = data,
         reason = reason
@@ -460,13 +741,33 @@ class Guild:
       if self.ws.app.logger: self.ws.app.logger.error(error)
 
 
+  async def fetch_owner(
+    self
+  ) -> User:
+    """
+    Returns the owner of the guild, fetching and caching it if it is not cached
+
+
+    Returns
+    -------
+    User
+    """
+    owner : Optional[User] = self.owner
+    if owner: return owner
+    try:
+      response : Dict[str, Any] = await self.ws.get(GET.user(self._data["owner_id"]))
+      return self.ws.app.users.add(User.from_data(response))
+    except Exception as error:
+      if self.ws.app.logger: self.ws.app.logger.error(error)
+
+
   async def fetch_member(
     self,
     member_id : int
   ) -> Member:
     try:
-      response : Dict[str, Any] = self.ws.get(GET.member(self.id, member_id))
-      return Member.from_data(self.ws, response)
+      response : Dict[str, Any] = await self.ws.get(GET.member(self.id, member_id))
+      return Member.from_data(self.ws, response, self)
     except Exception as error:
       if self.ws.app.logger: self.ws.app.logger.error(error)
 
@@ -481,12 +782,223 @@ class Guild:
       if limit < 0 or limit > 1_000: raise ValueError("limit: must be between 0 and 1,000")
       if not isinstance(after, int): raise TypeError("after: must be of type <int>")
       if after < 0: raise ValueError("after: must be 0 or greater")
-      response : Dict[str, Any] = self.ws.get(GET.members(self.id, limit, after))
-      return [Member.from_data(data) for data in response]
+      response : Dict[str, Any] = await self.ws.get(GET.members(self.id, limit, after))
+      return [Member.from_data(self.ws, data, self) for data in response]
     except Exception as error:
       if self.ws.app.logger: self.ws.app.logger.error(error)
 
 
+  def iter_members(
+    self,
+    *,
+    limit     : Optional[int]       = None,
+    page_size : int                 = 1_000,
+    after     : int                 = 0,
+    prefetch  : bool                = True,
+    semaphore : Optional[Semaphore] = None,
+    cache     : bool                = False
+  ) -> "MemberIterator":
+    """
+    Iterates over every member of the guild, page by page, e.g. ` async for member in guild.iter_members(): ... `
+
+
+    Parameters
+    ----------
+    limit : Optional[int]
+      Maximum number of members to yield. Defaults to every member
+
+    page_size : Optional[int]
+      Number of members requested per page, between 1 and 1,000. Defaults to 1,000
+
+    after : Optional[int]
+      Only yield members with a higher ID, e.g. the ` cursor ` of an interrupted iteration. Defaults to 0
+
+    prefetch : Optional[bool]
+      Whether to request the next page while the current one is consumed. Defaults to True
+
+    semaphore : Optional[Semaphore]
+      Semaphore bounding the page requests in flight. Share one between iterators to limit concurrent exports. Defaults to no limit
+
+    cache : Optional[bool]
+      Whether to add the yielded members to the member cache. Defaults to False
+
+
+    Returns
+    -------
+    MemberIterator
+    """
+
+    from .iterators import MemberIterator
+    return MemberIterator(
+      self,
+      limit     = limit,
+      page_size = page_size,
+      after     = after,
+      prefetch  = prefetch,
+      semaphore = semaphore,
+      cache     = cache
+    )
+
+
+  def request_members(
+    self,
+    *,
+    query     : str                     = "",
+    limit     : int                     = 0,
+    user_ids  : Optional[Iterable[int]] = None,
+    presences : bool                    = False,
+    timeout   : Optional[float]         = 30.0
+  ) -> "MemberChunkIterator":
+    """
+    Requests members of the guild over the gateway and iterates over the chunks sent in reply, e.g. ` async for chunk in guild.request_members(query = "demo"): ... `. Requesting every member requires the ` GUILD_MEMBERS ` intent
+
+    The received members are added to the member cache, and the request holds one of the application's ` member_requests ` slots until its last chunk arrived
+
+
+    Parameters
+    ----------
+    query : Optional[str]
+      Prefix the usernames must start with. Defaults to every member
+
+    limit : Optional[int]
+      Maximum number of members to send, ` 0 ` for no limit. Defaults to ` 0 `
+
+    user_ids : Optional[Iterable[int]]
+      IDs of the members to send, instead of a query
+
+    presences : Optional[bool]
+      Whether to also send the members' presences. Defaults to False
+
+    timeout : Optional[float]
+      Seconds to wait for each chunk. Defaults to ` 30.0 `
+
+
+    Returns
+    -------
+    MemberChunkIterator
+    """
+
+    from .iterators import MemberChunkIterator
+    return MemberChunkIterator(
+      self,
+      query     = query,
+      limit     = limit,
+      user_ids  = user_ids,
+      presences = presences,
+      timeout   = timeout
+    )
+
+
+  async def bulk_edit(
+    self,
+    members      : Iterable[Union[Member, int]],
+    *,
+    add_roles    : Iterable[Role] = (),
+    remove_roles : Iterable[Role] = (),
+    nick         : Optional[str]  = None,
+    mute         : Optional[bool] = None,
+    deaf         : Optional[bool] = None,
+    reason       : Optional[str]  = None,
+    concurrency  : int            = 5
+  ) -> List[BulkEditResult]:
+    """
+    Applies the same edit to many members. Each member is edited with a single ` PATCH `, merging the added and removed roles into its role list, and members whose roles and fields would not change are skipped
+
+    Permissions are checked once up front. The edits are run by ` concurrency ` workers taking the members one at a time, so no more than that many edits are ever pending, however many members are given. Every request still waits for its rate limit bucket, so a large batch spreads over the route's budget instead of retrying on 429s
+
+
+    Parameters
+    ----------
+    members : Iterable[Union[Member, int]]
+      Members, or IDs of members, to edit. Members missing from the cache are fetched first, and added to it
+
+    add_roles : Optional[Iterable[Role]]
+      Roles to add
+
+    remove_roles : Optional[Iterable[Role]]
+      Roles to remove
+
+    nick : Optional[str]
+      Nickname to set
+
+    mute : Optional[bool]
+      Whether to mute the members in voice channels
+
+    deaf : Optional[bool]
+      Whether to deafen the members in voice channels
+
+    reason : Optional[str]
+      Reason of the modification, shown in the audit log
+
+    concurrency : Optional[int]
+      Maximum number of edits in flight. Defaults to 5
+
+
+    Returns
+    -------
+    List[BulkEditResult]
+      Outcome of every edit, in the order of ` members `. A result is falsy if its edit failed
+
+
+    Raises
+    ------
+    BotMissingPermissions
+      The application lacks a permission the edit needs
+    """
+
+    if concurrency < 1: raise ValueError("concurrency: must be 1 or greater")
+    add_roles    : Tuple[Role, ...]      = tuple(add_roles)
+    remove_roles : Tuple[Role, ...]      = tuple(remove_roles)
+    data         : Dict[str, Any]        = {}
+    permissions  : List[PermissionFlags] = []
+    if add_roles or remove_roles:
+      for role in add_roles + remove_roles:
+        if not isinstance(role, Role): raise TypeError("roles: must be of type <Role>")
+      permissions.append(PermissionFlags.manage_roles)
+    if nick is not None:
+      if not isinstance(nick, str): raise TypeError("nick: must be of type <str>")
+      data["nick"] = nick
+      permissions.append(PermissionFlags.manage_nicknames)
+    if mute is not None:
+      if not isinstance(mute, bool): raise TypeError("mute: must be of type <bool>")
+      data["mute"] = mute
+      permissions.append(PermissionFlags.mute_members)
+    if deaf is not None:
+      if not isinstance(deaf, bool): raise TypeError("deaf: must be of type <bool>")
+      data["deaf"] = deaf
+      permissions.append(PermissionFlags.deafen_members)
+    self.check_permissions(*permissions)
+    pending : Iterator[Tuple[int, Union[Member, int]]] = enumerate(members)
+    results : Dict[int, BulkEditResult]                = {}
+
+    async def edit(member : Union[Member, int]) -> BulkEditResult:
+      member_id : int = member if isinstance(member, int) else member.id
+      try:
+        if isinstance(member, int):
+          member : Optional[Member] = self.members.get(member_id)
+          if not member:
+            response : Optional[Dict[str, Any]] = await self.ws.get(GET.member(self.id, member_id))
+            if not response or "user" not in response: raise HTTPException.from_data(response)
+            member : Member = self.members.add(Member.from_data(self.ws, response, self))
+        payload  : Dict[str, Any]           = {
+          field: value
+          for field, value in data.items()
+          if getattr(member, field, None) != value
+        }
+        role_ids : Optional[FrozenSet[int]] = member._merge_roles(add_roles, remove_roles)
+        if role_ids is not None: payload["roles"] = [str(role_id) for role_id in role_ids]
+        if payload: await member._patch(payload, reason)
+        return BulkEditResult(member_id, member)
+      except Exception as error:
+        return BulkEditResult(member_id, member if isinstance(member, Member) else None, error)
+
+    async def work() -> None:
+      for index, member in pending: results[index] = await edit(member)
+
+    await gather(*(work() for _ in range(concurrency)))
+    return [results[index] for index in range(len(results))]
+
+
   async def kick(
     self,
     member_id : int,
@@ -494,8 +1006,8 @@ class Guild:
   ) -> None:
     try:
       if member_id not in self.members: raise ValueError(f"No member with an ID: {member_id}")
-      # check permission: kick_members
-      response : Dict[str, Any] = self.ws.delete(
+      self.check_permissions(PermissionFlags.kick_members)
+      response : Dict[str, Any] = await self.ws.delete(
         DELETE.member(self.id, member_id),
         reason = reason
       )
@@ -505,7 +1017,7 @@ class Guild:
 
   async def preview(self) -> GuildPreview:
     try:
-      return GuildPreview.from_data(self.ws.get(GET.guild_preview(self.id)))
+      return GuildPreview.from_data(await self.ws.get(GET.guild_preview(self.id)))
     except Exception as error:
       if self.ws.app.logger: self.ws.app.logger.error(error)
 
@@ -517,7 +1029,7 @@ class Guild:
     data : Dict[str, Any]
   ) -> Self:
     """
-    Construct a Guild object from a dictionary payload
+    Construct a Guild object from a dictionary payload. The roles, channels and members are parsed into their caches up front, and only the guild's own fields of the payload are kept, so evicted members and dropped presences are freed
 
 
     Parameters
@@ -534,23 +1046,20 @@ class Guild:
     Guild
     """
 
-    guild : Self = cls()
-    guild.__dict__["ws"] : DiscordWebSocket = ws
+    guild            : Self             = cls()
+    guild._data      : Dict[str, Any]   = {key: value for key, value in data.items() if key not in cls.entity_fields}
+    guild.id         : int              = int(data["id"])
+    guild.ws         : DiscordWebSocket = ws
+    guild.channels   : EntityCache      = EntityCache(indexes = ("name",), policy = ws.app.cache_policies.get("channels"))
+    guild.members    : MemberCache      = MemberCache(guild, indexes = ("nick",), policy = ws.app.cache_policies.get("members"))
+    guild.roles      : EntityCache      = EntityCache(indexes = ("name",))
+
+    for role in data.get("roles", ()):
+      guild.roles.add(Role.from_data(role, guild))
+    for channel in data.get("channels", ()):
+      guild.channels.add(GuildChannel.from_data(ws, channel, guild))
+    if guild.members.admits:
+      for member in data.get("members", ()):
+        guild.members.add(Member.from_data(ws, member, guild))
 
-    for attribute in data:
-      match attribute:
-        case "icon" | "splash" | "discovery_splash":
-          if data[attribute]:                 guild.__dict__[attribute] : Asset     = Asset.from_guild(attribute, data)
-        case "id":                            guild.__dict__[attribute] : int       = int(data[attribute])
-        case "owner_id":                      guild.__dict__["owner"]   : User      = User.from_id(ws, data["owner_id"])
-        case "default_message_notifications": guild.__dict__[attribute] : str       = DefaultMessageNotification(data[attribute]).name
-        case "explicit_content_filter":       guild.__dict__[attribute] : str       = ExplicitContentFilter(data[attribute]).name
-        case "mfa_level":                     guild.__dict__[attribute] : str       = MFALevel(data[attribute]).name
-        case "system_channel_flags":          guild.__dict__[attribute] : List[str] = CallableSystemChannelFlags(name for name, flag in SystemChannelFlags._member_map_.items() if (data[attribute] & flag.value) == flag.value)
-        case "premium_tier":                  guild.__dict__[attribute] : str       = PremiumTier(data[attribute]).name
-        case "nsfw_level":                    guild.__dict__[attribute] : str       = NSFWLevel(data[attribute]).name
-        case "verification_level":            guild.__dict__[attribute] : str       = VerificationLevel(data[attribute]).name
-        case _:                               guild.__dict__[attribute] : Any       = data[attribute]
-        
-    guild.channels : CallableGuildChannels = CallableGuildChannels()
     return guild
\ No newline at end of file
@@ -0,0 +1,128 @@
+import rel
+
+from .enums    import PayloadType
+from .payloads import Payload
+from random    import random
+from threading import (
+                      Event,
+                      Thread
+                      )
+from time      import monotonic
+from typing    import *
+
+if TYPE_CHECKING:
+  from .ws     import DiscordWebSocket
+
+
+class Heartbeat(Thread):
+  """
+  Long-lived heartbeat scheduler of a single gateway connection
+
+
+  Attributes
+  ----------
+  interval : float
+    Delay ( in seconds ) between heartbeats
+
+  latency : Optional[float]
+    Seconds between the last heartbeat and its ACK, if any was received
+
+  max_missed_acks : int
+    Number of unacknowledged heartbeats after which the connection is considered a zombie and resumed, after the connection's backoff delay, on the dispatcher thread
+
+  missed_acks : int
+    Number of consecutive heartbeats that were not acknowledged
+
+  ws : DiscordWebSocket
+    Connection the heartbeats are sent to
+  """
+
+  def __init__(
+    self,
+    ws              : "DiscordWebSocket",
+    interval        : int,
+    *,
+    max_missed_acks : int = 2
+  ) -> None:
+    """
+    Parameters
+    ----------
+    ws : DiscordWebSocket
+      Connection the heartbeats are sent to
+
+    interval : int
+      Interval ( in milliseconds ) received from the HELLO payload
+
+    max_missed_acks : Optional[int]
+      Number of unacknowledged heartbeats after which the connection is resumed. Defaults to ` 2 `
+    """
+    super().__init__(
+      name   = "democord-heartbeat",
+      daemon = True
+    )
+    self.ws              : "DiscordWebSocket" = ws
+    self.interval        : float              = interval / 1_000
+    self.latency         : Optional[float]    = None
+    self.max_missed_acks : int                = max_missed_acks
+    self.missed_acks     : int                = 0
+    self._acked          : bool               = True
+    self._sent_at        : float              = 0.0
+    self._stopped        : Event              = Event()
+
+
+  def run(
+    self
+  ) -> None:
+    """
+    Sends a heartbeat on every interval until stopped. The first heartbeat is jittered by ` interval * random() `
+    """
+    delay : float = self.interval * random()
+    while not self._stopped.wait(delay):
+      delay : float = self.interval
+      if not self._acked:
+        self.missed_acks += 1
+        if self.missed_acks >= self.max_missed_acks:
+          delay : float = self.ws.backoff.delay()
+          if self.ws.app.logger: self.ws.app.logger.warn(f"{self.missed_acks} heartbeats were not acknowledged, resuming the connection in {delay:.2f}s")
+          self.stop()
+          rel.timeout(delay, self.ws.resume)
+          return
+      self.beat()
+
+
+  def beat(
+    self
+  ) -> None:
+    """
+    Sends a heartbeat right away, without changing the schedule
+    """
+    self._acked   : bool  = False
+    self._sent_at : float = monotonic()
+    self.ws.send(
+      Payload(
+        op = PayloadType.HeartBeat,
+        d  = self.ws.last_sequence
+      )
+    )
+    if self.ws.app.logger and self.ws.app.logger.debug_mode: self.ws.app.logger.debug("Heartbeat sent successfully")
+
+
+  def ack(
+    self
+  ) -> None:
+    """
+    Records a HEARTBEAT_ACK for the last heartbeat
+    """
+    if self._acked: return
+    self.latency     : float = monotonic() - self._sent_at
+    self.missed_acks : int   = 0
+    self._acked      : bool  = True
+
+
+  def stop(
+    self
+  ) -> None:
+    """
+    Stops sending heartbeats
+    """
+    self._stopped.set()
\ No newline at end of file
@@ -0,0 +1,457 @@
+import requests
+
+from asyncio            import (
+                               CancelledError,
+                               Task,
+                               create_task,
+                               shield,
+                               wrap_future
+                               )
+from concurrent.futures import (
+                               Future,
+                               ThreadPoolExecutor
+                               )
+from .codec             import JSONCodec
+from .errors            import RateLimited
+from .ratelimit         import (
+                               Bucket,
+                               RateLimiter
+                               )
+from requests.adapters  import HTTPAdapter
+from threading          import Lock
+from time               import monotonic
+from typing             import *
+
+
+class HTTPClient:
+  """
+  Pooled, keep-alive HTTP session used for every REST call of the application
+
+
+  Attributes
+  ----------
+  api : str
+    Base URL of the Discord REST API
+
+  api_version : int
+    Version of the Discord REST API
+
+  codec : JSONCodec
+    Codec used for request and response bodies
+
+  coalesced : int
+    Number of GET requests answered by an identical in-flight request or a cached response instead of a call of their own
+
+  executor : ThreadPoolExecutor
+    Bounded pool of workers that carry out the HTTP exchanges of awaited requests off the event loop. Rate limit waits happen on the event loop and never hold a worker
+
+  headers : Dict[str, str]
+    Pre-built headers sent with every request
+
+  max_retries : int
+    Number of times a rate limited request is retried before giving up
+
+  ratelimiter : RateLimiter
+    Per-route and global rate limit tracker every request goes through
+
+  response_ttls : Dict[str, float]
+    Seconds the responses of a GET route stay cached, keyed by route template, e.g. ` GET /users/{id} `
+
+  session : requests.Session
+    Underlying session holding the connection pool
+
+  timeout : Optional[float]
+    Seconds to wait for a response before giving up
+  """
+
+  user_agent : str = "DiscordBot (https://github.com/almostDemoPy/democord, 0.9b6)"
+
+  def __init__(
+    self,
+    token            : str,
+    *,
+    api_version      : int                        = 10,
+    pool_connections : int                        = 10,
+    pool_maxsize     : int                        = 10,
+    keep_alive       : bool                       = True,
+    timeout          : Optional[float]            = None,
+    max_concurrency  : Optional[int]              = None,
+    max_retries      : int                        = 5,
+    response_ttls    : Optional[Dict[str, float]] = None
+  ) -> None:
+    """
+    Parameters
+    ----------
+    token : str
+      Bot token used for the Authorization header
+
+    api_version : Optional[int]
+      Version of the Discord REST API. Defaults to ` 10 `
+
+    pool_connections : Optional[int]
+      Number of per-host connection pools to cache. Defaults to ` 10 `
+
+    pool_maxsize : Optional[int]
+      Maximum number of connections kept alive per host. Defaults to ` 10 `
+
+    keep_alive : Optional[bool]
+      Whether to reuse connections between requests. Defaults to ` True `
+
+    timeout : Optional[float]
+      Seconds to wait for a response before giving up. Defaults to ` None `
+
+    max_concurrency : Optional[int]
+      Maximum number of awaited requests in flight at once. Defaults to ` pool_maxsize `
+
+    max_retries : Optional[int]
+      Number of times a rate limited request is retried before giving up. Defaults to ` 5 `
+
+    response_ttls : Optional[Dict[str, float]]
+      Seconds the responses of a GET route stay cached, keyed by route template as returned by ` RateLimiter.route `, e.g. ` {"GET /users/{id}": 30.0} `. Defaults to caching no route
+    """
+    self.api_version : int              = api_version
+    self.api         : str              = f"https://discord.com/api/v{api_version}"
+    self.timeout     : Optional[float]  = timeout
+    self.codec       : JSONCodec        = JSONCodec()
+    self.coalesced   : int              = 0
+    self.max_retries : int              = max_retries
+    self.ratelimiter : RateLimiter      = RateLimiter()
+    self.response_ttls : Dict[str, float]             = dict(response_ttls or {})
+    self._flight_lock  : Lock                         = Lock()
+    self._flights      : Dict[str, Future]            = {}
+    self._responses    : Dict[str, Tuple[float, Any]] = {}
+    self.headers     : Dict[str, str]   = {
+      "Authorization" : f"Bot {token}",
+      "User-Agent"    : self.user_agent
+    }
+    if not keep_alive: self.headers["Connection"] = "close"
+    self.session     : requests.Session = requests.Session()
+    self.session.headers.update(self.headers)
+    adapter          : HTTPAdapter      = HTTPAdapter(
+      pool_connections = pool_connections,
+      pool_maxsize     = pool_maxsize,
+      pool_block       = True
+    )
+    self.session.mount("https://", adapter)
+    self.session.mount("http://", adapter)
+    self.executor    : ThreadPoolExecutor = ThreadPoolExecutor(
+      max_workers        = max_concurrency or pool_maxsize,
+      thread_name_prefix = "democord-http"
+    )
+
+
+  def request(
+    self,
+    method   : str,
+    endpoint : str,
+    *,
+    data     : Optional[Dict[str, Any]] = None,
+    reason   : Optional[str]            = None
+  ) -> Any:
+    """
+    Sends a request through the pooled session. The request waits for its rate limit bucket beforehand and is retried if it still gets rate limited
+
+    Identical concurrent GET requests share a single call and its result, which callers must not mutate
+
+    Parameters
+    ----------
+    method : str
+      HTTP method to use
+
+    endpoint : str
+      The endpoint to call
+
+    data : Optional[Dict[str, Any]]
+      Data to submit to the call, sent as JSON
+
+    reason : Optional[str]
+      Reason of modification / call, sent as the audit log reason
+
+    Returns
+    -------
+    Any
+      The decoded JSON body, or ` None ` if the response has no content
+
+    Raises
+    ------
+    RateLimited
+      The request was still rate limited after ` max_retries ` retries
+    """
+    if method != "GET":
+      _, response = self._send(method, endpoint, data = data, reason = reason)
+      if self._responses: self.invalidate(endpoint)
+      return response
+    flight, leading = self._join(endpoint)
+    if not leading: return flight.result()
+    return self._lead(endpoint, flight)
+
+
+  async def arequest(
+    self,
+    method   : str,
+    endpoint : str,
+    *,
+    data     : Optional[Dict[str, Any]] = None,
+    reason   : Optional[str]            = None
+  ) -> Any:
+    """
+    Sends a request without blocking the running event loop. The request waits for its rate limit bucket on the event loop, then at most ` max_concurrency ` HTTP exchanges are in flight at once. A GET request joining an identical in-flight one waits for its result without sending anything, and cancelling any caller of a shared GET request never cancels it for the others
+
+    Parameters
+    ----------
+    method : str
+      HTTP method to use
+
+    endpoint : str
+      The endpoint to call
+
+    data : Optional[Dict[str, Any]]
+      Data to submit to the call, sent as JSON
+
+    reason : Optional[str]
+      Reason of modification / call, sent as the audit log reason
+
+    Returns
+    -------
+    Any
+      The decoded JSON body, or ` None ` if the response has no content
+
+    Raises
+    ------
+    RateLimited
+      The request was still rate limited after ` max_retries ` retries
+    """
+    if method != "GET":
+      _, response = await self._asend(method, endpoint, data = data, reason = reason)
+      if self._responses: self.invalidate(endpoint)
+      return response
+    flight, leading = self._join(endpoint)
+    if not leading: return await shield(wrap_future(flight))
+    task : Task = create_task(self._alead(endpoint, flight))
+    return await shield(task)
+
+
+  def invalidate(
+    self,
+    endpoint : Optional[str] = None
+  ) -> None:
+    """
+    Drops the cached GET responses of a resource, or every cached response. A resource covers the resources it is nested in and the ones nested in it, so a change to ` /guilds/1/members/2/roles/3 ` also drops ` /guilds/1/members/2 ` and ` /guilds/1/members?limit=1000 `
+
+    Parameters
+    ----------
+    endpoint : Optional[str]
+      The endpoint of the resource. Defaults to every endpoint
+    """
+    with self._flight_lock:
+      if endpoint is None:
+        self._responses.clear()
+        return
+      path : str = endpoint.split("?", 1)[0].rstrip("/") + "/"
+      for cached in [cached for cached in self._responses if self._related(path, cached)]:
+        del self._responses[cached]
+
+
+  @staticmethod
+  def _related(
+    path     : str,
+    endpoint : str
+  ) -> bool:
+    """
+    Whether an endpoint is the resource at a path, one it is nested in, or one nested in it. The path ends with a slash so segments are never matched partially
+    """
+    other : str = endpoint.split("?", 1)[0].rstrip("/") + "/"
+    return path.startswith(other) or other.startswith(path)
+
+
+  def _join(
+    self,
+    endpoint : str
+  ) -> Tuple[Future, bool]:
+    """
+    Returns the flight answering a GET endpoint, and whether the caller must send the request. A cached response is returned as an already resolved flight
+    """
+    with self._flight_lock:
+      cached : Optional[Tuple[float, Any]] = self._responses.get(endpoint)
+      if cached and cached[0] > monotonic():
+        self.coalesced += 1
+        flight : Future = Future()
+        flight.set_result(cached[1])
+        return flight, False
+      flight : Optional[Future] = self._flights.get(endpoint)
+      if flight:
+        self.coalesced += 1
+        return flight, False
+      flight : Future = Future()
+      self._flights[endpoint] = flight
+      return flight, True
+
+
+  def _abandon(
+    self,
+    endpoint : str,
+    flight   : Future,
+    error    : BaseException
+  ) -> None:
+    """
+    Fails a flight whose request will never be sent, so later GET requests to the endpoint start a new one instead of joining it
+    """
+    with self._flight_lock:
+      if self._flights.get(endpoint) is flight: self._flights.pop(endpoint)
+    if not flight.done(): flight.set_exception(error)
+
+
+  def _lead(
+    self,
+    endpoint : str,
+    flight   : Future
+  ) -> Any:
+    """
+    Sends a GET request on behalf of every caller sharing its flight, and caches the response if it succeeded and its route has a TTL
+    """
+    try:
+      status, response = self._send("GET", endpoint)
+    except BaseException as error:
+      self._abandon(endpoint, flight, error)
+      raise
+    self._settle(endpoint, flight, status, response)
+    return response
+
+
+  async def _alead(
+    self,
+    endpoint : str,
+    flight   : Future
+  ) -> Any:
+    """
+    Sends a GET request on behalf of every caller sharing its flight without blocking the event loop, and caches the response if it succeeded and its route has a TTL
+    """
+    try:
+      status, response = await self._asend("GET", endpoint)
+    except BaseException as error:
+      self._abandon(endpoint, flight, error)
+      raise
+    self._settle(endpoint, flight, status, response)
+    return response
+
+
+  def _settle(
+    self,
+    endpoint : str,
+    flight   : Future,
+    status   : int,
+    response : Any
+  ) -> None:
+    """
+    Resolves a flight, and caches its response if it succeeded and its route has a TTL
+    """
+    ttl : Optional[float] = self.response_ttls.get(self.ratelimiter.route("GET", endpoint)[0]) if self.response_ttls and 200 <= status < 300 else None
+    with self._flight_lock:
+      if self._flights.get(endpoint) is flight: self._flights.pop(endpoint)
+      if ttl: self._responses[endpoint] = (monotonic() + ttl, response)
+    if not flight.done(): flight.set_result(response)
+
+
+  def _send(
+    self,
+    method   : str,
+    endpoint : str,
+    *,
+    data     : Optional[Dict[str, Any]] = None,
+    reason   : Optional[str]            = None
+  ) -> Tuple[int, Any]:
+    """
+    Sends a request, waiting for its rate limit bucket and retrying it while it gets rate limited. Returns the status code and the decoded body
+    """
+    headers, body = self._prepare(data, reason)
+    for _ in range(self.max_retries + 1):
+      bucket : Bucket = self.ratelimiter.acquire(method, endpoint)
+      retry_after, response = self._exchange(method, endpoint, bucket, headers, body)
+      if retry_after is None: break
+    else:
+      raise RateLimited.from_data(self.codec.decode(response.content) if response.content else None)
+    return response.status_code, self.codec.decode(response.content) if response.content else None
+
+
+  async def _asend(
+    self,
+    method   : str,
+    endpoint : str,
+    *,
+    data     : Optional[Dict[str, Any]] = None,
+    reason   : Optional[str]            = None
+  ) -> Tuple[int, Any]:
+    """
+    Sends a request like ` _send `, but waits for its rate limit bucket on the event loop and only hands the HTTP exchange itself to a worker
+    """
+    headers, body = self._prepare(data, reason)
+    for _ in range(self.max_retries + 1):
+      bucket : Bucket = await self.ratelimiter.aacquire(method, endpoint)
+      try:
+        exchange : Future = self.executor.submit(self._exchange, method, endpoint, bucket, headers, body)
+      except BaseException:
+        bucket.release()
+        raise
+      try:
+        retry_after, response = await wrap_future(exchange)
+      except CancelledError:
+        if exchange.cancelled(): bucket.release()
+        raise
+      if retry_after is None: break
+    else:
+      raise RateLimited.from_data(self.codec.decode(response.content) if response.content else None)
+    return response.status_code, self.codec.decode(response.content) if response.content else None
+
+
+  def _prepare(
+    self,
+    data   : Optional[Dict[str, Any]],
+    reason : Optional[str]
+  ) -> Tuple[Dict[str, str], Optional[Union[bytes, str]]]:
+    """
+    Builds the headers and the encoded body of a request
+    """
+    headers : Dict[str, str] = {}
+    if data is not None: headers["Content-Type"]       = "application/json"
+    if reason:           headers["X-Audit-Log-Reason"] = reason
+    return headers, self.codec.encode(data) if data is not None else None
+
+
+  def _exchange(
+    self,
+    method   : str,
+    endpoint : str,
+    bucket   : Bucket,
+    headers  : Dict[str, str],
+    body     : Optional[Union[bytes, str]]
+  ) -> Tuple[Optional[float], requests.Response]:
+    """
+    Sends a request taken from its bucket once, and records the rate limit headers of the response
+
+    Returns
+    -------
+    Tuple[Optional[float], requests.Response]
+      Seconds to wait before retrying if the request was rate limited, otherwise ` None `, and the response
+    """
+    try:
+      response : requests.Response = self.session.request(
+        method,
+        f"{self.api}{endpoint}",
+        headers = headers,
+        data    = body,
+        timeout = self.timeout
+      )
+    except Exception:
+      bucket.release()
+      raise
+    return self.ratelimiter.update(method, endpoint, bucket, response), response
+
+
+  def close(
+    self
+  ) -> None:
+    """
+    Stops the request workers and closes every pooled connection of the session
+    """
+    self.executor.shutdown(wait = False, cancel_futures = True)
+    self.session.close()
\ No newline at end of file
@@ -0,0 +1,410 @@
+from .enums      import PayloadType
+from .errors     import HTTPException
+from .member     import Member
+from .payloads   import Payload
+from .reqs       import GET
+from asyncio     import (
+                        AbstractEventLoop,
+                        Queue,
+                        Semaphore,
+                        Task,
+                        create_task,
+                        get_running_loop,
+                        wait_for
+                        )
+from collections import deque
+from typing      import *
+
+if TYPE_CHECKING:
+  from .guild    import Guild
+  from .ws       import DiscordWebSocket
+
+
+class MemberIterator:
+  """
+  Async iterator over the members of a guild, walking ` GET /guilds/{guild.id}/members ` page by page in ascending ID order
+
+  Pages never ask for more members than remain of ` limit `, and no page is prefetched once the current one reaches it. The next page is requested while the current one is consumed, and members are built one at a time as they are yielded, so only the current page and the prefetched one are ever held. Stopping early with ` aclose ` ( e.g. through ` contextlib.aclosing ` ) or dropping the iterator cancels the prefetched page request
+
+
+  Attributes
+  ----------
+  cursor : int
+    ID of the last yielded member. Pass it as ` after ` to resume an interrupted iteration
+
+  guild : Guild
+    Guild the members belong to
+
+  limit : Optional[int]
+    Maximum number of members to yield, if any
+
+  page_size : int
+    Maximum number of members requested per page
+  """
+
+  def __init__(
+    self,
+    guild     : "Guild",
+    *,
+    limit     : Optional[int]       = None,
+    page_size : int                 = 1_000,
+    after     : int                 = 0,
+    prefetch  : bool                = True,
+    semaphore : Optional[Semaphore] = None,
+    cache     : bool                = False
+  ) -> None:
+    """
+    Parameters
+    ----------
+    guild : Guild
+      Guild to iterate the members of
+
+    limit : Optional[int]
+      Maximum number of members to yield. Defaults to every member
+
+    page_size : Optional[int]
+      Number of members requested per page, between 1 and 1,000. Defaults to 1,000
+
+    after : Optional[int]
+      Only yield members with a higher ID, e.g. the ` cursor ` of an interrupted iteration. Defaults to 0
+
+    prefetch : Optional[bool]
+      Whether to request the next page while the current one is consumed. Defaults to True
+
+    semaphore : Optional[Semaphore]
+      Semaphore bounding the page requests in flight. Share one between iterators to limit concurrent exports. Defaults to no limit
+
+    cache : Optional[bool]
+      Whether to add the yielded members to the guild's member cache. Defaults to False
+    """
+    if not 1 <= page_size <= 1_000: raise ValueError("page_size: must be between 1 and 1,000")
+    if limit is not None and limit < 0: raise ValueError("limit: must be 0 or greater")
+    if after < 0: raise ValueError("after: must be 0 or greater")
+    self.cursor        : int                   = after
+    self.guild         : "Guild"               = guild
+    self.limit         : Optional[int]         = limit
+    self.page_size     : int                   = page_size
+    self._cache        : bool                  = cache
+    self._done         : bool                  = False
+    self._page         : Deque[Dict[str, Any]] = deque()
+    self._pending      : Optional[Task]        = None
+    self._pending_size : int                   = 0
+    self._prefetch     : bool                  = prefetch
+    self._semaphore    : Optional[Semaphore]   = semaphore
+    self._yielded      : int                   = 0
+
+
+  def __aiter__(
+    self
+  ) -> Self:
+    return self
+
+
+  async def __anext__(
+    self
+  ) -> Member:
+    if self.limit is not None and self._yielded >= self.limit:
+      self.close()
+      raise StopAsyncIteration
+    while not self._page:
+      if self._done: raise StopAsyncIteration
+      await self._next_page()
+    member : Member = Member.from_data(self.guild.ws, self._page.popleft(), self.guild)
+    if self._cache: self.guild.members.add(member)
+    self.cursor   : int = member.id
+    self._yielded += 1
+    return member
+
+
+  async def aclose(
+    self
+  ) -> None:
+    """
+    Stops the iteration early, cancelling the prefetched page request if any
+    """
+    self.close()
+
+
+  def __del__(
+    self
+  ) -> None:
+    pending : Optional[Task] = getattr(self, "_pending", None)
+    if pending and not pending.done() and not pending.get_loop().is_closed(): pending.get_loop().call_soon_threadsafe(pending.cancel)
+
+
+  def close(
+    self
+  ) -> None:
+    """
+    Cancels the prefetched page request, if any. Called once the iteration reaches its limit or fails
+    """
+    if self._pending: self._pending.cancel()
+    self._pending : Optional[Task] = None
+    self._done    : bool           = True
+
+
+  @staticmethod
+  async def _fetch(
+    guild     : "Guild",
+    page_size : int,
+    after     : int,
+    semaphore : Optional[Semaphore]
+  ) -> List[Dict[str, Any]]:
+    """
+    Requests the page of members following an ID. Holds no reference to the iterator, so an abandoned iterator can be collected while its prefetch is in flight
+    """
+    if not semaphore: return await guild.ws.get(GET.members(guild.id, page_size, after))
+    async with semaphore:
+      return await guild.ws.get(GET.members(guild.id, page_size, after))
+
+
+  def _size(
+    self,
+    buffered : int
+  ) -> int:
+    """
+    Returns the number of members to request for the page following ` buffered ` members not yet yielded, bounded by what remains of the limit
+    """
+    if self.limit is None: return self.page_size
+    return min(self.page_size, self.limit - self._yielded - buffered)
+
+
+  async def _next_page(
+    self
+  ) -> None:
+    """
+    Waits for the next page, and starts prefetching the one after it unless the limit is reached within this one
+    """
+    size          : int                  = self._pending_size if self._pending else self._size(0)
+    task          : Task                 = self._pending or create_task(self._fetch(self.guild, size, self.cursor, self._semaphore))
+    self._pending : Optional[Task]       = None
+    page          : List[Dict[str, Any]] = await task or []
+    if not isinstance(page, list):
+      self.close()
+      raise HTTPException.from_data(page)
+    following     : int                  = self._size(len(page))
+    if len(page) < size or following <= 0:
+      self._done : bool = True
+    elif self._prefetch:
+      self._pending      : Optional[Task] = create_task(self._fetch(self.guild, following, int(page[-1]["user"]["id"]), self._semaphore))
+      self._pending_size : int            = following
+    self._page.extend(page)
+
+
+class MemberChunk:
+  """
+  Chunk of members received over the gateway in reply to a member request
+
+
+  Attributes
+  ----------
+  chunk_count : int
+    Total number of chunks answering the request
+
+  chunk_index : int
+    Index of this chunk, from 0 to ` chunk_count - 1 `
+
+  members : List[Member]
+    Members of the chunk
+
+  nonce : Optional[str]
+    Nonce of the request the chunk answers
+
+  not_found : List[int]
+    Requested user IDs that are not members of the guild
+  """
+
+  __slots__ : Tuple[str, ...] = ("chunk_count", "chunk_index", "members", "nonce", "not_found")
+
+  def __init__(
+    self,
+    data    : Dict[str, Any],
+    members : List[Member]
+  ) -> None:
+    self.chunk_count : int           = data["chunk_count"]
+    self.chunk_index : int           = data["chunk_index"]
+    self.members     : List[Member]  = members
+    self.nonce       : Optional[str] = data.get("nonce")
+    self.not_found   : List[int]     = [int(user_id) for user_id in data.get("not_found", ())]
+
+
+class MemberChunkIterator:
+  """
+  Async iterator over the chunks of members sent by the gateway in reply to a ` REQUEST_GUILD_MEMBERS ` payload. The request is sent on the first iteration, through the shard that receives the guild's events, and the chunks are added to the member cache as they arrive, whether or not they are consumed
+
+  Requests across every guild share the application's ` member_requests ` semaphore, so a cold start does not flood the gateway. A request gives its slot back once its last chunk arrived, or once it is stopped with ` aclose `, times out or is dropped
+
+
+  Attributes
+  ----------
+  chunk_count : Optional[int]
+    Total number of chunks, known once the first one arrived
+
+  chunk_index : int
+    Index of the last yielded chunk, ` -1 ` before the first one
+
+  guild : Guild
+    Guild the members belong to
+
+  nonce : str
+    Nonce matching the chunks to the request, unique within the application
+
+  received : int
+    Number of members yielded so far
+
+  timeout : Optional[float]
+    Seconds to wait for each chunk
+  """
+
+  def __init__(
+    self,
+    guild     : "Guild",
+    *,
+    query     : str                     = "",
+    limit     : int                     = 0,
+    user_ids  : Optional[Iterable[int]] = None,
+    presences : bool                    = False,
+    timeout   : Optional[float]         = 30.0
+  ) -> None:
+    """
+    Parameters
+    ----------
+    guild : Guild
+      Guild to request the members of
+
+    query : Optional[str]
+      Prefix the usernames must start with. Defaults to every member
+
+    limit : Optional[int]
+      Maximum number of members to send, ` 0 ` for no limit. Defaults to ` 0 `
+
+    user_ids : Optional[Iterable[int]]
+      IDs of the members to send, instead of a query
+
+    presences : Optional[bool]
+      Whether to also send the members' presences. Defaults to False
+
+    timeout : Optional[float]
+      Seconds to wait for each chunk. Defaults to ` 30.0 `
+    """
+    self.chunk_count : Optional[int]                = None
+    self.chunk_index : int                          = -1
+    self.guild       : "Guild"                      = guild
+    self.nonce       : str                          = f"{guild.id}.{next(guild.ws.app.member_nonces)}"
+    self.received    : int                          = 0
+    self.timeout     : Optional[float]              = timeout
+    self._done       : bool                         = False
+    self._loop       : Optional[AbstractEventLoop]  = None
+    self._queue      : Queue                        = Queue()
+    self._released   : bool                         = True
+    self._ws         : Optional["DiscordWebSocket"] = None
+    self._data       : Dict[str, Any]               = {
+      "guild_id"  : str(guild.id),
+      "limit"     : limit,
+      "presences" : presences,
+      "nonce"     : self.nonce
+    }
+    if user_ids is not None: self._data["user_ids"] = [str(user_id) for user_id in user_ids]
+    else:                    self._data["query"]    = query
+
+
+  def __aiter__(
+    self
+  ) -> Self:
+    return self
+
+
+  async def __anext__(
+    self
+  ) -> MemberChunk:
+    if self._ws is None: await self._send()
+    if self._done and self._queue.empty(): raise StopAsyncIteration
+    try:
+      chunk : Optional[MemberChunk] = await wait_for(self._queue.get(), self.timeout)
+    except TimeoutError:
+      self.close()
+      raise
+    if chunk is None: raise StopAsyncIteration
+    self.chunk_count : int = chunk.chunk_count
+    self.chunk_index : int = chunk.chunk_index
+    self.received    += len(chunk.members)
+    return chunk
+
+
+  async def members(
+    self
+  ) -> List[Member]:
+    """
+    Waits for every chunk and returns their members
+
+    Returns
+    -------
+    List[Member]
+    """
+    try:
+      return [member async for chunk in self for member in chunk.members]
+    finally:
+      self.close()
+
+
+  async def aclose(
+    self
+  ) -> None:
+    """
+    Stops waiting for chunks and releases the request's slot
+    """
+    self.close()
+
+
+  def __del__(
+    self
+  ) -> None:
+    if getattr(self, "_released", True): return
+    loop : Optional[AbstractEventLoop] = self._loop
+    if loop and not loop.is_closed(): loop.call_soon_threadsafe(self.guild.ws.app.member_requests.release)
+
+
+  def close(
+    self
+  ) -> None:
+    """
+    Stops waiting for chunks and releases the request's slot
+    """
+    if self._ws: self._ws.member_requests.pop(self.nonce, None)
+    if not self._released: self.guild.ws.app.member_requests.release()
+    self._released : bool = True
+    self._done     : bool = True
+
+
+  def feed(
+    self,
+    chunk : MemberChunk
+  ) -> None:
+    """
+    Queues a chunk received by the gateway. Called on the dispatcher's event loop
+    """
+    if self._done: return
+    self._queue.put_nowait(chunk)
+    if chunk.chunk_index + 1 >= chunk.chunk_count:
+      self.close()
+      self._queue.put_nowait(None)
+
+
+  async def _send(
+    self
+  ) -> None:
+    """
+    Waits for a request slot and sends the request through the guild's shard
+    """
+    app : Any = self.guild.ws.app
+    await app.member_requests.acquire()
+    self._loop     : AbstractEventLoop  = get_running_loop()
+    self._released : bool               = False
+    self._ws       : "DiscordWebSocket" = app.shard_for(self.guild.id) or self.guild.ws
+    self._ws.member_requests[self.nonce] = self
+    await self._ws.asend(
+      Payload(
+        op = PayloadType.RequestGuildMembers,
+        d  = self._data
+      )
+    )
\ No newline at end of file
@@ -1,12 +1,59 @@
-from .channels import VoiceChannel
-from .reqs import PATCH
-from .role import Role
-from .user  import User
-from datetime import datetime, timedelta
-from typing import *
+from .channels    import GuildChannel
+from .enums       import PermissionFlags
+from .errors      import HTTPException
+from .model       import (
+                         Model,
+                         lazy_property
+                         )
+from .permissions import Permissions
+from .reqs        import PATCH
+from .role        import Role
+from .user        import User
+from datetime     import datetime, timedelta
+from typing       import *
 
+if TYPE_CHECKING:
+  from .guild import Guild
+  from .ws    import DiscordWebSocket
 
-class Member:
+
+class BulkEditResult:
+  """
+  Outcome of the edit of one member in a bulk edit
+
+
+  Attributes
+  ----------
+  error : Optional[Exception]
+    Error that made the edit fail, if any
+
+  member : Optional[Member]
+    Edited member, if it could be resolved
+
+  member_id : int
+    ID of the member
+  """
+
+  __slots__ : Tuple[str, ...] = ("error", "member", "member_id")
+
+  def __init__(
+    self,
+    member_id : int,
+    member    : Optional["Member"]  = None,
+    error     : Optional[Exception] = None
+  ) -> None:
+    self.error     : Optional[Exception] = error
+    self.member    : Optional[Member]    = member
+    self.member_id : int                 = member_id
+
+  def __bool__(self) -> bool:
+    return self.error is None
+
+  def __repr__(self) -> str:
+    return f"BulkEditResult(member_id={self.member_id}, error={self.error!r})"
+
+
+class Member(Model):
   """
   Represents a Discord guild member
 
@@ -20,44 +67,155 @@ class Member:
     Corresponding User object of the member
   """
 
+  __slots__ : Tuple[str, ...] = (
+    "_role_ids",
+    "_user",
+    "guild",
+    "id",
+    "ws"
+  )
+
+  @lazy_property
+  def role_ids(
+    self
+  ) -> FrozenSet[int]:
+    """
+    IDs of the member's roles, without the ` @everyone ` role
+
+
+    Returns
+    -------
+    FrozenSet[int]
+    """
+
+    return frozenset(int(role_id) for role_id in self._data.get("roles", ()))
+
+
   @property
-  def id(
+  def roles(
     self
-  ) -> int:
+  ) -> List[Role]:
     """
-    Returns the ID of the member
+    The member's roles cached in its guild, without the ` @everyone ` role
 
 
     Returns
     -------
-    int
+    List[Role]
+    """
+
+    if not self.guild: return []
+    return [role for role in map(self.guild.roles.get, self.role_ids) if role]
+
+
+  @lazy_property
+  def user(
+    self
+  ) -> User:
     """
+    Corresponding User object of the member, built on first access
 
-    return self.user.id
+
+    Returns
+    -------
+    User
+    """
+
+    return User.from_data(self._data["user"])
+
+
+  def permissions_in(
+    self,
+    channel : Optional[GuildChannel] = None
+  ) -> Permissions:
+    """
+    Returns the effective permissions of the member in its guild, or in one of the guild's channels
+
+
+    Parameters
+    ----------
+    channel : Optional[GuildChannel]
+      Channel to apply the permission overwrites of. Defaults to the guild-level permissions
+
+
+    Returns
+    -------
+    Permissions
+    """
+
+    return self.guild.permissions_for(self, channel)
 
   async def add_roles(
     self,
     *roles : Role,
     reason : Optional[str] = None
-  ) -> Member:
-    try:
-      # check permission: manage_roles
-      for role in roles:
-        if not isinstance(role, Role): raise TypeError("roles: must be of type <Role>")
-        if role in self.roles: continue
-        response : Dict[str, Any] = self.ws.put(
-          PUT.member_role(self.guild.id, self.id, role.id),
-          reason = reason
-        )
-        self : Self = Member.from_data(self.ws, response)
-      return self
-    except Exception as error:
-      if self.ws.app.logger: self.ws.app.logger.error(error)
+  ) -> Self:
+    """
+    Adds roles to the member, in a single request
+
+
+    Parameters
+    ----------
+    *roles : Role
+      Roles to add
+
+    reason : Optional[str]
+      Reason of the modification, shown in the audit log
+
+
+    Returns
+    -------
+    Member
+    """
+
+    return await self.edit_roles(add = roles, reason = reason)
+
+  async def edit_roles(
+    self,
+    *,
+    add    : Iterable[Role] = (),
+    remove : Iterable[Role] = (),
+    reason : Optional[str]  = None
+  ) -> Self:
+    """
+    Adds and removes roles of the member with a single ` PATCH ` of the merged role list. No request is sent if the roles would not change
+
+
+    Parameters
+    ----------
+    add : Optional[Iterable[Role]]
+      Roles to add
+
+    remove : Optional[Iterable[Role]]
+      Roles to remove
+
+    reason : Optional[str]
+      Reason of the modification, shown in the audit log
+
+
+    Returns
+    -------
+    Member
+
+
+    Raises
+    ------
+    BotMissingPermissions
+      The application lacks the ` manage_roles ` permission
+
+    HTTPException
+      Discord rejected the modification
+    """
+
+    self.guild.check_permissions(PermissionFlags.manage_roles)
+    role_ids : Optional[FrozenSet[int]] = self._merge_roles(add, remove)
+    if role_ids is not None: await self._patch({"roles": [str(role_id) for role_id in role_ids]}, reason)
+    return self
 
   async def edit(
     self,
     **attributes
-  ) -> Member:
+  ) -> Self:
     try:
       data : Dict[str, Any] = {}
       reason : Optional[str] = None
@@ -65,38 +223,32 @@ class Member:
         match attribute:
           case "nick":
             if not isinstance(attributes[attribute], str): raise TypeError("nick: must be of type <str>")
-            # check permission: manage_nicknames
+            self.guild.check_permissions(PermissionFlags.manage_nicknames)
             data[attribute] : str = attributes[attribute]
           case "roles":
             if isinstance(attributes[attribute], list):
               for role in attributes[attribute]:
                 if not isinstance(role, Role): raise ValueError("roles: must contain <Role> objects")
-              # check permission: manage_roles
+              self.guild.check_permissions(PermissionFlags.manage_roles)
               data[attribute] : List[Role] = [role.id for role in attributes[attribute]]
               data[attribute] += [role.id for role in self.roles if role not in data[attribute]]
             else: raise TypeError("roles: must be of type <list> containing <Role> objects")
           case "mute":
             if not isinstance(attributes[attribute], bool): raise TypeError("mute: must be of type <bool>")
-            # check permission: mute_members
+            self.guild.check_permissions(PermissionFlags.mute_members)
             data[attribute] : bool = attributes[attribute]
           case "deaf":
             if not isinstance(attributes[attribute], bool): raise TypeError("deaf: must be of type <bool>")
-            # check permission: deafen_members
+            self.guild.check_permissions(PermissionFlags.deafen_members)
             data[attribute] : bool = attributes[attribute]
           case "voice_channel":
-            if not isinstance(attributes[attribute], VoiceChannel): raise TypeError("voice_channel: must be of type <VoiceChannel>")
-            # check permission: move_members
+            if not isinstance(attributes[attribute], GuildChannel): raise TypeError("voice_channel: must be of type <GuildChannel>")
+            self.guild.check_permissions(PermissionFlags.move_members, channel = attributes[attribute])
             data[attribute] : int = attributes[attribute].id
           case "reason":
             if not isinstance(attributes[attribute], str): raise TypeError("reason: must be of type <str>")
-            reason : Optional[str] = reason
-      response : Dict[str, Any] = self.ws.patch(
-        PATCH.member(self.guild.id, self.id),
-        data = data,
-        reason = reason
-      )
-      self : Self = Member.from_data(self.ws, response)
-      return self
+            reason : Optional[str] = attributes[attribute]
+      return await self._patch(data, reason)
     except Exception as error:
       if self.ws.app.logger: self.ws.app.logger.error(error)
 
@@ -113,66 +265,124 @@ class Member:
     self,
     *roles : Role,
     reason : Optional[str] = None
-  ) -> Member:
-    try:
-      # check permission: manage_roles
-      for role in roles:
-        if not isinstance(role, Role): raise TypeError("roles: must be of type <Role>")
-        if role in self.roles: continue
-        response : Dict[str, Any] = self.ws.delete(
-          DELETE.member_role(self.guild.id, self.id, role.id),
-          reason = reason
-        )
-        self : Self = Member.from_data(self.ws, response)
-      return self
-    except Exception as error:
-      if self.ws.app.logger: self.ws.app.logger.error(error)
+  ) -> Self:
+    """
+    Removes roles from the member, in a single request
+
+
+    Parameters
+    ----------
+    *roles : Role
+      Roles to remove
+
+    reason : Optional[str]
+      Reason of the modification, shown in the audit log
+
+
+    Returns
+    -------
+    Member
+    """
+
+    return await self.edit_roles(remove = roles, reason = reason)
 
   async def timeout(
     self,
     until : Optional[timedelta] = None,
     reason : Optional[str] = None
-  ) -> Member:
+  ) -> Self:
     try:
       if until and not isinstance(until, timedelta): raise TypeError("until: must be of type <timedelta> or <NoneType>")
       if reason and not isinstance(reason, str): raise TypeError("reason: must be of type <str>")
+      self.guild.check_permissions(PermissionFlags.moderate_members)
       if until: until += datetime.now()
-      response : Dict[str, Any] = self.ws.patch(
+      response : Dict[str, Any] = await self.ws.patch(
         PATCH.member(self.guild.id, self.id),
         data = {
           "communication_disabled_until": until.timestamp()
         },
         reason = reason
       )
-      # check permission: moderate_members
-      self : Self = Member.from_data(self.ws, response)
+      self : Self = Member.from_data(self.ws, response, self.guild)
       return self
     except Exception as error:
       if self.ws.app.logger: self.ws.app.logger.error(error)
 
+  def _merge_roles(
+    self,
+    add    : Iterable[Role],
+    remove : Iterable[Role]
+  ) -> Optional[FrozenSet[int]]:
+    """
+    Returns the role IDs of the member once roles are added and removed, or ` None ` if they would not change
+    """
+    added   : Set[int] = set()
+    removed : Set[int] = set()
+    for roles, ids in ((add, added), (remove, removed)):
+      for role in roles:
+        if not isinstance(role, Role): raise TypeError("roles: must be of type <Role>")
+        ids.add(role.id)
+    role_ids : FrozenSet[int] = (self.role_ids | added) - removed
+    return role_ids if role_ids != self.role_ids else None
+
+  async def _patch(
+    self,
+    data   : Dict[str, Any],
+    reason : Optional[str] = None
+  ) -> Self:
+    """
+    Sends a ` PATCH ` of the member and applies the returned payload in place, to this member and to the guild's cached one, then drops the member's memoized permissions
+
+    Raises
+    ------
+    HTTPException
+      Discord rejected the modification
+    """
+    response : Optional[Dict[str, Any]] = await self.ws.patch(
+      PATCH.member(self.guild.id, self.id),
+      data   = data,
+      reason = reason
+    )
+    if not response or "user" not in response: raise HTTPException.from_data(response)
+    self._update(response)
+    cached : Optional[Self] = self.guild.members.get(self.id)
+    if cached is not None:
+      if cached is not self: cached._update(response)
+      self.guild.members.add(cached)
+    self.guild.resolver.invalidate_member(self.id)
+    return self
+
   @classmethod
   def from_data(
     cls,
-    data : Dict[str, Any]
+    ws    : "DiscordWebSocket",
+    data  : Dict[str, Any],
+    guild : Optional["Guild"] = None
   ) -> Self:
     """
-    Construct a Member object from a dictionary payload
+    Construct a Member object from a dictionary payload. The payload is kept as is and read from on access
 
 
     Parameters
     ----------
+    ws : DiscordWebSocket
+      Active websocket of the discord gateway connection
+
     data : Dict[str, Any]
       Dictionary payload of a Member object
 
+    guild : Optional[Guild]
+      Guild the member belongs to
+
 
     Returns
     -------
     Member
     """
 
-    member : Self = cls()
-    for attribute in data:
-      match attribute:
-        case "user": member.__dict__[attribute] : User = User.from_data(data[attribute])
-        case "nick": member.__dict__[attribute] : str  = data[attribute]
+    member       : Self             = cls()
+    member._data : Dict[str, Any]   = data
+    member.guild : Optional[Guild]  = guild
+    member.id    : int              = int(data["user"]["id"])
+    member.ws    : DiscordWebSocket = ws
     return member
\ No newline at end of file
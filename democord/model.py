@@ -0,0 +1,93 @@
+from typing import *
+
+
+class lazy_property:
+  """
+  Property computed from the raw payload on first access and cached in the ` _<name> ` slot of the model, which the model must declare
+  """
+
+  __slots__ : Tuple[str, ...] = ("function", "name", "slot")
+
+  def __init__(
+    self,
+    function : Callable[[Any], Any]
+  ) -> None:
+    self.function : Callable[[Any], Any] = function
+    self.name     : str                  = function.__name__
+    self.slot     : Any                  = None
+
+
+  def __set_name__(
+    self,
+    owner : type,
+    name  : str
+  ) -> None:
+    self.name : str = name
+    self.slot : Any = owner.__dict__[f"_{name}"]
+
+
+  def __get__(
+    self,
+    instance : Any,
+    owner    : Optional[type] = None
+  ) -> Any:
+    if instance is None: return self
+    try:
+      return self.slot.__get__(instance, owner)
+    except AttributeError:
+      value : Any = self.function(instance)
+      self.slot.__set__(instance, value)
+      return value
+
+
+class Model:
+  """
+  Base of the slotted Discord models. A model keeps the raw payload it was built from in ` _data ` and only parses what it needs up front, usually its ID. Derived fields are ` lazy_property `s cached in slots, and plain payload fields are read from ` _data ` on access
+  """
+
+  __slots__ : Tuple[str, ...] = ("_data",)
+
+  def __init__(
+    self
+  ) -> None:
+    self._data : Optional[Dict[str, Any]] = None
+
+
+  def __getattr__(
+    self,
+    attribute : str
+  ) -> Any:
+    """
+    Looks up plain payload fields. Only called once regular attribute lookup failed
+    """
+    data : Optional[Dict[str, Any]] = object.__getattribute__(self, "_data")
+    if data and attribute in data: return data[attribute]
+    raise AttributeError(f"{type(self).__name__} object has no attribute: {attribute}")
+
+
+  def _update(
+    self,
+    data : Dict[str, Any],
+    *,
+    lazy : bool = True
+  ) -> None:
+    """
+    Applies a partial update of the payload, dropping every lazy field computed from the previous one. The previous payload is never mutated, as it may be shared
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+      Updated fields of the payload
+
+    lazy : Optional[bool]
+      Whether to drop the lazy fields. Pass False for fields no lazy field is computed from. Defaults to True
+    """
+    self._data : Dict[str, Any] = {**self._data, **data} if self._data else data
+    if not lazy: return
+    for cls in type(self).__mro__:
+      for slot in cls.__dict__.get("__slots__", ()):
+        if not slot.startswith("_") or slot == "_data": continue
+        try:
+          delattr(self, slot)
+        except AttributeError:
+          pass
\ No newline at end of file
@@ -150,13 +150,9 @@ class Payload:
 
     match data["op"]:
       case 0:
-        match data["t"]:
-          case "READY":        t : GatewayEvents = GatewayEvents.Ready
-          case "GUILD_CREATE": t : GatewayEvents = GatewayEvents.GuildCreate
-          case _: t = data["t"]
         return cls(
           op = PayloadType.Dispatch,
-          t  = t,
+          t  = GatewayEvents._value2member_map_.get(data["t"], data["t"]),
           s  = data["s"],
           d  = data["d"]
         )
@@ -169,6 +165,11 @@ class Payload:
           op = PayloadType.Reconnect,
           d  = data["d"]
         )
+      case 9:
+        return cls(
+          op = PayloadType.InvalidSession,
+          d  = data["d"]
+        )
       case 10:
         return cls(
           op = PayloadType.Hello,
@@ -1,7 +1,198 @@
-from .enums  import (
-                   PermissionFlags
-                   )
-from typing import *
+from .enums    import PermissionFlags
+from .flags    import FlagSet
+from enum      import Enum
+from threading import Lock
+from typing    import *
 
+if TYPE_CHECKING:
+  from .channels import GuildChannel
+  from .guild    import Guild
+  from .member   import Member
 
-class Permissions: pass
\ No newline at end of file
+
+class Permissions(FlagSet):
+  """
+  Set of permissions, kept as their ` PermissionFlags ` bitfield. Every role and overwrite brings its own bitfield, so permissions are not interned
+  """
+  flags    : Type[Enum]     = PermissionFlags
+  interned : bool           = False
+  _all     : Optional[Self] = None
+
+  @classmethod
+  def all(
+    cls
+  ) -> Self:
+    """
+    Returns the set of every permission. It is built once, since administrators and owners resolve to it on every computation
+
+    Returns
+    -------
+    Permissions
+    """
+    if cls._all is None:
+      value : int = 0
+      for flag in PermissionFlags: value |= flag.value
+      cls._all : Self = cls(value)
+    return cls._all
+
+
+class PermissionResolver:
+  """
+  Computes the effective permissions of a guild's members, in the guild or in one of its channels, from their roles and the channel's permission overwrites
+
+  Results are memoized per member and channel. The guild's gateway events invalidate exactly the results they affect: a member update drops that member's results, an overwrite update drops that channel's results, and a role update drops the results of the members holding the role
+
+
+  Attributes
+  ----------
+  guild : Guild
+    Guild the permissions are computed in
+  """
+
+  def __init__(
+    self,
+    guild : "Guild"
+  ) -> None:
+    self.guild  : "Guild"                                     = guild
+    self._cache : Dict[int, Dict[Optional[int], Permissions]] = {}
+    self._lock  : Lock                                        = Lock()
+
+
+  def compute(
+    self,
+    member  : "Member",
+    channel : Optional["GuildChannel"] = None
+  ) -> Permissions:
+    """
+    Returns the effective permissions of a member
+
+    Parameters
+    ----------
+    member : Member
+      Member of the guild
+
+    channel : Optional[GuildChannel]
+      Channel to apply the permission overwrites of. Defaults to the guild-level permissions
+
+    Returns
+    -------
+    Permissions
+    """
+    channel_id : Optional[int] = channel.id if channel is not None else None
+    with self._lock:
+      results : Dict[Optional[int], Permissions] = self._cache.setdefault(member.id, {})
+      if channel_id in results: return results[channel_id]
+      base : Permissions = results.get(None)
+      if base is None: base = results[None] = self._base(member)
+      if channel is None: return base
+      results[channel_id] = self._apply_overwrites(member, channel, base)
+      return results[channel_id]
+
+
+  def clear(
+    self
+  ) -> None:
+    """
+    Drops every memoized result, e.g. when the guild's owner changes
+    """
+    with self._lock:
+      self._cache.clear()
+
+
+  def invalidate_channel(
+    self,
+    channel_id : int
+  ) -> None:
+    """
+    Drops the memoized results of a channel, after its permission overwrites changed or it was deleted
+
+    Parameters
+    ----------
+    channel_id : int
+      ID of the channel
+    """
+    with self._lock:
+      for results in self._cache.values(): results.pop(channel_id, None)
+
+
+  def invalidate_member(
+    self,
+    member_id : int
+  ) -> None:
+    """
+    Drops the memoized results of a member, after its roles changed or it left
+
+    Parameters
+    ----------
+    member_id : int
+      ID of the member
+    """
+    with self._lock:
+      self._cache.pop(member_id, None)
+
+
+  def invalidate_role(
+    self,
+    role_id : int
+  ) -> None:
+    """
+    Drops the memoized results of the members holding a role, after the role was created, updated or deleted. Every result is dropped for the ` @everyone ` role
+
+    Parameters
+    ----------
+    role_id : int
+      ID of the role
+    """
+    with self._lock:
+      if role_id == self.guild.id:
+        self._cache.clear()
+        return
+      for member_id in list(self._cache):
+        member : Optional["Member"] = self.guild.members.get(member_id)
+        if not member or role_id in member.role_ids: self._cache.pop(member_id, None)
+
+
+  def _base(
+    self,
+    member : "Member"
+  ) -> Permissions:
+    """
+    Computes the guild-level permissions of a member from the ` @everyone ` role and the member's roles
+    """
+    if member.id == int(self.guild.owner_id): return Permissions.all()
+    everyone : Any = self.guild.roles.get(self.guild.id)
+    value    : int = int(everyone.permissions) if everyone else 0
+    for role_id in member.role_ids:
+      role : Any = self.guild.roles.get(role_id)
+      if role: value |= int(role.permissions)
+    if value & PermissionFlags.administrator.value: return Permissions.all()
+    return Permissions(value)
+
+
+  def _apply_overwrites(
+    self,
+    member  : "Member",
+    channel : "GuildChannel",
+    base    : Permissions
+  ) -> Permissions:
+    """
+    Applies a channel's permission overwrites, in order: ` @everyone `, the member's roles, then the member
+    """
+    if int(base) & PermissionFlags.administrator.value: return base
+    overwrites : Dict[int, Tuple[int, int]] = channel.overwrites
+    value      : int                        = int(base)
+    if self.guild.id in overwrites:
+      allow, deny = overwrites[self.guild.id]
+      value = (value & ~deny) | allow
+    role_allow : int = 0
+    role_deny  : int = 0
+    for role_id in member.role_ids:
+      if role_id not in overwrites: continue
+      allow, deny = overwrites[role_id]
+      role_allow |= allow
+      role_deny  |= deny
+    value = (value & ~role_deny) | role_allow
+    if member.id in overwrites:
+      allow, deny = overwrites[member.id]
+      value = (value & ~deny) | allow
+    return Permissions(value)
\ No newline at end of file
@@ -0,0 +1,495 @@
+import re
+
+from asyncio     import sleep as asleep
+from bisect      import insort
+from collections import deque
+from math        import inf
+from threading   import (
+                        Condition,
+                        Lock
+                        )
+from time        import (
+                        monotonic,
+                        sleep,
+                        time
+                        )
+from typing      import *
+
+if TYPE_CHECKING:
+  from requests  import Response
+
+
+class Bucket:
+  """
+  Rate limit state of a single route bucket and major parameter
+
+
+  Attributes
+  ----------
+  limit : Optional[int]
+    Number of requests the bucket allows per window, once known
+
+  pending : bool
+    Whether the first request of the bucket is in flight and its limits are still being discovered
+
+  remaining : Optional[int]
+    Number of requests left in the current window, once known
+
+  reset_at : float
+    Monotonic time at which the current window resets
+
+  rolled : bool
+    Whether the window was reset locally and no response from the new window arrived yet
+
+  unlimited : bool
+    Whether the route answered without rate limit headers
+
+  window : Optional[float]
+    Reset timestamp reported by Discord for the current window
+  """
+
+  tolerance : float = 0.05
+
+  def __init__(
+    self
+  ) -> None:
+    self.condition : Condition       = Condition()
+    self.limit     : Optional[int]   = None
+    self.pending   : bool            = False
+    self.remaining : Optional[int]   = None
+    self.reset_at  : float           = 0.0
+    self.rolled    : bool            = False
+    self.unlimited : bool            = False
+    self.window    : Optional[float] = None
+
+
+  def acquire(
+    self
+  ) -> None:
+    """
+    Blocks until the bucket has a request to spare, then takes it. Requests beyond the remaining count are held until the window resets instead of being sent into a 429
+    """
+    with self.condition:
+      while True:
+        wait : Optional[float] = self._take()
+        if wait is None: return
+        self.condition.wait(None if wait == inf else wait)
+
+
+  def try_acquire(
+    self
+  ) -> Optional[float]:
+    """
+    Takes a request from the bucket if it has one to spare, without blocking
+
+    Returns
+    -------
+    Optional[float]
+      ` None ` if a request was taken, otherwise the seconds to wait before trying again, ` inf ` while the bucket's limits are being discovered
+    """
+    with self.condition:
+      return self._take()
+
+
+  def _take(
+    self
+  ) -> Optional[float]:
+    """
+    Takes a request from the bucket, or returns the seconds to wait for one. Called with the condition held
+    """
+    if self.unlimited: return None
+    now : float = monotonic()
+    if self.remaining is None:
+      if self.pending: return inf
+      self.pending : bool = True
+      return None
+    if self.reset_at <= now:
+      self.remaining : int   = self.limit
+      self.reset_at  : float = now + 1.0
+      self.rolled    : bool  = True
+    if self.remaining > 0:
+      self.remaining -= 1
+      return None
+    return self.reset_at - now
+
+
+  def update(
+    self,
+    limit       : Optional[int],
+    remaining   : Optional[int],
+    reset       : Optional[float],
+    reset_after : Optional[float],
+    success     : bool = True
+  ) -> None:
+    """
+    Updates the bucket from the rate limit headers of a response. A successful response without rate limit headers marks a new bucket as unlimited, a failed one only frees the discovery request
+
+    Parameters
+    ----------
+    limit : Optional[int]
+      Value of the ` X-RateLimit-Limit ` header
+
+    remaining : Optional[int]
+      Value of the ` X-RateLimit-Remaining ` header
+
+    reset : Optional[float]
+      Value of the ` X-RateLimit-Reset ` header, identifying the window the response belongs to
+
+    reset_after : Optional[float]
+      Value of the ` X-RateLimit-Reset-After ` header
+
+    success : Optional[bool]
+      Whether the response has a 2xx status. Defaults to True
+    """
+    with self.condition:
+      self.pending : bool = False
+      if limit is None or remaining is None or reset_after is None:
+        if self.remaining is None and success: self.unlimited : bool = True
+        self.condition.notify_all()
+        return
+      if reset is None: reset = time() + reset_after
+      new_window : bool = True
+      if self.window is not None:
+        if reset < self.window - self.tolerance or (self.rolled and reset <= self.window + self.tolerance):
+          self.condition.notify_all()
+          return
+        new_window : bool = reset > self.window + self.tolerance
+      if self.remaining is None or (new_window and not self.rolled):
+        self.remaining : int = remaining
+      else:
+        self.remaining : int = min(self.remaining, remaining)
+      self.limit    : int   = limit
+      self.reset_at : float = monotonic() + reset_after
+      self.rolled   : bool  = False
+      self.window   : float = reset
+      self.condition.notify_all()
+
+
+  def exhaust(
+    self,
+    retry_after : float
+  ) -> None:
+    """
+    Empties the bucket after a 429 response
+
+    Parameters
+    ----------
+    retry_after : float
+      Seconds until the bucket can be used again
+    """
+    with self.condition:
+      self.pending   : bool  = False
+      self.unlimited : bool  = False
+      self.remaining : int   = 0
+      self.limit     : int   = self.limit or 1
+      self.reset_at  : float = monotonic() + retry_after
+      self.rolled    : bool  = False
+      self.condition.notify_all()
+
+
+  def release(
+    self
+  ) -> None:
+    """
+    Gives back a discovery request that never received a response
+    """
+    with self.condition:
+      self.pending : bool = False
+      self.condition.notify_all()
+
+
+class RateLimiter:
+  """
+  Tracks Discord's per-route and global rate limits for the REST API
+
+
+  Attributes
+  ----------
+  buckets : Dict[Tuple[str, str], Bucket]
+    Buckets keyed by bucket hash ( or route template, until the hash is known ) and major parameter
+
+  global_limit : int
+    Number of requests allowed per second across every route
+
+  global_reset_at : float
+    Monotonic time until which every request is held after a global 429
+
+  hashes : Dict[str, str]
+    Bucket hashes reported by Discord, keyed by route template
+  """
+
+  major_parameters : re.Pattern = re.compile(r"^/(guilds|channels|webhooks)/(\d+)")
+  snowflakes       : re.Pattern = re.compile(r"/\d+")
+
+  def __init__(
+    self,
+    global_limit : int = 50
+  ) -> None:
+    """
+    Parameters
+    ----------
+    global_limit : Optional[int]
+      Number of requests allowed per second across every route. Defaults to ` 50 `
+    """
+    self.buckets         : Dict[Tuple[str, str], Bucket] = {}
+    self.global_limit    : int                           = global_limit
+    self.global_reset_at : float                         = 0.0
+    self.hashes          : Dict[str, str]                = {}
+    self._global_lock    : Lock                          = Lock()
+    self._lock           : Lock                          = Lock()
+    self._sent           : Deque[float]                  = deque(maxlen = global_limit)
+
+
+  @classmethod
+  def route(
+    cls,
+    method   : str,
+    endpoint : str
+  ) -> Tuple[str, str]:
+    """
+    Splits an endpoint into its route template and major parameter
+
+    Parameters
+    ----------
+    method : str
+      HTTP method of the request
+
+    endpoint : str
+      The endpoint to call, as built by the ` reqs ` lambdas
+
+    Returns
+    -------
+    Tuple[str, str]
+      The route template, e.g. ` PUT /guilds/{guild_id}/members/{id}/roles/{id} `, and the major parameter
+    """
+    path  : str                   = endpoint.split("?", 1)[0]
+    major : Optional[re.Match]    = cls.major_parameters.match(path)
+    if major:
+      prefix : str = f"/{major[1]}/{{{major[1][:-1]}_id}}"
+      return f"{method} {prefix}{cls.snowflakes.sub("/{id}", path[major.end():])}", major[2]
+    return f"{method} {cls.snowflakes.sub("/{id}", path)}", ""
+
+
+  def bucket(
+    self,
+    method   : str,
+    endpoint : str
+  ) -> Bucket:
+    """
+    Returns the bucket a request belongs to, creating it if needed
+
+    Parameters
+    ----------
+    method : str
+      HTTP method of the request
+
+    endpoint : str
+      The endpoint to call
+
+    Returns
+    -------
+    Bucket
+    """
+    template, major = self.route(method, endpoint)
+    key : Tuple[str, str] = (self.hashes.get(template, template), major)
+    with self._lock:
+      bucket : Optional[Bucket] = self.buckets.get(key)
+      if not bucket: bucket = self.buckets[key] = Bucket()
+    return bucket
+
+
+  def acquire(
+    self,
+    method   : str,
+    endpoint : str
+  ) -> Bucket:
+    """
+    Blocks until a request may be sent without hitting a rate limit. The global limit is waited on outside of its lock, so a request held by it never holds up the others
+
+    Parameters
+    ----------
+    method : str
+      HTTP method of the request
+
+    endpoint : str
+      The endpoint to call
+
+    Returns
+    -------
+    Bucket
+      The bucket the request was taken from
+    """
+    while (wait := self._take_global()) is not None: sleep(wait)
+    bucket : Bucket = self.bucket(method, endpoint)
+    bucket.acquire()
+    return bucket
+
+
+  async def aacquire(
+    self,
+    method   : str,
+    endpoint : str,
+    poll     : float = 0.05
+  ) -> Bucket:
+    """
+    Waits on the running event loop until a request may be sent without hitting a rate limit. Unlike ` acquire `, no thread is held while waiting
+
+    Parameters
+    ----------
+    method : str
+      HTTP method of the request
+
+    endpoint : str
+      The endpoint to call
+
+    poll : Optional[float]
+      Seconds between two checks while the bucket's limits are being discovered. Defaults to ` 0.05 `
+
+    Returns
+    -------
+    Bucket
+      The bucket the request was taken from
+    """
+    while (wait := self._take_global()) is not None: await asleep(wait)
+    bucket : Bucket = self.bucket(method, endpoint)
+    while (wait := bucket.try_acquire()) is not None: await asleep(poll if wait == inf else wait)
+    return bucket
+
+
+  def _take_global(
+    self
+  ) -> Optional[float]:
+    """
+    Takes a request from the global limit, or returns the seconds to wait for one
+    """
+    with self._global_lock:
+      now : float = monotonic()
+      if self.global_reset_at > now: return self.global_reset_at - now
+      if len(self._sent) == self.global_limit and now - self._sent[0] < 1.0: return 1.0 - (now - self._sent[0])
+      self._sent.append(now)
+      return None
+
+
+  def update(
+    self,
+    method   : str,
+    endpoint : str,
+    bucket   : Bucket,
+    response : "Response"
+  ) -> Optional[float]:
+    """
+    Records the rate limit headers of a response
+
+    Parameters
+    ----------
+    method : str
+      HTTP method of the request
+
+    endpoint : str
+      The endpoint that was called
+
+    bucket : Bucket
+      The bucket the request was taken from
+
+    response : Response
+      Response of the request
+
+    Returns
+    -------
+    Optional[float]
+      Seconds to wait before retrying if the request was rate limited, otherwise ` None `
+    """
+    headers   : Mapping[str, str] = response.headers
+    bucket_id : Optional[str]     = headers.get("X-RateLimit-Bucket")
+    if bucket_id:
+      template, major = self.route(method, endpoint)
+      if self.hashes.get(template) != bucket_id:
+        with self._lock:
+          self.hashes[template] = bucket_id
+          self.buckets.setdefault((bucket_id, major), bucket)
+    if response.status_code == 429:
+      retry_after : float = float(headers.get("Retry-After") or response.json().get("retry_after", 1.0))
+      if headers.get("X-RateLimit-Global"):
+        self.global_reset_at : float = monotonic() + retry_after
+        bucket.release()
+      else:
+        bucket.exhaust(retry_after)
+      return retry_after
+    bucket.update(
+      int(headers["X-RateLimit-Limit"])         if "X-RateLimit-Limit"       in headers else None,
+      int(headers["X-RateLimit-Remaining"])     if "X-RateLimit-Remaining"   in headers else None,
+      float(headers["X-RateLimit-Reset"])       if "X-RateLimit-Reset"       in headers else None,
+      float(headers["X-RateLimit-Reset-After"]) if "X-RateLimit-Reset-After" in headers else None,
+      200 <= response.status_code < 300
+    )
+    return None
+
+
+class GatewayRateLimiter:
+  """
+  Spaces out the payloads sent on a gateway connection, which may send ` limit ` payloads every ` per ` seconds. A few of those slots are kept for heartbeats, which are never delayed
+
+
+  Attributes
+  ----------
+  limit : int
+    Number of payloads allowed per window
+
+  per : float
+    Length of the window, in seconds
+
+  reserved : int
+    Number of slots per window kept for heartbeats
+  """
+
+  def __init__(
+    self,
+    limit    : int   = 120,
+    per      : float = 60.0,
+    reserved : int   = 3
+  ) -> None:
+    """
+    Parameters
+    ----------
+    limit : Optional[int]
+      Number of payloads allowed per window. Defaults to ` 120 `
+
+    per : Optional[float]
+      Length of the window, in seconds. Defaults to ` 60.0 `
+
+    reserved : Optional[int]
+      Number of slots per window kept for heartbeats. Defaults to ` 3 `
+    """
+    self.limit    : int         = limit
+    self.per      : float       = per
+    self.reserved : int         = reserved
+    self._lock    : Lock        = Lock()
+    self._sent    : List[float] = []
+
+
+  def reserve(
+    self,
+    *,
+    heartbeat : bool = False
+  ) -> float:
+    """
+    Reserves a slot for a payload
+
+    Parameters
+    ----------
+    heartbeat : Optional[bool]
+      Whether the payload is a heartbeat. Defaults to False
+
+    Returns
+    -------
+    float
+      Seconds to wait before sending the payload
+    """
+    with self._lock:
+      now : float = monotonic()
+      while self._sent and self._sent[0] <= now - self.per: self._sent.pop(0)
+      capacity : int   = self.limit - self.reserved
+      at       : float = now
+      if not heartbeat and len(self._sent) >= capacity: at = max(now, self._sent[-capacity] + self.per)
+      insort(self._sent, at)
+      return at - now
\ No newline at end of file
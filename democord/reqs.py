@@ -22,6 +22,7 @@ class GET(Enum):
   guild_preview  : Callable[[int], str] = lambda guild_id               : f"/guilds/{guild_id}/preview"
   member         : Callable[[int, int], str] = lambda guild_id, member_id    : f"/guilds/{guild_id}/members/{member_id}"
   members        : Callable[[int, int, int], str] = lambda guild_id, limit, after : f"/guilds/{guild_id}/members?limit={limit}&after={after}"
+  user           : Callable[[int], str] = lambda user_id                : f"/users/{user_id}"
 
 class PATCH(Enum):
   """
@@ -35,5 +36,5 @@ class POST(Enum):
   guild : str = "/guilds"
 
 class PUT(Enum):
-  member : Callable[[int, int], str] = lambda guild_id, user_id : f"/guilds{guild_id}/members/{user_id}"
+  member : Callable[[int, int], str] = lambda guild_id, user_id : f"/guilds/{guild_id}/members/{user_id}"
   member_role : Callable[[int, int, int], str] = lambda guild_id, member_id, role_id : f"/guilds/{guild_id}/members/{member_id}/roles/{role_id}"
\ No newline at end of file
@@ -1 +1,104 @@
-class Role: pass
\ No newline at end of file
+from .model       import (
+                         Model,
+                         lazy_property
+                         )
+from .permissions import Permissions
+from typing       import *
+
+if TYPE_CHECKING:
+  from .guild     import Guild
+
+
+class Role(Model):
+  """
+  Represents a Discord role
+
+
+  Attributes
+  ----------
+  guild : Optional[Guild]
+    Guild the role belongs to
+
+  id : int
+    ID of the role. The ` @everyone ` role has the ID of its guild
+  """
+
+  __slots__ : Tuple[str, ...] = (
+    "_permissions",
+    "guild",
+    "id"
+  )
+
+  def __eq__(
+    self,
+    role : Union[Self, int]
+  ) -> bool:
+    """
+    Compares whether 2 Role objects, or a Role object and an ID, are equal
+
+
+    Returns
+    -------
+    bool
+    """
+
+    return self.id == (role.id if isinstance(role, Role) else role)
+
+
+  def __hash__(
+    self
+  ) -> int:
+    return hash(self.id)
+
+
+  def __int__(
+    self
+  ) -> int:
+    return self.id
+
+
+  @lazy_property
+  def permissions(
+    self
+  ) -> Permissions:
+    """
+    Permissions granted by the role
+
+
+    Returns
+    -------
+    Permissions
+    """
+
+    return Permissions(int(self._data.get("permissions", 0)))
+
+
+  @classmethod
+  def from_data(
+    cls,
+    data  : Dict[str, Any],
+    guild : Optional["Guild"] = None
+  ) -> Self:
+    """
+    Construct a Role object from a dictionary payload. The payload is kept as is and read from on access
+
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+      Dictionary payload of a role
+
+    guild : Optional[Guild]
+      Guild the role belongs to
+
+
+    Returns
+    -------
+    Role
+    """
+
+    role       : Self              = cls()
+    role._data : Dict[str, Any]    = data
+    role.guild : Optional["Guild"] = guild
+    role.id    : int               = int(data["id"])
+    return role
\ No newline at end of file
@@ -0,0 +1,103 @@
+from .payloads import Payload
+from heapq     import (
+                      heappop,
+                      heappush
+                      )
+from typing    import *
+
+
+class EventSequencer:
+  """
+  Puts the Dispatch payloads of a gateway session back in sequence. Payloads whose sequence number was already handled, e.g. replayed after a RESUME or delivered late by a closed connection, are dropped, and payloads arriving ahead of a gap are held until the gap is filled
+
+  A gap that stays open for more than ` window ` payloads is given up on, and the held payloads are released in order
+
+
+  Attributes
+  ----------
+  duplicates : int
+    Number of dropped payloads
+
+  last : Optional[int]
+    Sequence number of the last released payload
+
+  window : int
+    Maximum number of payloads held while waiting for a gap to be filled
+  """
+
+  def __init__(
+    self,
+    window : int = 256
+  ) -> None:
+    """
+    Parameters
+    ----------
+    window : Optional[int]
+      Maximum number of payloads held while waiting for a gap to be filled. Defaults to ` 256 `
+    """
+    self.duplicates : int                            = 0
+    self.last       : Optional[int]                  = None
+    self.window     : int                            = window
+    self._held      : List[Tuple[int, int, Payload]] = []
+    self._order     : int                            = 0
+
+
+  def __len__(
+    self
+  ) -> int:
+    return len(self._held)
+
+
+  def push(
+    self,
+    payload : Payload
+  ) -> List[Payload]:
+    """
+    Feeds a received Dispatch payload
+
+    Parameters
+    ----------
+    payload : Payload
+      Received Dispatch payload
+
+    Returns
+    -------
+    List[Payload]
+      The payloads to handle now, in sequence order
+    """
+    if payload.s is None: return [payload]
+    if self.last is not None and payload.s <= self.last or any(held[0] == payload.s for held in self._held):
+      self.duplicates += 1
+      return []
+    if self.last is not None and payload.s > self.last + 1:
+      self._order += 1
+      heappush(self._held, (payload.s, self._order, payload))
+      return self._release(force = len(self._held) > self.window)
+    self.last : int = payload.s
+    return [payload, *self._release()]
+
+
+  def reset(
+    self
+  ) -> None:
+    """
+    Forgets the session's sequence, once a new session is identified
+    """
+    self.last  : Optional[int]                  = None
+    self._held : List[Tuple[int, int, Payload]] = []
+
+
+  def _release(
+    self,
+    *,
+    force : bool = False
+  ) -> List[Payload]:
+    """
+    Releases the held payloads that follow the last released one, or every held payload if ` force ` is set
+    """
+    released : List[Payload] = []
+    while self._held and (force or self._held[0][0] == self.last + 1):
+      sequence, _, payload = heappop(self._held)
+      self.last : int = sequence
+      released.append(payload)
+    return released
\ No newline at end of file
@@ -0,0 +1,230 @@
+from random    import uniform
+from threading import Lock
+from time      import (
+                      monotonic,
+                      sleep
+                      )
+from typing    import *
+
+
+def shard_id_for(
+  guild_id    : int,
+  shard_count : int
+) -> int:
+  """
+  Returns the ID of the shard that receives the events of a guild
+
+  Parameters
+  ----------
+  guild_id : int
+    ID of the guild
+
+  shard_count : int
+    Total number of shards
+
+  Returns
+  -------
+  int
+  """
+  return (int(guild_id) >> 22) % shard_count
+
+
+class Backoff:
+  """
+  Exponential backoff with full jitter between reconnect attempts. The n-th consecutive attempt waits a random delay between 0 and ` min(cap, base * 2 ** n) ` seconds, so shards dropped by the same outage do not reconnect in lockstep
+
+
+  Attributes
+  ----------
+  attempts : int
+    Number of consecutive attempts since the last reset
+
+  base : float
+    Upper bound of the first delay, in seconds
+
+  cap : float
+    Upper bound of any delay, in seconds
+  """
+
+  def __init__(
+    self,
+    base : float = 1.0,
+    cap  : float = 60.0
+  ) -> None:
+    """
+    Parameters
+    ----------
+    base : Optional[float]
+      Upper bound of the first delay, in seconds. Defaults to ` 1.0 `
+
+    cap : Optional[float]
+      Upper bound of any delay, in seconds. Defaults to ` 60.0 `
+    """
+    self.attempts : int   = 0
+    self.base     : float = base
+    self.cap      : float = cap
+
+
+  def delay(
+    self
+  ) -> float:
+    """
+    Returns the delay before the next attempt, and counts the attempt
+
+    Returns
+    -------
+    float
+    """
+    delay : float = uniform(0, min(self.cap, self.base * 2 ** self.attempts))
+    self.attempts += 1
+    return delay
+
+
+  def reset(
+    self
+  ) -> None:
+    """
+    Starts over from the first delay, once a connection succeeded
+    """
+    self.attempts : int = 0
+
+
+class IdentifyLimiter:
+  """
+  Spaces out the IDENTIFY payloads of every shard in the process. Shards are grouped into ` max_concurrency ` buckets by ` shard_id % max_concurrency `, and each bucket may identify once every ` interval ` seconds
+
+  Every identify also spends one session start of the daily budget given by ` /gateway/bot `. Once the budget is spent, identifies wait for it to reset instead of getting the token locked out
+
+
+  Attributes
+  ----------
+  interval : float
+    Seconds between two identifies of the same bucket
+
+  max_concurrency : int
+    Number of identify buckets, as given by ` /gateway/bot `
+
+  remaining : Optional[int]
+    Number of session starts left in the budget, if it is known
+
+  reset_at : float
+    Monotonic time at which the budget resets
+
+  total : Optional[int]
+    Number of session starts of a full budget, if it is known
+  """
+
+  def __init__(
+    self,
+    max_concurrency : int           = 1,
+    *,
+    interval        : float         = 5.0,
+    total           : Optional[int] = None,
+    remaining       : Optional[int] = None,
+    reset_after     : float         = 0.0
+  ) -> None:
+    """
+    Parameters
+    ----------
+    max_concurrency : Optional[int]
+      Number of identify buckets, as given by ` /gateway/bot `. Defaults to ` 1 `
+
+    interval : Optional[float]
+      Seconds between two identifies of the same bucket. Defaults to ` 5.0 `
+
+    total : Optional[int]
+      Number of session starts of a full budget. Defaults to no budget
+
+    remaining : Optional[int]
+      Number of session starts left in the budget. Defaults to ` total `
+
+    reset_after : Optional[float]
+      Seconds until the budget resets. Defaults to ` 0.0 `
+    """
+    self.interval        : float            = interval
+    self.max_concurrency : int              = max_concurrency
+    self.remaining       : Optional[int]    = remaining if remaining is not None else total
+    self.reset_at        : float            = monotonic() + reset_after
+    self.total           : Optional[int]    = total
+    self._locks          : Dict[int, Lock]  = {}
+    self._last           : Dict[int, float] = {}
+    self._lock           : Lock             = Lock()
+
+
+  @classmethod
+  def from_gateway(
+    cls,
+    session_start_limit : Dict[str, int]
+  ) -> Self:
+    """
+    Builds a limiter from the ` session_start_limit ` object returned by ` /gateway/bot `
+
+    Parameters
+    ----------
+    session_start_limit : Dict[str, int]
+      Session start limit of the application
+
+    Returns
+    -------
+    IdentifyLimiter
+    """
+    return cls(
+      session_start_limit["max_concurrency"],
+      total       = session_start_limit.get("total"),
+      remaining   = session_start_limit.get("remaining"),
+      reset_after = session_start_limit.get("reset_after", 0) / 1_000
+    )
+
+
+  def acquire(
+    self,
+    shard_id : int
+  ) -> None:
+    """
+    Blocks until the shard's bucket may identify
+
+    Parameters
+    ----------
+    shard_id : int
+      ID of the shard about to identify
+    """
+    bucket : int = shard_id % self.max_concurrency
+    with self._lock:
+      lock : Lock = self._locks.setdefault(bucket, Lock())
+    with lock:
+      self._spend()
+      wait : float = self._last.get(bucket, -self.interval) + self.interval - monotonic()
+      if wait > 0: sleep(wait)
+      self._last[bucket] = monotonic()
+
+
+  def _spend(
+    self
+  ) -> None:
+    """
+    Spends one session start, waiting for the budget to reset if it is spent
+    """
+    if not self.total: return
+    with self._lock:
+      if monotonic() >= self.reset_at: self._refill()
+      while self.remaining <= 0:
+        wait : float = self.reset_at - monotonic()
+        if wait > 0:
+          self._lock.release()
+          try:
+            sleep(wait)
+          finally:
+            self._lock.acquire()
+        self._refill()
+      self.remaining -= 1
+
+
+  def _refill(
+    self
+  ) -> None:
+    """
+    Restores the full budget once its reset time passed, and starts the next 24 hour window
+    """
+    if monotonic() < self.reset_at: return
+    self.remaining : int   = self.total
+    self.reset_at  : float = monotonic() + 86_400
\ No newline at end of file
@@ -1,8 +1,12 @@
 from .asset   import Asset
 from .color   import Color
 from .enums   import PremiumType
-from .flags   import UserFlags
+from .flags   import UserFlagSet
 from .locales import Locale
+from .model   import (
+                     Model,
+                     lazy_property
+                     )
 from typing   import *
 
 if TYPE_CHECKING:
@@ -14,6 +18,8 @@ class CallableAvatar(str):
   Callable property for User.avatar attribute
   """
 
+  __slots__ : Tuple[str, ...] = ("avatar_decoration", "default_avatar")
+
   def default(
     self
   ) -> str:
@@ -52,13 +58,153 @@ class CallableAvatar(str):
     return self
 
 
-class User:
+class User(Model):
   """
-  Represents a Discord user
+  Represents a Discord user. Only the ID is parsed up front, other fields are read from the payload on access
   """
 
-  def __getattr__(self, attribute : str) -> None:
-    raise AttributeError(f"User object has no attribute: {attribute}")
+  __slots__ : Tuple[str, ...] = (
+    "_accent_color",
+    "_avatar",
+    "_banner",
+    "_discriminator",
+    "_flags",
+    "_global_name",
+    "_locale",
+    "_premium_type",
+    "_user_flags",
+    "id"
+  )
+
+  @lazy_property
+  def accent_color(
+    self
+  ) -> Optional[Color]:
+    """
+    Banner color of the user, if any
+
+    Returns
+    -------
+    Optional[Color]
+    """
+    return Color.from_int(self._data["accent_color"]) if self._data.get("accent_color") is not None else None
+
+
+  @lazy_property
+  def avatar(
+    self
+  ) -> CallableAvatar:
+    """
+    Avatar URL of the user, or an empty string if none is set
+
+    Returns
+    -------
+    CallableAvatar
+    """
+    avatar_hash : Optional[str]            = self._data.get("avatar")
+    decoration  : Optional[Dict[str, Any]] = self._data.get("avatar_decoration_data")
+    avatar      : CallableAvatar           = CallableAvatar(f"https://cdn.discordapp.com/avatars/{self.id}/{avatar_hash}.{"gif" if avatar_hash.startswith("a_") else "png"}" if avatar_hash else "")
+    avatar.default_avatar    : str           = f"https://cdn.discordapp.com/embed/avatars/{(self.id >> 22) % 6 if self.discriminator == 0 else self.discriminator % 5}.png"
+    avatar.avatar_decoration : Optional[str] = f"https://cdn.discordapp.com/avatar-decoration-presets/{decoration["asset"]}.png" if decoration else None
+    return avatar
+
+
+  @lazy_property
+  def banner(
+    self
+  ) -> Optional[Asset]:
+    """
+    Banner of the user, if any
+
+    Returns
+    -------
+    Optional[Asset]
+    """
+    return Asset.from_user("banner", self._data) if self._data.get("banner") else None
+
+
+  @lazy_property
+  def discriminator(
+    self
+  ) -> int:
+    """
+    Discriminator of the user, ` 0 ` for users on the unique username system
+
+    Returns
+    -------
+    int
+    """
+    return int(self._data.get("discriminator", 0))
+
+
+  @lazy_property
+  def flags(
+    self
+  ) -> Optional[UserFlagSet]:
+    """
+    Flags on the user's account, if sent
+
+    Returns
+    -------
+    Optional[UserFlagSet]
+    """
+    return UserFlagSet(self._data["flags"]) if self._data.get("flags") is not None else None
+
+
+  @lazy_property
+  def global_name(
+    self
+  ) -> str:
+    """
+    Display name of the user, defaulting to the username
+
+    Returns
+    -------
+    str
+    """
+    return self._data.get("global_name") or self._data.get("username")
+
+
+  @lazy_property
+  def locale(
+    self
+  ) -> Optional[Locale]:
+    """
+    Chosen language of the user, if sent
+
+    Returns
+    -------
+    Optional[Locale]
+    """
+    return Locale._value2member_map_[self._data["locale"]] if self._data.get("locale") else None
+
+
+  @lazy_property
+  def premium_type(
+    self
+  ) -> Optional[PremiumType]:
+    """
+    Nitro subscription type of the user, if sent
+
+    Returns
+    -------
+    Optional[PremiumType]
+    """
+    return PremiumType._value2member_map_[self._data["premium_type"]] if self._data.get("premium_type") is not None else None
+
+
+  @lazy_property
+  def user_flags(
+    self
+  ) -> Optional[UserFlagSet]:
+    """
+    Public flags on the user's account, if sent
+
+    Returns
+    -------
+    Optional[UserFlagSet]
+    """
+    return UserFlagSet(self._data["public_flags"]) if self._data.get("public_flags") is not None else None
 
 
   @classmethod
@@ -67,7 +213,7 @@ class User:
     data : Dict[str, Any]
   ) -> Self:
     """
-    Construct a User object from a dictionary payload
+    Construct a User object from a dictionary payload. The payload is kept as is and read from on access
 
     Parameters
     ----------
@@ -78,24 +224,9 @@ class User:
     -------
     User
     """
-    user : Self = cls()
-    for attribute in data:
-      match attribute:
-        case "id" | "discriminator": user.__dict__[attribute] : int = int(data[attribute])
-        case "global_name":
-          if not data[attribute]: user.__dict__[attribute] : str = data["username"]
-          else:                   user.__dict__[attribute] : str = data[attribute]
-        case "banner": user.__dict__[attribute] : Asset = Asset.from_user(attribute, data) if data[attribute] else None
-        case "avatar":
-          user.__dict__[attribute] : str = CallableAvatar(f"https://cdn.discordapp.com/avatars/{data["id"]}/{data["avatar"]}.{"gif" if data["avatar"].startswith("a_") else "png"}") if data[attribute] else ""
-          user.default_avatar      : str = f"https://cdn.discordapp.com/embed/avatars/{(int(data["id"]) >> 22) % 6 if int(data["discriminator"]) == 0 else int(data["discriminator"]) % 5}.png"
-          user.avatar_decoration   : str = f"https://cdn.discordapp.com/avatar-decoration-presets/{data["avatar_decoration_data"]["asset"]}.png" if data.get("avatar_decoration_data") else ""
-        case "accent_color": user.__dict__[attribute]     : Color       = Color.from_int(data[attribute])
-        case "locale":       user.__dict__[attribute]     : Locale      = Locale._value2member_map_[data[attribute]]
-        case "flags":        user.__dict__[attribute]     : List[str]   = [name for name, flag in UserFlags._member_map_.items() if (data[attribute] & flag.value) == flag.value]
-        case "public_flags": user.__dict__["user_flags"]  : List[str]   = [name for name, flag in UserFlags._member_map_.items() if (data[attribute] & flag.value) == flag.value]
-        case "premium_type": user.__dict__[attribute]     : PremiumType = PremiumType._value2member_map_[data[attribute]]
-        case _:              user.__dict__[attribute]     : Any         = data[attribute]
+    user       : Self           = cls()
+    user._data : Dict[str, Any] = data
+    user.id    : int            = int(data["id"])
     return user
 
 
@@ -120,7 +251,7 @@ class User:
     -------
     User
     """
-    if ws.app.users(id = user_id): return ws.app.users(id = user_id)
-    user : Self = cls.from_data(ws.get(f"/users/{user_id}"))
-    ws.app.users.append(user)
-    return user
\ No newline at end of file
+    user : Optional[Self] = ws.app.users.get(user_id)
+    if user: return user
+    user : Self = cls.from_data(ws.app.http.request("GET", f"/users/{user_id}"))
+    return ws.app.users.add(user)
\ No newline at end of file
@@ -1,28 +1,45 @@
-import asyncio
 import rel
-import requests
  
-from .appinfo  import AppInfo
-from .enums    import (
-                      GatewayEvents,
-                      PayloadType
-                      )
-from .guild    import Guild
-from .payloads import Payload
-from .reqs     import (
-                      GET,
-                      PATCH
-                      )
-from .user     import User
-from json      import (
-                      dumps,
-                      loads
-                      )
-from random    import random
-from threading import Thread
-from traceback import print_exc
-from typing    import *
-from websocket import WebSocketApp
+from .appinfo     import AppInfo
+from .channels    import GuildChannel
+from .codec       import (
+                         ETFCodec,
+                         JSONCodec
+                         )
+from .compression import ZlibStream
+from .enums       import (
+                         ConnectionState,
+                         GatewayEvents,
+                         PayloadType
+                         )
+from .guild       import Guild
+from .heartbeat   import Heartbeat
+from .iterators   import (
+                         MemberChunk,
+                         MemberChunkIterator
+                         )
+from .member      import Member
+from .payloads    import Payload
+from .ratelimit   import GatewayRateLimiter
+from .reqs        import (
+                         GET,
+                         PATCH
+                         )
+from .role        import Role
+from .sequencer   import EventSequencer
+from .sharding    import Backoff
+from .user        import User
+from asyncio      import sleep as async_sleep
+from random       import uniform
+from threading    import Thread
+from time         import sleep
+from traceback    import print_exc
+from typing       import *
+from weakref      import WeakValueDictionary
+from websocket    import (
+                         ABNF,
+                         WebSocketApp
+                         )
 
 if TYPE_CHECKING:
   from .app import App
@@ -38,15 +55,51 @@ class DiscordWebSocket:
   app : App
     The application the connection holds
 
+  backoff : Backoff
+    Backoff between the reconnect attempts of the shard, reset once a session is ready or resumed
+
+  cache_events : FrozenSet[GatewayEvents]
+    Events applied to the cache, whether or not a listener reads them
+
+  codec : Union[ETFCodec, JSONCodec]
+    Codec used to encode and decode gateway payloads, following App.encoding
+
   connection : WebSocketApp
     Websocket connection to the API and gateway
 
+  consumed_events : FrozenSet[str]
+    Names of the events handled by the connection itself. Other events are neither decoded nor parsed unless a listener reads them
+
+  heartbeat : Optional[Heartbeat]
+    Heartbeat scheduler of the current connection
+
   heartbeat_interval : int
     Interval ( in milliseconds ) used for the delay of sending heartbeats
 
+  inflator : Optional[ZlibStream]
+    Decompressor of the current connection, if ` zlib-stream ` compression is enabled. Holds the bytes received on the wire and the bytes they decompressed to
+
   last_sequence : Optional[int]
     Last received sequence number
 
+  limiter : GatewayRateLimiter
+    Limiter spacing out the payloads sent on the connection
+
+  member_requests : WeakValueDictionary[str, MemberChunkIterator]
+    Pending member requests of the connection, keyed by nonce. Held weakly, so an abandoned request can be collected and release its slot
+
+  sequencer : EventSequencer
+    Drops replayed Dispatch payloads and puts the others back in sequence order
+
+  shard_count : int
+    Total number of shards of the application
+
+  shard_id : int
+    ID of the shard this connection serves
+
+  state : ConnectionState
+    State of the connection
+
   __resume_gateway_url : str
     The Gateway URL used for resuming connections, if possible
 
@@ -54,51 +107,93 @@ class DiscordWebSocket:
     Session ID of the connection
   """
 
+  cache_events        : FrozenSet[GatewayEvents] = frozenset({
+    GatewayEvents.ChannelCreate,
+    GatewayEvents.ChannelDelete,
+    GatewayEvents.ChannelUpdate,
+    GatewayEvents.GuildMemberAdd,
+    GatewayEvents.GuildMemberRemove,
+    GatewayEvents.GuildMemberUpdate,
+    GatewayEvents.GuildRoleCreate,
+    GatewayEvents.GuildRoleDelete,
+    GatewayEvents.GuildRoleUpdate,
+    GatewayEvents.GuildUpdate
+  })
+  consumed_events     : FrozenSet[str]           = frozenset(
+    event.value
+    for event in (
+      *cache_events,
+      GatewayEvents.GuildCreate,
+      GatewayEvents.GuildMembersChunk,
+      GatewayEvents.Ready,
+      GatewayEvents.Resumed
+    )
+  )
+  fatal_close_codes   : FrozenSet[int]           = frozenset({4004, 4010, 4011, 4012, 4013, 4014})
+  session_close_codes : FrozenSet[int]           = frozenset({4007, 4009})
+
   def __init__(
     self,
-    app : "App"
+    app         : "App",
+    shard_id    : int = 0,
+    shard_count : int = 1
   ) -> None:
     self.app                  : "App"           = app
-    self.api_version          : int           = 10
-    self.api                  : str           = f"https://discord.com/api/v{self.api_version}"
-    self.gateway              : str           = f"{self.get("/gateway")["url"]}?v={self.api_version}&encoding=json"
-    self.connection           : WebSocketApp  = WebSocketApp(
-      self.gateway,
-      on_open    = self.on_open,
-      on_error   = self.on_error,
-      on_close   = self.on_close,
-      on_message = self.on_message
-    )
+    self.backoff              : Backoff       = Backoff()
+    self.shard_id             : int           = shard_id
+    self.shard_count          : int           = shard_count
+    self.api_version          : int           = self.app.http.api_version
+    self.api                  : str           = self.app.http.api
+    self.codec                : Union[ETFCodec, JSONCodec] = ETFCodec() if self.app.encoding == "etf" else JSONCodec()
+    self.gateway              : str           = self._url(self.app.gateway["url"])
+    self.connection           : WebSocketApp  = self._connection(self.gateway)
+    self.heartbeat            : Optional[Heartbeat] = None
     self.heartbeat_interval   : int           = None
     self.identify_sent        : bool          = False
+    self.inflator             : Optional[ZlibStream] = None
     self.is_resuming          : bool          = False
     self.last_sequence        : Optional[int] = None
+    self.limiter              : GatewayRateLimiter = GatewayRateLimiter()
+    self.member_requests      : WeakValueDictionary[str, MemberChunkIterator] = WeakValueDictionary()
+    self.sequencer            : EventSequencer = EventSequencer()
+    self.state                : ConnectionState = ConnectionState.Closed
     self.__resume_gateway_url : str           = None
     self.__session_id         : str           = None
 
 
-  def delete(
+  async def delete(
     self,
     endpoint : str,
-    reason : Optional[str] = None
+    reason   : Optional[str] = None
   ) -> Dict[str, Any]:
-    return loads(
-      requests.delete(
-        f"{self.api}{endpoint}",
-        headers = {
-          "Authorization": f"Bot {self.app._App__token}",
-          "X-Audit-Log-Reason": reason
-        }
-      ).content
+    """
+    Utilizes the DELETE API method with an endpoint call
+
+    Parameters
+    ----------
+    endpoint : str
+      The endpoint to call
+
+    reason : Optional[str]
+      Reason of modification / call
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+    return await self.app.http.arequest(
+      "DELETE",
+      endpoint,
+      reason = reason
     )
 
 
-  def get(
+  async def get(
     self,
     endpoint : str
   ) -> Dict[str, Any]:
     """
-    Utilizes the GET API method and with an endpoint call
+    Utilizes the GET API method and with an endpoint call. Identical concurrent calls share a single request and its result
 
     Parameters
     ----------
@@ -109,16 +204,12 @@ class DiscordWebSocket:
     -------
     Dict[str, Any]
     """
-    return loads(
-      requests.get(
-        f"{self.api}{endpoint}",
-        headers = {
-          "Authorization": f"Bot {self.app._App__token}"
-        }
-      ).content
+    return await self.app.http.arequest(
+      "GET",
+      endpoint
     )
 
-  def patch(
+  async def patch(
     self,
     endpoint : str,
     data     : Dict[str, Any],
@@ -143,51 +234,36 @@ class DiscordWebSocket:
     Dict[str, Any]
     """
 
-    return loads(
-      requests.patch(
-        f"{self.api}{endpoint}",
-        headers = {
-          "Authorization"     : f"Bot {self.app._App__token}",
-          "Content-Type"      : "application/json",
-          "X-Audit-Log-Reason": reason
-        },
-        data    = dumps(data)
-      ).content
+    return await self.app.http.arequest(
+      "PATCH",
+      endpoint,
+      data   = data,
+      reason = reason
     )
 
-  def post(
+  async def post(
     self,
     endpoint : str,
     data     : Dict[str, Any]
   ) -> Dict[str, Any]:
-    return loads(
-      requests.post(
-        f"{self.api}{endpoint}",
-        headers = {
-          "Authorization" : f"Bot {self.app._App__token}",
-          "Content-Type"  : "application/json"
-        },
-        data    = dumps(data)
-      ).content
+    return await self.app.http.arequest(
+      "POST",
+      endpoint,
+      data = data
     )
 
   
-  def put(
+  async def put(
     self,
     endpoint : str,
     data     : Dict[str, Any] = {},
     reason : Optional[str] = None
   ) -> Dict[str, Any]:
-    return loads(
-      requests.put(
-        f"{self.api}{endpoint}",
-        headers = {
-          "Authorization" : f"Bot {self.app._App__token}",
-          "Content-Type"  : "application/json",
-          "X-Audit-Log-Reason": reason
-        },
-        data = dumps(data)
-      ).content
+    return await self.app.http.arequest(
+      "PUT",
+      endpoint,
+      data   = data,
+      reason = reason
     )
 
 
@@ -196,19 +272,49 @@ class DiscordWebSocket:
     payload : Payload
   ) -> None:
     """
-    Sends a payload to the connection
+    Sends a payload to the connection, once the connection's gateway rate limit allows it
+
+    Parameters
+    ----------
+    payload : Payload
+      Payload object to send
+    """
+    wait : float = self.limiter.reserve(heartbeat = payload.op is PayloadType.HeartBeat)
+    if wait > 0: sleep(wait)
+    self._write(payload)
+
+
+  async def asend(
+    self,
+    payload : Payload
+  ) -> None:
+    """
+    Sends a payload to the connection from a coroutine, waiting for the connection's gateway rate limit without blocking the event loop
 
     Parameters
     ----------
     payload : Payload
       Payload object to send
     """
+    wait : float = self.limiter.reserve(heartbeat = payload.op is PayloadType.HeartBeat)
+    if wait > 0: await async_sleep(wait)
+    self._write(payload)
+
+
+  def _write(
+    self,
+    payload : Payload
+  ) -> None:
+    """
+    Writes a payload to the connection
+    """
     try:
       if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug(f"sent     : {payload}")
       self.connection.send(
-        dumps(
+        self.codec.encode(
           payload.to_json()
-        )
+        ),
+        opcode = ABNF.OPCODE_BINARY if self.codec.binary else ABNF.OPCODE_TEXT
       )
     except Exception as error:
       if self.app.logger: self.app.logger.error(error)
@@ -218,11 +324,14 @@ class DiscordWebSocket:
     self
   ) -> None:
     """
-    Sends an Identify payload
+    Sends an Identify payload, once the shard's identify bucket and the session start budget allow it
     """
+    if self.app.identify_limiter.remaining == 0 and self.app.logger: self.app.logger.warn(f"Session start budget spent, shard {self.shard_id} waits for it to reset before identifying")
+    self.app.identify_limiter.acquire(self.shard_id)
     payload : Payload = Payload.identify(
       token   = self.app._App__token,
-      intents = self.app.intents.value
+      intents = self.app.intents.value,
+      shard   = [self.shard_id, self.shard_count]
     )
     self.send(
       payload
@@ -235,71 +344,100 @@ class DiscordWebSocket:
     self
   ) -> None:
     """
-    Connects to the gateway
+    Registers the connection to the gateway with the event dispatcher. The connection runs once ` rel.dispatch() ` is called
     """
-    # Thread(target = self.connection.run_forever).start()
+    if self.state is ConnectionState.Closed: self.state : ConnectionState = ConnectionState.Connecting
     try:
       self.connection.run_forever(
         dispatcher = rel,
         reconnect  = 0
       )
-      rel.signal(
-        2,
-        rel.abort
-      )
-      rel.dispatch()
-      if self.is_resuming:
-        Thread(
-          target = self.send_heartbeat
-        ).start()
-        self.send(
-          Payload(
-            op = PayloadType.Resume,
-            d  = {
-              "token"      : self.app._App__token,
-              "session_id" : self.__session_id,
-              "seq"        : self.last_sequence
-            }
-          )
-        )
-        self.is_resuming : bool = False
     except Exception as error:
       if self.app.logger: self.app.logger.error(error)
 
+
+  def close(
+    self
+  ) -> None:
+    """
+    Closes the connection for good, without resuming or reconnecting
+    """
+    self.state : ConnectionState = ConnectionState.Closed
+    if self.heartbeat: self.heartbeat.stop()
+    self.connection.close()
+
+
   def resume(
     self
   ) -> None:
     """
-    Resumes the connection, if possible
+    Opens a new connection to ` resume_gateway_url ` and resumes the session from the last received sequence number, so that Discord replays the missed events. Reconnects with a new session if there is none to resume
     """
 
-    self.connection.close()
-    self.connection : WebSocketApp = WebSocketApp(
-      self.__resume_gateway_url,
-      on_open    = self.on_open,
-      on_error   = self.on_error,
-      on_close   = self.on_close,
-      on_message = self.on_message
-    )
-    self.is_resuming : bool = True
-    self.connect()
+    if not self.__session_id: return self.reconnect()
+    if self.app.logger: self.app.logger.info(f"Resuming session of shard {self.shard_id} from sequence {self.last_sequence}")
+    self.is_resuming : bool            = True
+    self.state       : ConnectionState = ConnectionState.Resuming
+    self._replace(self._url(self.__resume_gateway_url))
+
 
   def reconnect(
     self
   ) -> None:
     """
-    Creates a new connection using the cached URL if the app cannot resume
+    Opens a new connection to the gateway and identifies a new session, dropping the current one
     """
 
-    self.connection.close()
-    self.connection : WebSocketApp = WebSocketApp(
-      self.gateway,
+    if self.app.logger: self.app.logger.info(f"Reconnecting shard {self.shard_id} with a new session")
+    self.identify_sent        : bool            = False
+    self.is_resuming          : bool            = False
+    self.last_sequence        : Optional[int]   = None
+    self.state                : ConnectionState = ConnectionState.Reconnecting
+    self.__resume_gateway_url : Optional[str]   = None
+    self.__session_id         : Optional[str]   = None
+    self.sequencer.reset()
+    self._replace(self.gateway)
+
+
+  def _replace(
+    self,
+    url : str
+  ) -> None:
+    """
+    Swaps the connection for a new one to a URL. Callbacks of the old connection are ignored from then on
+    """
+    if self.heartbeat: self.heartbeat.stop()
+    previous        : WebSocketApp = self.connection
+    self.connection : WebSocketApp = self._connection(url)
+    previous.close()
+    self.connect()
+
+
+  def _connection(
+    self,
+    url : str
+  ) -> WebSocketApp:
+    """
+    Builds a connection to a gateway URL, bound to this handler's callbacks
+    """
+    return WebSocketApp(
+      url,
       on_open    = self.on_open,
       on_error   = self.on_error,
       on_close   = self.on_close,
       on_message = self.on_message
     )
-    self.connect()
+
+
+  def _url(
+    self,
+    base : str
+  ) -> str:
+    """
+    Appends the version, encoding and compression query parameters to a gateway URL
+    """
+    return f"{base}?v={self.api_version}&encoding={self.codec.encoding}{"&compress=zlib-stream" if self.app.compress else ""}"
+
 
   def on_open(
     self,
@@ -313,7 +451,9 @@ class DiscordWebSocket:
     ws : DiscordWebSocket
     """
 
-    if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug(f"Connection opened with: {self.gateway}")
+    if ws is not self.connection: return
+    self.inflator : Optional[ZlibStream] = ZlibStream() if self.app.compress else None
+    if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug(f"Connection opened with: {ws.url}")
     if self.app.logger: self.app.logger.info("Connected to Gateway")
 
 
@@ -324,7 +464,7 @@ class DiscordWebSocket:
     message
   ) -> None:
     """
-    Called when the connection is closed
+    Called when the connection is closed. Unless the application closed it, the session is resumed, or a new one is identified if Discord will not resume it
 
     Parameters
     ----------
@@ -337,7 +477,17 @@ class DiscordWebSocket:
     ws : DiscordWebSocket
     """
 
-    if self.app.logger: self.app.logger.warn(f"{ws}\n{status_code}\n{loads(message.content)}")
+    if ws is not self.connection: return
+    if self.heartbeat: self.heartbeat.stop()
+    if self.app.logger: self.app.logger.warn(f"{ws}\n{status_code}\n{message}")
+    if self.state is ConnectionState.Closed: return
+    if status_code in self.fatal_close_codes:
+      self.state : ConnectionState = ConnectionState.Closed
+      if self.app.logger: self.app.logger.error(f"Shard {self.shard_id} cannot reconnect, the gateway closed the connection with: {status_code} {message}")
+      return
+    delay : float = self.backoff.delay()
+    if self.app.logger: self.app.logger.info(f"Shard {self.shard_id} reconnecting in {delay:.2f}s ( attempt {self.backoff.attempts} )")
+    rel.timeout(delay, self.reconnect if status_code in self.session_close_codes else self.resume)
 
 
   def on_error(
@@ -358,37 +508,18 @@ class DiscordWebSocket:
     if self.app.logger: self.app.logger.error(error)
 
 
-  def send_heartbeat(
-    self,
-    jitter : bool = False,
-    wait   : bool = True
-  ) -> None:
+  @property
+  def latency(
+    self
+  ) -> Optional[float]:
     """
-    Send a heartbeat
+    Seconds between the last heartbeat and its ACK, if any was received
 
-    Parameters
-    ----------
-    jitter : bool
-      Whether to jitter the delay. Jittered delay is calculated by ` heartbeat_interval * random() `. Defaults to ` False `
-
-    wait : bool
-      Whether to delay the heartbeat. Defaults to ` True `
+    Returns
+    -------
+    Optional[float]
     """
-
-    wait_time : int = self.heartbeat_interval
-    if jitter: wait_time *= random()
-    if wait: asyncio.run(
-        asyncio.sleep(
-          wait_time / 1_000
-        )
-      )
-    self.send(
-      Payload(
-        op = PayloadType.HeartBeat,
-        d  = self.last_sequence
-      )
-    )
-    if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug("Heartbeat sent successfully")
+    return self.heartbeat.latency if self.heartbeat else None
 
 
   def setup_ready(
@@ -396,7 +527,7 @@ class DiscordWebSocket:
     payload : Payload
   ) -> None:
     """
-    Called after receiving the READY gateway event and before calling the on_ready event listeners
+    Called after receiving the READY gateway event. The on_ready event listeners are called once every shard of the application is ready
 
     Parameters
     ----------
@@ -413,12 +544,97 @@ class DiscordWebSocket:
     self.app._presences           : list    = payload.d["presences"]
     self.app._guild_join_requests : list    = payload.d["guild_join_requests"]
     self.app._appinfo             : AppInfo = AppInfo.from_data(payload.d["application"])
-    Thread(
-      target = asyncio.run,
-      args   = [
-        self.app._App__app_events.call(payload.t)
-      ]
-    ).start()
+    if self.shard_id in self.app._ready_shards: return
+    self.app._ready_shards.add(self.shard_id)
+    if len(self.app._ready_shards) == len(self.app.shards):
+      self.app.events.emit(self, payload)
+
+
+  def members_chunk(
+    self,
+    payload : Payload
+  ) -> None:
+    """
+    Streams a GUILD_MEMBERS_CHUNK into the guild's member cache, and hands it to the member request it answers, if any
+
+
+    Parameters
+    ----------
+    payload : Payload
+      Received Dispatch payload
+    """
+
+    request : Optional[MemberChunkIterator] = self.member_requests.get(payload.d.get("nonce"))
+    guild   : Optional[Guild]               = self.app.guilds.get(payload.d["guild_id"]) or (request.guild if request else None)
+    if not guild: return
+    members : List[Member] = [Member.from_data(self, member, guild) for member in payload.d["members"]]
+    if guild is self.app.guilds.get(guild.id):
+      for member in members: guild.members.add(member)
+    if not request: return
+    if payload.d["chunk_index"] + 1 >= payload.d["chunk_count"]: self.member_requests.pop(request.nonce, None)
+    self.app.dispatcher.loop.call_soon_threadsafe(request.feed, MemberChunk(payload.d, members))
+
+
+  def update_cache(
+    self,
+    payload : Payload
+  ) -> None:
+    """
+    Applies a role, channel, member or guild update to the cached guild, and invalidates the memoized permissions it affects
+
+
+    Parameters
+    ----------
+    payload : Payload
+      Received Dispatch payload
+    """
+
+    if not isinstance(payload.d, dict): return
+    guild_id : Optional[str]   = payload.d.get("id") if payload.t is GatewayEvents.GuildUpdate else payload.d.get("guild_id")
+    guild    : Optional[Guild] = self.app.guilds.get(guild_id) if guild_id else None
+    if not guild: return
+    match payload.t:
+      case GatewayEvents.GuildUpdate:
+        guild._update(payload.d)
+        self.app.guilds.add(guild)
+
+      case GatewayEvents.GuildRoleCreate | GatewayEvents.GuildRoleUpdate:
+        role : Optional[Role] = guild.roles.get(payload.d["role"]["id"])
+        if role: role._update(payload.d["role"])
+        else:    role : Role  = Role.from_data(payload.d["role"], guild)
+        guild.roles.add(role)
+        guild.resolver.invalidate_role(role.id)
+
+      case GatewayEvents.GuildRoleDelete:
+        guild.roles.discard(int(payload.d["role_id"]))
+        guild.resolver.invalidate_role(int(payload.d["role_id"]))
+
+      case GatewayEvents.ChannelCreate | GatewayEvents.ChannelUpdate:
+        channel : Optional[GuildChannel] = guild.channels.get(payload.d["id"])
+        if channel: channel._update(payload.d)
+        else:       channel : GuildChannel = GuildChannel.from_data(self, payload.d, guild)
+        guild.channels.add(channel)
+        guild.resolver.invalidate_channel(channel.id)
+
+      case GatewayEvents.ChannelDelete:
+        guild.channels.discard(int(payload.d["id"]))
+        guild.resolver.invalidate_channel(int(payload.d["id"]))
+
+      case GatewayEvents.GuildMemberAdd:
+        if guild._data and "member_count" in guild._data: guild._update({"member_count": guild._data["member_count"] + 1}, lazy = False)
+        if guild.members.admits: guild.members.add(Member.from_data(self, payload.d, guild))
+
+      case GatewayEvents.GuildMemberUpdate:
+        member : Optional[Member] = guild.members.get(payload.d["user"]["id"])
+        if member: member._update(payload.d)
+        else:      member : Member = Member.from_data(self, payload.d, guild)
+        guild.members.add(member)
+        guild.resolver.invalidate_member(member.id)
+
+      case GatewayEvents.GuildMemberRemove:
+        if guild._data and "member_count" in guild._data: guild._update({"member_count": guild._data["member_count"] - 1}, lazy = False)
+        guild.members.discard(int(payload.d["user"]["id"]))
+        guild.resolver.invalidate_member(int(payload.d["user"]["id"]))
 
 
   def on_message(
@@ -438,66 +654,157 @@ class DiscordWebSocket:
       Websocket that received the message
     """
 
+    if ws is not self.connection: return
     try:
-      if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug(f"received : {loads(message)}")
-      payload : Payload = Payload.from_data(loads(message))
+      if self.inflator:
+        message : Optional[bytes] = self.inflator.feed(message)
+        if message is None: return
+      header  : Optional[Tuple[str, int]] = self.codec.peek(message)
+      if header and not self.subscribed(header[0]): return self.skip(*header)
+      data    : Dict[str, Any] = self.codec.decode(message)
+      if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug(f"received : {data}")
+      payload : Payload        = Payload.from_data(data)
 
       match payload.op:
         case PayloadType.Hello:
           if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug("Received Hello event")
           self.heartbeat_interval : int = payload.d["heartbeat_interval"]
-          Thread(
-            target = self.send_heartbeat,
-            kwargs = {
-              "jitter": True
-            }
-          ).start()
+          if self.heartbeat: self.heartbeat.stop()
+          self.heartbeat : Heartbeat = Heartbeat(self, self.heartbeat_interval)
+          self.heartbeat.start()
+          if self.is_resuming:
+            self.send(
+              Payload(
+                op = PayloadType.Resume,
+                d  = {
+                  "token"      : self.app._App__token,
+                  "session_id" : self.__session_id,
+                  "seq"        : self.last_sequence
+                }
+              )
+            )
+            self.is_resuming : bool = False
 
         case PayloadType.HeartBeatACK:
           if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug("Received Heartbeat ACK")
-          if not self.identify_sent and not self.is_resuming:
+          if self.heartbeat: self.heartbeat.ack()
+          if not self.identify_sent and self.state is not ConnectionState.Resuming:
+            self.identify_sent : bool            = True
+            self.state         : ConnectionState = ConnectionState.Identifying
             Thread(
               target = self.identify
             ).start()
-          Thread(
-            target = self.send_heartbeat
-          ).start()
 
         case PayloadType.HeartBeat:
-          Thread(
-            target = self.send_heartbeat
-          ).start()
+          if self.heartbeat: self.heartbeat.beat()
 
         case PayloadType.Reconnect:
-          if payload.d: self.resume()
-          else: self.reconnect()
+          self.resume()
+
+        case PayloadType.InvalidSession:
+          if self.app.logger: self.app.logger.warn(f"Session of shard {self.shard_id} was invalidated, {"resuming" if payload.d else "identifying a new one"}")
+          rel.timeout(uniform(1, 5), self.resume if payload.d else self.reconnect)
 
         case PayloadType.Dispatch:
-          self.last_sequence : Optional[int] = payload.s
-          match payload.t:
-            case GatewayEvents.Ready:
-              if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug("Received READY event")
-              Thread(
-                target = self.setup_ready,
-                args   = [
-                  payload
-                ]
-              ).start()
-
-            case GatewayEvents.GuildCreate:
-              if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug("Received GUILD_CREATE event")
-              guild = Guild.from_data(self, payload.d)
-              Thread(
-                target = asyncio.run,
-                args   = [
-                  self.app._App__app_events.call(
-                    payload.t,
-                    guild = guild
-                  )
-                ]
-              ).start()
-
-            case GatewayEvents.Resumed:
-              if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug("Connection resumed")
+          self.sequence(payload)
     except Exception as error:
-      if self.app.logger: return self.app.logger.error(error)
\ No newline at end of file
+      if self.app.logger: return self.app.logger.error(error)
+
+
+  def subscribed(
+    self,
+    event : Union[GatewayEvents, str]
+  ) -> bool:
+    """
+    Checks whether anything reads an event: the connection's own handling, the cache, an event listener or a pending ` wait_for `
+
+    Parameters
+    ----------
+    event : Union[GatewayEvents, str]
+      Event or event name
+
+    Returns
+    -------
+    bool
+    """
+    name : str = event._value_ if isinstance(event, GatewayEvents) else event
+    return name in self.consumed_events or name in self.app.events.listeners or name in self.app.events.waiters
+
+
+  def skip(
+    self,
+    event    : str,
+    sequence : int
+  ) -> None:
+    """
+    Keeps the sequence bookkeeping of an event nothing reads, without decoding it or building any model
+
+    Parameters
+    ----------
+    event : str
+      Name of the event
+
+    sequence : int
+      Sequence number of the event
+    """
+    self.sequence(
+      Payload(
+        op = PayloadType.Dispatch,
+        t  = event,
+        s  = sequence
+      )
+    )
+
+
+  def sequence(
+    self,
+    payload : Payload
+  ) -> None:
+    """
+    Feeds a Dispatch payload to the sequencer, and handles the payloads it releases. Payloads of skipped events are only counted
+    """
+    for event in self.sequencer.push(payload):
+      self.last_sequence : Optional[int] = self.sequencer.last
+      if event.d is None and not self.subscribed(event.t): continue
+      self.dispatch(event)
+
+
+  def dispatch(
+    self,
+    payload : Payload
+  ) -> None:
+    """
+    Handles a Dispatch payload, once it is in sequence, and schedules its event listeners
+
+    Parameters
+    ----------
+    payload : Payload
+      Received Dispatch payload
+    """
+
+    match payload.t:
+      case GatewayEvents.Ready:
+        if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug("Received READY event")
+        if self.inflator and self.app.logger and self.app.logger.debug_mode: self.app.logger.debug(f"{self.inflator.compressed_bytes:,} bytes received on the wire, {self.inflator.decompressed_bytes:,} bytes decompressed")
+        self.state : ConnectionState = ConnectionState.Connected
+        self.backoff.reset()
+        self.setup_ready(payload)
+
+      case GatewayEvents.GuildCreate:
+        if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug("Received GUILD_CREATE event")
+        guild : Guild = self.app.guilds.add(Guild.from_data(self, payload.d))
+        self.app.events.emit(self, payload, guild)
+
+      case GatewayEvents.GuildMembersChunk:
+        self.members_chunk(payload)
+        self.app.events.emit(self, payload)
+
+      case GatewayEvents.Resumed:
+        self.state : ConnectionState = ConnectionState.Connected
+        self.backoff.reset()
+        if self.app.logger and self.app.logger.debug_mode: self.app.logger.debug(f"Connection resumed, {self.sequencer.duplicates} replayed events dropped so far")
+        self.app.events.emit(self, payload)
+
+      case _:
+        if payload.t in self.cache_events: self.update_cache(payload)
+        self.app.events.emit(self, payload)
\ No newline at end of file
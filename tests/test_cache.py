@@ -0,0 +1,99 @@
+import pytest
+
+from democord.cache import (
+                           CachePolicy,
+                           EntityCache,
+                           MemberCache
+                           )
+from time           import sleep
+from types          import SimpleNamespace
+from typing         import *
+
+
+def entity(
+  entity_id : int,
+  **kwargs
+) -> SimpleNamespace:
+  return SimpleNamespace(id = entity_id, **kwargs)
+
+
+def fake_guild(
+  member_count : Optional[int] = None
+) -> SimpleNamespace:
+  return SimpleNamespace(_data = {"member_count": member_count} if member_count is not None else {})
+
+
+def test_max_entries_evicts_the_oldest() -> None:
+  cache : EntityCache = EntityCache(policy = CachePolicy(max_entries = 2))
+  for entity_id in range(3): cache.add(entity(entity_id))
+  assert [item.id for item in cache] == [1, 2]
+  assert cache.evictions == 1
+
+
+def test_lru_evicts_the_least_recently_used() -> None:
+  cache : EntityCache = EntityCache(policy = CachePolicy(max_entries = 2, lru = True))
+  for entity_id in range(2): cache.add(entity(entity_id))
+  cache.get(0)
+  cache.add(entity(2))
+  assert [item.id for item in cache] == [0, 2]
+
+
+def test_ttl_expires_entities() -> None:
+  cache : EntityCache = EntityCache(policy = CachePolicy(ttl = 0.05))
+  cache.add(entity(1))
+  assert 1 in cache
+  sleep(0.1)
+  assert 1 not in cache
+  assert cache.evictions == 1
+
+
+def test_secondary_index_follows_updates() -> None:
+  cache  : EntityCache     = EntityCache(indexes = ("nick",))
+  member : SimpleNamespace = cache.add(entity(1, nick = "old"))
+  member.nick : str = "new"
+  cache.add(member)
+  assert cache(nick = "new") is member
+  assert cache(nick = "old") is None
+
+
+def test_max_total_caps_every_guild_together() -> None:
+  policy : CachePolicy       = CachePolicy(max_entries = 3, max_total = 4)
+  guilds : List[MemberCache] = [MemberCache(fake_guild(), policy = policy) for _ in range(2)]
+  for member_id in range(3): guilds[0].add(entity(member_id))
+  for member_id in range(3): guilds[1].add(entity(member_id))
+  assert [member.id for member in guilds[0]] == [2]
+  assert [member.id for member in guilds[1]] == [0, 1, 2]
+  assert len(policy._entries) == 4
+
+
+def test_max_total_evicts_the_least_recently_used_across_guilds() -> None:
+  policy : CachePolicy       = CachePolicy(max_total = 2, lru = True)
+  guilds : List[MemberCache] = [MemberCache(fake_guild(), policy = policy) for _ in range(2)]
+  guilds[0].add(entity(1))
+  guilds[1].add(entity(1))
+  guilds[0].get(1)
+  guilds[1].add(entity(2))
+  assert 1 in guilds[0]
+  assert 1 not in guilds[1]
+
+
+def test_cleared_caches_release_their_budget() -> None:
+  policy : CachePolicy = CachePolicy(max_total = 2)
+  first  : MemberCache = MemberCache(fake_guild(), policy = policy)
+  second : MemberCache = MemberCache(fake_guild(), policy = policy)
+  for member_id in range(2): first.add(entity(member_id))
+  first.clear()
+  for member_id in range(2): second.add(entity(member_id))
+  assert len(second) == 2
+  assert second.evictions == 0
+
+
+def test_large_guilds_are_not_cached() -> None:
+  cache : MemberCache = MemberCache(fake_guild(member_count = 10), policy = CachePolicy(member_threshold = 5))
+  cache.add(entity(1))
+  assert len(cache) == 0
+
+
+def test_invalid_policies_are_rejected() -> None:
+  with pytest.raises(ValueError): CachePolicy(max_total = 0)
+  with pytest.raises(ValueError): CachePolicy(max_entries = 0)
\ No newline at end of file
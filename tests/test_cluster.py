@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+from democord.cluster   import (
+                               Cluster,
+                               ClusterClient
+                               )
+from democord.sharding  import IdentifyLimiter
+from threading          import Thread
+from time               import monotonic
+from typing             import *
+
+
+class FakeProcess:
+  def __init__(
+    self,
+    alive : bool = True
+  ) -> None:
+    self.alive    : bool = alive
+    self.exitcode : int  = 1
+
+  def is_alive(
+    self
+  ) -> bool:
+    return self.alive
+
+
+def cluster(
+  **kwargs
+) -> Cluster:
+  return Cluster(
+    lambda **_: None,
+    shard_count      = 4,
+    processes        = 2,
+    identify_limiter = IdentifyLimiter(1, interval = 0.2, total = 10, remaining = 10, reset_after = 3_600),
+    **kwargs
+  )
+
+
+def test_identifies_are_spaced_across_workers() -> None:
+  supervisor : Cluster             = cluster()
+  clients    : List[ClusterClient] = [
+    ClusterClient(None, worker_id, 4, supervisor.shard_ranges, supervisor._inboxes, supervisor._supervisor)
+    for worker_id in range(2)
+  ]
+  for client in clients: client.start()
+  Thread(target = supervisor._serve_identifies, daemon = True).start()
+
+  def identify(
+    shard_id : int
+  ) -> Tuple[float, Optional[int]]:
+    remaining : Optional[int] = clients[shard_id // 2].identify(shard_id)
+    return monotonic(), remaining
+
+  with ThreadPoolExecutor(4) as pool:
+    grants : List[Tuple[float, Optional[int]]] = sorted(pool.map(identify, range(4)))
+  supervisor._supervisor.put(("stop",))
+  for inbox in supervisor._inboxes: inbox.put(("stop",))
+  times  : List[float] = [granted for granted, _ in grants]
+  assert all(later - earlier >= 0.19 for earlier, later in zip(times, times[1:]))
+  assert sorted(remaining for _, remaining in grants) == [6, 7, 8, 9]
+  assert supervisor.identify_limiter.remaining == 6
+
+
+def test_restarts_back_off_without_blocking() -> None:
+  supervisor : Cluster = cluster(restart_delay = 1.0, max_restart_delay = 8.0)
+  supervisor._spawn    = lambda worker_id: FakeProcess()
+  supervisor._workers  = [FakeProcess(False), FakeProcess()]
+  supervisor._started  = [monotonic(), monotonic()]
+
+  started : float = monotonic()
+  supervisor.supervise()
+  assert monotonic() - started < 0.1
+  assert 0.9 <= supervisor._restarts[0] - started <= 1.1
+  assert 1 not in supervisor._restarts
+
+  delays : List[float] = [supervisor.restart_delay_for(0) for _ in range(4)]
+  assert delays == [2.0, 4.0, 8.0, 8.0]
+
+  supervisor._restarts[0] = monotonic()
+  supervisor.supervise()
+  assert supervisor._workers[0].is_alive()
+  assert not supervisor._restarts
+
+
+def test_stable_workers_restart_from_the_base_delay() -> None:
+  supervisor : Cluster = cluster(restart_delay = 1.0, max_restart_delay = 8.0)
+  supervisor._crashes[0] = 3
+  supervisor._started[0] = monotonic() - 10.0
+  assert supervisor.restart_delay_for(0) == 1.0
\ No newline at end of file
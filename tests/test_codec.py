@@ -0,0 +1,262 @@
+import pytest
+
+from democord.cache    import EntityCache
+from democord.codec    import (
+                              ETFCodec,
+                              JSONCodec
+                              )
+from democord.guild    import Guild
+from democord.payloads import Payload
+from democord.user     import User
+from struct            import pack
+from types             import SimpleNamespace
+from typing            import *
+from zlib              import compress
+
+
+USER   : Dict[str, Any] = {
+  "id"            : "80351110224678912",
+  "username"      : "nelly",
+  "global_name"   : "Nelly ✨",
+  "discriminator" : "0",
+  "avatar"        : "8342729096ea3675442027381ff50dfe",
+  "bot"           : False,
+  "public_flags"  : 4194304
+}
+
+GUILD  : Dict[str, Any] = {
+  "id"                            : "197038439483310086",
+  "name"                          : "Discord Testers",
+  "icon"                          : None,
+  "owner_id"                      : "73193882359173120",
+  "afk_timeout"                   : 300,
+  "member_count"                  : 3,
+  "large"                         : False,
+  "unavailable"                   : False,
+  "verification_level"            : 2,
+  "default_message_notifications" : 1,
+  "explicit_content_filter"       : 2,
+  "mfa_level"                     : 1,
+  "nsfw_level"                    : 0,
+  "premium_tier"                  : 3,
+  "system_channel_flags"          : 0,
+  "features"                      : ["ANIMATED_ICON", "COMMUNITY"],
+  "joined_at"                     : "2023-01-01T00:00:00.000000+00:00",
+  "roles"                         : [
+    {"id": "197038439483310086", "name": "@everyone", "permissions": "1071698660929", "position": 0, "color": 0, "hoist": False, "managed": False, "mentionable": False},
+    {"id": "1099720232465633321", "name": "Mods", "permissions": "8", "position": 1, "color": 16711680, "hoist": True, "managed": False, "mentionable": True}
+  ],
+  "channels"                      : [
+    {
+      "id"                    : "41771983423143937",
+      "type"                  : 0,
+      "name"                  : "general",
+      "position"              : 0,
+      "parent_id"             : None,
+      "nsfw"                  : False,
+      "permission_overwrites" : [
+        {"id": "197038439483310086", "type": 0, "allow": "0", "deny": "2048"},
+        {"id": "1099720232465633321", "type": 0, "allow": "2048", "deny": "0"}
+      ]
+    }
+  ],
+  "members"                       : [
+    {"user": USER, "nick": None, "roles": ["1099720232465633321"], "joined_at": "2023-01-01T00:00:00.000000+00:00", "deaf": False, "mute": False, "flags": 0},
+    {"user": {**USER, "id": "73193882359173120", "username": "owner"}, "nick": "Boss", "roles": [], "joined_at": "2022-05-01T00:00:00.000000+00:00", "deaf": False, "mute": True, "flags": 0}
+  ]
+}
+
+FIXTURES : List[Dict[str, Any]] = [
+  {"op": 10, "d": {"heartbeat_interval": 41250, "_trace": ["[\"gateway-prd-us-east1-b-0568\",{\"micros\":0.0}]"]}, "s": None, "t": None},
+  {"op": 11, "d": None, "s": None, "t": None},
+  {"op": 7, "d": None, "s": None, "t": None},
+  {"op": 9, "d": True, "s": None, "t": None},
+  {"op": 0, "s": 1, "t": "READY", "d": {
+    "v"                  : 10,
+    "user"               : {**USER, "bot": True},
+    "guilds"             : [{"id": "197038439483310086", "unavailable": True}],
+    "session_id"         : "d4c1fe1a8cda3e5ac1c5e37b7de4b0ab",
+    "resume_gateway_url" : "wss://gateway-us-east1-b.discord.gg",
+    "shard"              : [0, 1],
+    "application"        : {"id": "80351110224678912", "flags": 8953856}
+  }},
+  {"op": 0, "s": 2, "t": "GUILD_CREATE", "d": GUILD},
+  {"op": 0, "s": 3, "t": "MESSAGE_CREATE", "d": {
+    "id"               : "1234567890123456789",
+    "channel_id"       : "41771983423143937",
+    "guild_id"         : "197038439483310086",
+    "author"           : USER,
+    "content"          : "héllo wörld 👋 <@80351110224678912>",
+    "timestamp"        : "2024-02-29T12:00:00.000000+00:00",
+    "edited_timestamp" : None,
+    "tts"              : False,
+    "mention_everyone" : False,
+    "mentions"         : [USER],
+    "mention_roles"    : [],
+    "attachments"      : [],
+    "embeds"           : [{"type": "rich", "title": "", "fields": [{"name": "a", "value": "b", "inline": True}]}],
+    "nonce"            : "1234567890123456000",
+    "pinned"           : False,
+    "type"             : 0
+  }},
+  {"op": 0, "s": 4, "t": "PRESENCE_UPDATE", "d": {
+    "user"          : {"id": "80351110224678912"},
+    "guild_id"      : "197038439483310086",
+    "status"        : "online",
+    "activities"    : [{"name": "Testing", "type": 0, "created_at": 1700000000000}],
+    "client_status" : {"desktop": "online"}
+  }},
+  {"op": 0, "s": 5, "t": "GUILD_MEMBER_UPDATE", "d": {
+    "guild_id"                     : "197038439483310086",
+    "user"                         : USER,
+    "nick"                         : "new nick",
+    "roles"                        : [],
+    "communication_disabled_until" : None,
+    "premium_since"                : None,
+    "pending"                      : False
+  }},
+  {"op": 0, "s": 2147483648, "t": "TYPING_START", "d": {"channel_id": "41771983423143937", "user_id": "80351110224678912", "timestamp": 1700000000}}
+]
+
+
+def snowflake(
+  key : Optional[Union[str, int]]
+) -> bool:
+  """
+  Whether a field holds snowflakes, which Discord sends as strings in JSON and as integers in ETF
+  """
+  return isinstance(key, str) and (key == "id" or key.endswith("_id") or key in ("roles", "mention_roles", "nonce"))
+
+
+def as_etf(
+  value : Any,
+  key   : Optional[str] = None
+) -> Any:
+  """
+  Converts a JSON fixture to the terms the gateway sends in ETF: snowflakes become integers
+  """
+  match value:
+    case dict():
+      return {name: as_etf(item, name) for name, item in value.items()}
+    case list():
+      return [as_etf(item, key) for item in value]
+    case str() if snowflake(key) and value.isdigit():
+      return int(value)
+    case _:
+      return value
+
+
+def etf_term(
+  codec  : ETFCodec,
+  value  : Any,
+  buffer : bytearray
+) -> None:
+  """
+  Encodes a term the way the gateway does, with map keys and event names as atoms
+  """
+  match value:
+    case dict():
+      buffer += pack(">BI", 116, len(value))
+      for name, item in value.items():
+        encoded : bytes = name.encode("utf-8")
+        buffer += pack(">BB", 119, len(encoded)) + encoded
+        if name == "t" and item is not None:
+          encoded : bytes = item.encode("utf-8")
+          buffer += pack(">BH", 118, len(encoded)) + encoded
+        else:
+          etf_term(codec, item, buffer)
+    case list() if value:
+      buffer += pack(">BI", 108, len(value))
+      for item in value: etf_term(codec, item, buffer)
+      buffer.append(106)
+    case _:
+      codec._encode(value, buffer)
+
+
+def etf_frame(
+  value      : Any,
+  compressed : bool = False
+) -> bytes:
+  """
+  Builds the binary frame the gateway would send for a JSON fixture
+  """
+  codec  : ETFCodec  = ETFCodec()
+  buffer : bytearray = bytearray()
+  etf_term(codec, as_etf(value), buffer)
+  if compressed: return bytes((codec.version, 80)) + pack(">I", len(buffer)) + compress(bytes(buffer))
+  return bytes((codec.version,)) + bytes(buffer)
+
+
+def fake_ws() -> SimpleNamespace:
+  return SimpleNamespace(app = SimpleNamespace(cache_policies = {}, users = EntityCache(), user = None, logger = None))
+
+
+@pytest.fixture(params = ["json", "orjson", "msgspec"])
+def json_codec(
+  request : pytest.FixtureRequest
+) -> JSONCodec:
+  try:
+    return JSONCodec(request.param)
+  except ImportError:
+    pytest.skip(f"{request.param} is not installed")
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids = lambda fixture: fixture["t"] or f"op{fixture["op"]}")
+@pytest.mark.parametrize("compressed", [False, True], ids = ["plain", "compressed"])
+def test_decoded_payloads_match(
+  json_codec : JSONCodec,
+  fixture    : Dict[str, Any],
+  compressed : bool
+) -> None:
+  from_json : Any = json_codec.decode(JSONCodec("json").encode(fixture))
+  from_etf  : Any = ETFCodec().decode(etf_frame(fixture, compressed))
+  assert as_etf(from_json) == from_etf
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids = lambda fixture: fixture["t"] or f"op{fixture["op"]}")
+def test_payloads_match(
+  fixture : Dict[str, Any]
+) -> None:
+  from_json : Payload = Payload.from_data(JSONCodec().decode(JSONCodec().encode(fixture)))
+  from_etf  : Payload = Payload.from_data(ETFCodec().decode(etf_frame(fixture)))
+  assert (from_json.op, from_json.t, from_json.s) == (from_etf.op, from_etf.t, from_etf.s)
+  assert as_etf(from_json.d) == from_etf.d
+
+
+def test_guilds_match() -> None:
+  fixture   : Dict[str, Any] = FIXTURES[5]
+  from_json : Guild          = Guild.from_data(fake_ws(), JSONCodec().decode(JSONCodec().encode(fixture))["d"])
+  from_etf  : Guild          = Guild.from_data(fake_ws(), ETFCodec().decode(etf_frame(fixture))["d"])
+  assert from_json.id == from_etf.id == 197038439483310086
+  assert from_json.name == from_etf.name
+  assert from_json.verification_level == from_etf.verification_level
+  assert [(role.id, role.name, int(role.permissions)) for role in from_json.roles] == [(role.id, role.name, int(role.permissions)) for role in from_etf.roles]
+  assert [(channel.id, channel.overwrites) for channel in from_json.channels] == [(channel.id, channel.overwrites) for channel in from_etf.channels]
+  assert [(member.id, member.nick, member.role_ids) for member in from_json.members] == [(member.id, member.nick, member.role_ids) for member in from_etf.members]
+  for json_member, etf_member in zip(from_json.members, from_etf.members):
+    assert from_json.permissions_for(json_member) == from_etf.permissions_for(etf_member)
+    assert from_json.permissions_for(json_member, from_json.channels.get(41771983423143937)) == from_etf.permissions_for(etf_member, from_etf.channels.get(41771983423143937))
+
+
+def test_users_match() -> None:
+  from_json : User = User.from_data(JSONCodec().decode(JSONCodec().encode(USER)))
+  from_etf  : User = User.from_data(ETFCodec().decode(etf_frame(USER)))
+  assert from_json.id == from_etf.id == 80351110224678912
+  assert (from_json.username, from_json.global_name, from_json.bot) == (from_etf.username, from_etf.global_name, from_etf.bot)
+
+
+@pytest.mark.parametrize("value", [
+  {"op": 2, "d": {"token": "token", "intents": 3276799, "properties": {"os": "linux", "browser": "democord", "device": "democord"}, "compress": False, "large_threshold": 250, "shard": [0, 1], "presence": None}},
+  {"op": 1, "d": 2147483648},
+  {"op": 8, "d": {"guild_id": "197038439483310086", "user_ids": [80351110224678912, -1, 0, 255, 256], "limit": 0, "presences": True, "nonce": "1.0"}},
+  {"op": 3, "d": {"since": 1.5, "activities": [], "status": "idle", "afk": True}}
+], ids = ["identify", "heartbeat", "request_members", "presence"])
+def test_sent_payloads_round_trip(
+  value : Dict[str, Any]
+) -> None:
+  assert ETFCodec().decode(ETFCodec().encode(value)) == value
+
+
+def test_etf_peek_defers_to_decoding() -> None:
+  assert ETFCodec().peek(etf_frame(FIXTURES[4])) is None
+  assert JSONCodec("json").peek('{"t":"READY","s":1,"op":0,"d":{}}') == ("READY", 1)
\ No newline at end of file
@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+
+from concurrent.futures  import Future
+from democord.dispatcher import Dispatcher
+from threading           import (
+                                Thread,
+                                current_thread
+                                )
+from typing              import *
+
+
+@pytest.fixture
+def dispatcher() -> Iterator[Dispatcher]:
+  dispatcher : Dispatcher = Dispatcher()
+  dispatcher.start()
+  yield dispatcher
+  dispatcher.stop()
+  dispatcher.join(2)
+
+
+def test_listeners_start_in_submission_order(
+  dispatcher : Dispatcher
+) -> None:
+  started : List[int] = []
+  done    : Future    = Future()
+
+  async def listener(
+    index : int
+  ) -> None:
+    started.append(index)
+    if index == 99: done.set_result(None)
+
+  for index in range(100): dispatcher.submit(listener(index))
+  done.result(1)
+  assert started == list(range(100))
+  assert dispatcher.latency is not None and dispatcher.latency >= 0
+  assert dispatcher.queue_depth == 0
+
+
+def test_listeners_share_one_loop_and_thread(
+  dispatcher : Dispatcher
+) -> None:
+  seen : List[Future] = [Future() for _ in range(3)]
+
+  async def listener(
+    future : Future
+  ) -> None:
+    future.set_result((asyncio.get_running_loop(), current_thread().name))
+
+  for future in seen: Thread(target = dispatcher.submit, args = (listener(future),)).start()
+  assert {future.result(1) for future in seen} == {(dispatcher.loop, "democord-dispatcher")}
+
+
+def test_stop_cancels_running_listeners_and_closes_the_loop(
+  dispatcher : Dispatcher
+) -> None:
+  running   : Future = Future()
+  cancelled : Future = Future()
+
+  async def listener() -> None:
+    running.set_result(None)
+    try:
+      await asyncio.sleep(60)
+    except asyncio.CancelledError:
+      cancelled.set_result(None)
+      raise
+
+  dispatcher.submit(listener())
+  running.result(1)
+  dispatcher.stop()
+  dispatcher.join(2)
+  assert not dispatcher.is_alive()
+  assert cancelled.done()
+  assert dispatcher.loop.is_closed()
\ No newline at end of file
@@ -0,0 +1,160 @@
+import asyncio
+import pytest
+
+from concurrent.futures import (
+                               Future,
+                               TimeoutError
+                               )
+from democord.cache      import EntityCache
+from democord.dispatcher import Dispatcher
+from democord.enums      import GatewayEvents
+from democord.events     import AppEvents
+from democord.payloads   import Payload
+from democord.user       import User
+from threading           import Thread
+from types               import SimpleNamespace
+from typing              import *
+
+
+async def noop(
+  *args
+) -> None:
+  pass
+
+
+@pytest.fixture
+def events() -> Iterator[AppEvents]:
+  dispatcher : Dispatcher      = Dispatcher()
+  dispatcher.start()
+  app        : SimpleNamespace = SimpleNamespace(on_ready = noop, on_guild_available = noop, dispatcher = dispatcher, logger = None)
+  yield AppEvents(app)
+  dispatcher.stop()
+  dispatcher.join(2)
+
+
+def fake_ws() -> SimpleNamespace:
+  return SimpleNamespace(app = SimpleNamespace(cache_policies = {}, guilds = EntityCache(), users = EntityCache(), user = None, logger = None))
+
+
+def dispatch(
+  event : GatewayEvents,
+  data  : Any
+) -> Payload:
+  return Payload(op = 0, d = data, s = 1, t = event)
+
+
+def waiting(
+  events : AppEvents,
+  name   : str,
+  **kwargs
+) -> Future:
+  """
+  Starts a ` wait_for ` on the dispatcher, and returns once it is registered
+  """
+  future : Future = asyncio.run_coroutine_threadsafe(events.wait_for(name, **kwargs), events.app.dispatcher.loop)
+  asyncio.run_coroutine_threadsafe(asyncio.sleep(0.01), events.app.dispatcher.loop).result(1)
+  return future
+
+
+def test_listener_names_resolve_to_events() -> None:
+  assert AppEvents.resolve("on_ready") == "READY"
+  assert AppEvents.resolve("on_message_create") == "MESSAGE_CREATE"
+  assert AppEvents.resolve("guild_create") == "GUILD_CREATE"
+  assert AppEvents.resolve(GatewayEvents.TypingStart) == "TYPING_START"
+
+
+def test_every_event_has_a_parser() -> None:
+  assert {event.value for event in GatewayEvents} <= AppEvents.parsers.keys()
+
+
+def test_listeners_receive_parsed_arguments(
+  events : AppEvents
+) -> None:
+  received : Dict[str, Future] = {name: Future() for name in ("MESSAGE_CREATE", "GUILD_BAN_ADD", "GUILD_ROLE_DELETE", "SOME_NEW_EVENT")}
+
+  def listener(
+    name : str
+  ) -> Callable[..., Coroutine]:
+    async def callback(
+      *args
+    ) -> None:
+      received[name].set_result(args)
+    return callback
+
+  for name in received: events.add(name, listener(name))
+  message : Dict[str, Any] = {"id": "1", "channel_id": "2", "content": "hi"}
+  events.emit(fake_ws(), dispatch(GatewayEvents.MessageCreate, message))
+  events.emit(fake_ws(), dispatch(GatewayEvents.GuildBanAdd, {"guild_id": "3", "user": {"id": "4", "username": "banned"}}))
+  events.emit(fake_ws(), dispatch(GatewayEvents.GuildRoleDelete, {"guild_id": "3", "role_id": "5"}))
+  events.emit(fake_ws(), Payload(op = 0, d = {"x": 1}, s = 2, t = "SOME_NEW_EVENT"))
+  assert received["MESSAGE_CREATE"].result(1) == (message,)
+  guild, user = received["GUILD_BAN_ADD"].result(1)
+  assert guild is None and isinstance(user, User) and user.id == 4
+  assert received["GUILD_ROLE_DELETE"].result(1) == (None, 5)
+  assert received["SOME_NEW_EVENT"].result(1) == ({"x": 1},)
+
+
+def test_waiters_are_routed_by_guild(
+  events : AppEvents
+) -> None:
+  other : Future = waiting(events, "on_message_create", guild_id = 2)
+  mine  : Future = waiting(events, "on_message_create", guild_id = 1)
+  any_  : Future = waiting(events, "on_message_create", check = lambda message: message["content"] == "b")
+  events.emit(fake_ws(), dispatch(GatewayEvents.MessageCreate, {"guild_id": "1", "content": "a"}))
+  assert mine.result(1) == {"guild_id": "1", "content": "a"}
+  events.emit(fake_ws(), dispatch(GatewayEvents.MessageCreate, {"guild_id": "1", "content": "b"}))
+  assert any_.result(1)["content"] == "b"
+  assert not other.done()
+  other.cancel()
+
+
+def test_waiter_registered_after_emit_still_gets_its_guild(
+  events : AppEvents
+) -> None:
+  held : Future = Future()
+  events.add("message_create", noop)
+  events.app.dispatcher.loop.call_soon_threadsafe(lambda: held.result())
+  events.emit(fake_ws(), dispatch(GatewayEvents.MessageCreate, {"guild_id": "1", "content": "a"}))
+  future : Future = asyncio.run_coroutine_threadsafe(events.wait_for("message_create", guild_id = 1), events.app.dispatcher.loop)
+  held.set_result(None)
+  assert future.result(1)["content"] == "a"
+
+
+def test_wait_for_times_out(
+  events : AppEvents
+) -> None:
+  with pytest.raises(TimeoutError):
+    waiting(events, "guild_create", timeout = 0.05).result(1)
+  assert not events.waiters
+
+def test_failing_check_raises_in_its_waiter(
+  events : AppEvents
+) -> None:
+  future : Future = waiting(events, "message_create", check = lambda message: message["missing"])
+  events.emit(fake_ws(), dispatch(GatewayEvents.MessageCreate, {"content": "a"}))
+  with pytest.raises(KeyError):
+    future.result(1)
+  assert not events.waiters
+
+
+def test_cancelled_waiter_leaves_the_index(
+  events : AppEvents
+) -> None:
+  future : Future = waiting(events, "message_create", guild_id = 1, timeout = 60)
+  assert events.waiters["MESSAGE_CREATE"][1]
+  future.cancel()
+  asyncio.run_coroutine_threadsafe(asyncio.sleep(0.01), events.app.dispatcher.loop).result(1)
+  assert not events.waiters
+
+
+def test_wait_for_from_another_loop(
+  events : AppEvents
+) -> None:
+  async def wait() -> Any:
+    return await events.wait_for("guild_role_delete", timeout = 1)
+
+  result : Future = Future()
+  Thread(target = lambda: result.set_result(asyncio.run(wait()))).start()
+  while not events.waiters: asyncio.run_coroutine_threadsafe(asyncio.sleep(0.01), events.app.dispatcher.loop).result(1)
+  events.emit(fake_ws(), dispatch(GatewayEvents.GuildRoleDelete, {"guild_id": "3", "role_id": "5"}))
+  assert result.result(1) == (None, 5)
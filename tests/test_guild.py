@@ -0,0 +1,141 @@
+import asyncio
+import pytest
+
+from democord.cache  import (
+                            CachePolicy,
+                            EntityCache
+                            )
+from democord.enums  import PermissionFlags
+from democord.errors import HTTPException
+from democord.guild  import Guild
+from democord.member import Member
+from types           import SimpleNamespace
+from typing          import *
+from urllib.parse    import urlsplit
+
+
+def fake_ws(
+  **policies : CachePolicy
+) -> SimpleNamespace:
+  return SimpleNamespace(app = SimpleNamespace(cache_policies = policies, users = EntityCache(), user = None, logger = None))
+
+
+def guild_payload(
+  members : int = 3
+) -> Dict[str, Any]:
+  return {
+    "id"           : "1",
+    "name"         : "guild",
+    "owner_id"     : "10",
+    "member_count" : members,
+    "roles"        : [{"id": "1", "name": "@everyone", "permissions": "1024"}, {"id": "2", "name": "mods", "permissions": "8"}],
+    "channels"     : [{"id": "3", "type": 0, "name": "general", "permission_overwrites": []}],
+    "members"      : [{"user": {"id": str(10 + index), "username": f"user{index}"}, "nick": None, "roles": []} for index in range(members)],
+    "presences"    : [{"user": {"id": str(10 + index)}, "status": "online"} for index in range(members)]
+  }
+
+
+def test_guild_keeps_only_its_own_fields() -> None:
+  payload : Dict[str, Any] = guild_payload()
+  guild   : Guild          = Guild.from_data(fake_ws(), payload)
+  assert not Guild.entity_fields & guild._data.keys()
+  assert guild._data["name"] == "guild"
+  assert len(guild.members) == 3 and len(guild.roles) == 2 and len(guild.channels) == 1
+  assert "members" in payload
+
+
+def test_guild_update_does_not_mutate_the_payload() -> None:
+  payload : Dict[str, Any] = guild_payload()
+  guild   : Guild          = Guild.from_data(fake_ws(), payload)
+  data    : Dict[str, Any] = guild._data
+  guild._update({"member_count": 4, "presences": []}, lazy = False)
+  assert data["member_count"] == 3
+  assert guild._data["member_count"] == 4
+  assert "presences" not in guild._data
+
+
+
+class FakeMemberRoutes:
+  """
+  Stand-in for the member routes of the guild built from ` guild_payload `, answering ` PATCH ` with the edited member and tracking how many requests are in flight
+  """
+
+  def __init__(
+    self,
+    error : bool = False
+  ) -> None:
+    self.error     : bool = error
+    self.fetched   : int  = 0
+    self.in_flight : int  = 0
+    self.peak      : int  = 0
+
+
+  def member(
+    self,
+    endpoint : str
+  ) -> Dict[str, Any]:
+    member_id : str = urlsplit(endpoint).path.rsplit("/", 1)[-1]
+    return {"user": {"id": member_id, "username": f"user{member_id}"}, "nick": None, "roles": []}
+
+
+  async def get(
+    self,
+    endpoint : str
+  ) -> Dict[str, Any]:
+    self.fetched += 1
+    return self.member(endpoint)
+
+
+  async def patch(
+    self,
+    endpoint : str,
+    *,
+    data     : Dict[str, Any],
+    reason   : Optional[str] = None
+  ) -> Dict[str, Any]:
+    self.in_flight += 1
+    self.peak      : int = max(self.peak, self.in_flight)
+    await asyncio.sleep(0.01)
+    self.in_flight -= 1
+    if self.error: return {"message": "Missing Permissions", "code": 50013}
+    return {**self.member(endpoint), **data}
+
+
+def routed_guild(
+  routes : FakeMemberRoutes
+) -> Guild:
+  ws       : SimpleNamespace = fake_ws(members = CachePolicy())
+  ws.get   : Callable        = routes.get
+  ws.patch : Callable        = routes.patch
+  return Guild.from_data(ws, guild_payload())
+
+
+def test_edit_roles_raises_rejected_edits() -> None:
+  guild : Guild = routed_guild(FakeMemberRoutes(error = True))
+  with pytest.raises(HTTPException):
+    asyncio.run(guild.members.get(10).add_roles(guild.roles.get(2)))
+
+
+def test_edit_patches_the_cached_member() -> None:
+  guild  : Guild  = routed_guild(FakeMemberRoutes())
+  cached : Member = guild.members.get(11)
+  stale  : Member = Member.from_data(guild.ws, dict(cached._data), guild)
+  assert PermissionFlags.administrator not in guild.permissions_for(cached)
+  asyncio.run(stale.edit(nick = "renamed"))
+  assert cached.nick == "renamed"
+  assert guild.members(nick = "renamed") is cached
+  asyncio.run(stale.add_roles(guild.roles.get(2)))
+  assert cached.role_ids == {2}
+  assert PermissionFlags.administrator in guild.permissions_for(cached)
+
+
+def test_bulk_edit_bounds_the_edits_in_flight() -> None:
+  routes  : FakeMemberRoutes = FakeMemberRoutes()
+  guild   : Guild            = routed_guild(routes)
+  members : List[int]        = [10, 11, 12, *range(100, 120)]
+  results : List[Any]        = asyncio.run(guild.bulk_edit(iter(members), nick = "bulk", concurrency = 4))
+  assert [result.member_id for result in results] == members
+  assert all(results)
+  assert routes.peak == 4
+  assert routes.fetched == 20
+  assert all(guild.members.get(member_id).nick == "bulk" for member_id in members)
\ No newline at end of file
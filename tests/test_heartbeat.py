@@ -0,0 +1,107 @@
+import pytest
+
+from democord           import heartbeat
+from democord.enums     import PayloadType
+from democord.heartbeat import Heartbeat
+from democord.sharding  import Backoff
+from threading          import (
+                               Event,
+                               current_thread
+                               )
+from time               import sleep
+from types              import SimpleNamespace
+from typing             import *
+
+
+class FakeShard:
+  """
+  Connection that never acknowledges heartbeats, recording which thread resumes it
+  """
+
+  def __init__(
+    self
+  ) -> None:
+    self.app           : SimpleNamespace = SimpleNamespace(logger = None)
+    self.backoff       : Backoff         = Backoff(base = 0.5)
+    self.last_sequence : Optional[int]   = None
+    self.resumed_on    : List[str]       = []
+    self.sent          : List[Any]       = []
+
+
+  def send(
+    self,
+    payload : Any
+  ) -> None:
+    self.sent.append(payload)
+
+
+  def resume(
+    self
+  ) -> None:
+    self.resumed_on.append(current_thread().name)
+
+
+def test_zombie_connection_is_resumed_off_the_heartbeat_thread(
+  monkeypatch : pytest.MonkeyPatch
+) -> None:
+  scheduled : List[Tuple[float, Callable[[], None]]] = []
+  handed    : Event                                  = Event()
+
+  def timeout(
+    delay    : float,
+    callback : Callable[[], None]
+  ) -> None:
+    scheduled.append((delay, callback))
+    handed.set()
+
+  monkeypatch.setattr(heartbeat.rel, "timeout", timeout)
+  shard : FakeShard = FakeShard()
+  beats : Heartbeat = Heartbeat(shard, 10, max_missed_acks = 2)
+  beats.start()
+  assert handed.wait(2)
+  beats.join(2)
+  assert not beats.is_alive()
+  assert not shard.resumed_on
+  assert len(shard.sent) == 2
+  delay, callback = scheduled[0]
+  assert 0 <= delay <= 0.5
+  assert callback == shard.resume
+  assert shard.backoff.attempts == 1
+
+def test_ack_records_latency_and_clears_missed_acks() -> None:
+  shard : FakeShard = FakeShard()
+  beats : Heartbeat = Heartbeat(shard, 45_000)
+  beats.missed_acks = 1
+  beats.ack()
+  assert beats.latency is None and beats.missed_acks == 1
+  shard.last_sequence = 7
+  beats.beat()
+  assert shard.sent[0].op == PayloadType.HeartBeat and shard.sent[0].d == 7
+  beats.ack()
+  assert beats.missed_acks == 0
+  assert 0 <= beats.latency < 1
+
+
+def test_first_heartbeat_is_jittered(
+  monkeypatch : pytest.MonkeyPatch
+) -> None:
+  monkeypatch.setattr(heartbeat, "random", lambda: 0.25)
+  shard : FakeShard = FakeShard()
+  beats : Heartbeat = Heartbeat(shard, 400)
+  beats.start()
+  sleep(0.05)
+  assert not shard.sent
+  sleep(0.1)
+  assert len(shard.sent) == 1
+  beats.stop()
+  beats.join(1)
+
+
+def test_stop_ends_the_scheduler_thread() -> None:
+  shard : FakeShard = FakeShard()
+  beats : Heartbeat = Heartbeat(shard, 60_000)
+  beats.start()
+  beats.stop()
+  beats.join(1)
+  assert not beats.is_alive()
+  assert not shard.sent
\ No newline at end of file
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import pytest
+
+from democord.http      import HTTPClient
+from democord.ratelimit import Bucket
+from threading          import Event
+from time               import monotonic
+from typing             import *
+
+
+class FakeResponse:
+  def __init__(
+    self,
+    status_code : int,
+    content     : bytes
+  ) -> None:
+    self.content     : bytes          = content
+    self.headers     : Dict[str, str] = {}
+    self.status_code : int            = status_code
+
+
+class FakeSend:
+  """
+  Stand-in for ` HTTPClient._exchange ` answering every request with a fixed status, optionally held until released
+  """
+
+  def __init__(
+    self,
+    status : int = 200
+  ) -> None:
+    self.calls   : List[Tuple[str, str]] = []
+    self.release : Event                 = Event()
+    self.status  : int                   = status
+    self.release.set()
+
+
+  def __call__(
+    self,
+    method   : str,
+    endpoint : str,
+    bucket   : Bucket,
+    *args
+  ) -> Tuple[Optional[float], FakeResponse]:
+    self.calls.append((method, endpoint))
+    self.release.wait(5)
+    bucket.update(None, None, None, None)
+    if self.status >= 400: return None, FakeResponse(self.status, json.dumps({"message": "Unknown Member", "code": 10007}).encode())
+    return None, FakeResponse(self.status, json.dumps({"endpoint": endpoint, "call": len(self.calls)}).encode())
+
+
+@pytest.fixture
+def client() -> Iterator[HTTPClient]:
+  client : HTTPClient = HTTPClient("token", response_ttls = {"GET /guilds/{guild_id}/members/{id}": 60.0, "GET /guilds/{guild_id}/members": 60.0, "GET /guilds/{guild_id}/channels": 60.0})
+  yield client
+  client.close()
+
+
+def test_cancelled_follower_leaves_the_flight_running(
+  client : HTTPClient
+) -> None:
+  send             : FakeSend = FakeSend()
+  client._exchange : FakeSend = send
+  send.release.clear()
+
+  async def main() -> None:
+    leader    : asyncio.Task = asyncio.create_task(client.arequest("GET", "/users/1"))
+    await asyncio.sleep(0.05)
+    followers : List[asyncio.Task] = [asyncio.create_task(client.arequest("GET", "/users/1")) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    followers[0].cancel()
+    await asyncio.sleep(0.05)
+    send.release.set()
+    assert await leader == {"endpoint": "/users/1", "call": 1}
+    assert await followers[1] == {"endpoint": "/users/1", "call": 1}
+    with pytest.raises(asyncio.CancelledError): await followers[0]
+
+  asyncio.run(main())
+  assert len(send.calls) == 1
+
+
+def test_cancelled_leader_still_answers_followers(
+  client : HTTPClient
+) -> None:
+  send             : FakeSend = FakeSend()
+  client._exchange : FakeSend = send
+  send.release.clear()
+
+  async def main() -> None:
+    leader   : asyncio.Task = asyncio.create_task(client.arequest("GET", "/users/1"))
+    await asyncio.sleep(0.05)
+    follower : asyncio.Task = asyncio.create_task(client.arequest("GET", "/users/1"))
+    await asyncio.sleep(0.05)
+    leader.cancel()
+    await asyncio.sleep(0.05)
+    send.release.set()
+    assert await follower == {"endpoint": "/users/1", "call": 1}
+
+  asyncio.run(main())
+  assert not client._flights
+
+
+def test_queued_leader_cancelled_by_close_fails_the_flight() -> None:
+  client           : HTTPClient = HTTPClient("token", max_concurrency = 1)
+  send             : FakeSend   = FakeSend()
+  client._exchange : FakeSend   = send
+  send.release.clear()
+
+  async def main() -> None:
+    busy   : asyncio.Task = asyncio.create_task(client.arequest("GET", "/a"))
+    await asyncio.sleep(0.05)
+    queued : asyncio.Task = asyncio.create_task(client.arequest("GET", "/b"))
+    await asyncio.sleep(0.05)
+    client.executor.shutdown(wait = False, cancel_futures = True)
+    send.release.set()
+    with pytest.raises(asyncio.CancelledError): await queued
+    await busy
+
+  asyncio.run(main())
+  assert not client._flights
+  client.close()
+
+
+def test_writes_invalidate_related_resources(
+  client : HTTPClient
+) -> None:
+  client._exchange : FakeSend = FakeSend()
+  for endpoint in ("/guilds/1/members/2", "/guilds/1/members?limit=1000&after=0", "/guilds/1/channels", "/guilds/10/members/2", "/guilds/1/members/20"):
+    client.request("GET", endpoint)
+  client.request("PUT", "/guilds/1/members/2/roles/3")
+  assert set(client._responses) == {"/guilds/1/channels", "/guilds/10/members/2", "/guilds/1/members/20"}
+
+
+def test_error_responses_are_not_cached(
+  client : HTTPClient
+) -> None:
+  send             : FakeSend = FakeSend(404)
+  client._exchange : FakeSend = send
+  assert client.request("GET", "/guilds/1/members/2") == {"message": "Unknown Member", "code": 10007}
+  assert not client._responses
+  send.status : int = 200
+  assert client.request("GET", "/guilds/1/members/2")["call"] == 2
+  assert client.request("GET", "/guilds/1/members/2")["call"] == 2
+
+
+def test_exhausted_bucket_holds_no_worker() -> None:
+  client           : HTTPClient = HTTPClient("token", max_concurrency = 2)
+  client._exchange : FakeSend   = FakeSend()
+  bucket           : Bucket     = client.ratelimiter.bucket("PATCH", "/guilds/1")
+  bucket.limit     : int        = 1
+  bucket.remaining : int        = 0
+  bucket.reset_at  : float      = monotonic() + 0.5
+
+  async def main() -> float:
+    held    : List[asyncio.Task] = [asyncio.create_task(client.arequest("PATCH", "/guilds/1")) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    started : float              = monotonic()
+    await client.arequest("PATCH", "/guilds/2")
+    elapsed : float              = monotonic() - started
+    await asyncio.gather(*held)
+    return elapsed
+
+  assert asyncio.run(main()) < 0.2
+  client.close()
\ No newline at end of file
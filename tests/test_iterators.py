@@ -0,0 +1,166 @@
+import asyncio
+import gc
+import pytest
+
+from democord.cache     import EntityCache
+from democord.iterators import (
+                               MemberChunkIterator,
+                               MemberIterator
+                               )
+from itertools          import count
+from types              import SimpleNamespace
+from typing             import *
+from urllib.parse       import (
+                               parse_qs,
+                               urlsplit
+                               )
+from weakref            import WeakValueDictionary
+
+
+class FakeMembersEndpoint:
+  """
+  Stand-in for ` GET /guilds/{guild.id}/members `, serving ` total ` members with IDs from 1 and recording every page request
+  """
+
+  def __init__(
+    self,
+    total : int
+  ) -> None:
+    self.requests : List[Tuple[int, int]] = []
+    self.total    : int                   = total
+
+
+  async def __call__(
+    self,
+    endpoint : str
+  ) -> List[Dict[str, Any]]:
+    query : Dict[str, List[str]] = parse_qs(urlsplit(endpoint).query)
+    limit : int                  = int(query["limit"][0])
+    after : int                  = int(query["after"][0])
+    self.requests.append((limit, after))
+    return [
+      {"user": {"id": str(member_id), "username": f"user{member_id}"}, "nick": None, "roles": []}
+      for member_id in range(after + 1, min(after + limit, self.total) + 1)
+    ]
+
+
+def fake_guild(
+  total : int
+) -> SimpleNamespace:
+  ws : SimpleNamespace = SimpleNamespace(get = FakeMembersEndpoint(total), app = SimpleNamespace(cache_policies = {}, users = EntityCache(), user = None, logger = None))
+  return SimpleNamespace(id = 1, ws = ws, members = EntityCache())
+
+
+def collect(
+  iterator : MemberIterator
+) -> List[int]:
+  async def main() -> List[int]:
+    return [member.id async for member in iterator]
+
+  return asyncio.run(main())
+
+
+def test_pages_are_sized_by_the_remaining_limit() -> None:
+  guild : SimpleNamespace = fake_guild(50)
+  assert collect(MemberIterator(guild, limit = 25, page_size = 10)) == list(range(1, 26))
+  assert guild.ws.get.requests == [(10, 0), (10, 10), (5, 20)]
+
+
+def test_small_limits_need_a_single_request() -> None:
+  guild : SimpleNamespace = fake_guild(2_000)
+  assert collect(MemberIterator(guild, limit = 3)) == [1, 2, 3]
+  assert guild.ws.get.requests == [(3, 0)]
+
+
+def test_limit_on_a_page_boundary_skips_the_prefetch() -> None:
+  guild : SimpleNamespace = fake_guild(50)
+  assert len(collect(MemberIterator(guild, limit = 20, page_size = 10))) == 20
+  assert guild.ws.get.requests == [(10, 0), (10, 10)]
+
+
+def test_unlimited_iteration_stops_at_a_short_page() -> None:
+  guild : SimpleNamespace = fake_guild(22)
+  assert collect(MemberIterator(guild, page_size = 10, after = 5)) == list(range(6, 23))
+  assert guild.ws.get.requests == [(10, 5), (10, 15)]
+
+
+def test_iteration_without_prefetch_resumes_from_the_cursor() -> None:
+  guild : SimpleNamespace = fake_guild(30)
+  assert len(collect(MemberIterator(guild, limit = 15, page_size = 10, prefetch = False, cache = True))) == 15
+  assert guild.ws.get.requests == [(10, 0), (5, 10)]
+  assert len(guild.members) == 15
+
+
+def chunk_guild(
+  guild_id : int = 1
+) -> SimpleNamespace:
+  async def asend(
+    payload : Any
+  ) -> None:
+    pass
+
+  app : SimpleNamespace = SimpleNamespace(member_nonces = count(), member_requests = asyncio.Semaphore(1))
+  ws  : SimpleNamespace = SimpleNamespace(app = app, member_requests = WeakValueDictionary(), asend = asend)
+  app.shard_for : Callable[[int], SimpleNamespace] = lambda guild_id: ws
+  return SimpleNamespace(id = guild_id, ws = ws)
+
+
+async def start(
+  request : MemberChunkIterator
+) -> None:
+  """
+  Sends the request, then abandons the wait for its first chunk
+  """
+  waiting : asyncio.Task = asyncio.create_task(request.__anext__())
+  await asyncio.sleep(0.01)
+  waiting.cancel()
+  with pytest.raises(asyncio.CancelledError): await waiting
+
+
+def test_nonces_are_drawn_per_app() -> None:
+  first  : SimpleNamespace = chunk_guild()
+  second : SimpleNamespace = chunk_guild()
+  assert [MemberChunkIterator(first).nonce for _ in range(2)] == ["1.0", "1.1"]
+  assert MemberChunkIterator(second).nonce == "1.0"
+
+
+def test_aclose_releases_the_slot() -> None:
+  guild : SimpleNamespace = chunk_guild()
+
+  async def main() -> None:
+    request : MemberChunkIterator = MemberChunkIterator(guild)
+    await start(request)
+    assert guild.ws.app.member_requests.locked()
+    await request.aclose()
+    assert not guild.ws.app.member_requests.locked()
+    assert request.nonce not in guild.ws.member_requests
+
+  asyncio.run(main())
+
+
+def test_dropped_request_releases_the_slot() -> None:
+  guild : SimpleNamespace = chunk_guild()
+
+  async def main() -> None:
+    await MemberChunkIterator(guild)._send()
+    assert guild.ws.app.member_requests.locked()
+    gc.collect()
+    await asyncio.sleep(0)
+    assert not guild.ws.app.member_requests.locked()
+    assert not guild.ws.member_requests
+
+  asyncio.run(main())
+
+
+def test_cancelled_members_call_releases_the_slot() -> None:
+  guild : SimpleNamespace = chunk_guild()
+
+  async def main() -> None:
+    request : MemberChunkIterator = MemberChunkIterator(guild)
+    waiting : asyncio.Task        = asyncio.create_task(request.members())
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError): await waiting
+    assert not guild.ws.app.member_requests.locked()
+
+  asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,114 @@
+from democord.cache       import EntityCache
+from democord.channels    import GuildChannel
+from democord.enums       import PermissionFlags
+from democord.flags       import UserFlagSet
+from democord.guild       import Guild
+from democord.member      import Member
+from democord.permissions import Permissions
+from types                import SimpleNamespace
+from typing               import *
+
+
+def test_names_are_decoded_on_first_access() -> None:
+  permissions : Permissions = Permissions(PermissionFlags.administrator.value | PermissionFlags.kick_members.value)
+  assert "_names" not in vars(permissions)
+  assert set(permissions.names) == {"administrator", "kick_members"}
+  assert permissions.names is permissions.names
+
+
+def test_membership_does_not_build_sets() -> None:
+  permissions : Permissions = Permissions(PermissionFlags.kick_members.value)
+  built       : int         = 0
+  original    : Callable    = Permissions.__new__
+
+  def counting_new(
+    cls,
+    value : int = 0
+  ) -> Permissions:
+    nonlocal built
+    built += 1
+    return original(cls, value)
+
+  Permissions.__new__ = counting_new
+  try:
+    assert PermissionFlags.kick_members in permissions
+    assert "kick_members" in permissions
+    assert PermissionFlags.ban_members not in permissions
+  finally:
+    Permissions.__new__ = original
+  assert built == 0
+  assert "_names" not in vars(permissions)
+
+
+def test_all_is_built_once() -> None:
+  assert Permissions.all() is Permissions.all()
+  assert all(flag in Permissions.all() for flag in PermissionFlags)
+
+
+def test_permissions_are_not_interned() -> None:
+  assert Permissions(8) is not Permissions(8)
+  assert UserFlagSet(4) is UserFlagSet(4)
+
+def resolved_guild() -> Guild:
+  """
+  Guild with an owner ( 10 ), a member whose role is overwritten in the channel ( 11 ), an administrator ( 12 ) and a member with only ` @everyone ` ( 13 )
+  """
+  view    : str                  = str(PermissionFlags.view_channel.value)
+  send    : str                  = str(PermissionFlags.send_messages.value)
+  members : Dict[int, List[str]] = {10: [], 11: ["3"], 12: ["2"], 13: []}
+  return Guild.from_data(
+    SimpleNamespace(app = SimpleNamespace(cache_policies = {}, users = EntityCache(), user = None, logger = None)),
+    {
+      "id"       : "1",
+      "name"     : "guild",
+      "owner_id" : "10",
+      "roles"    : [
+        {"id": "1", "name": "@everyone", "permissions": view},
+        {"id": "2", "name": "admins", "permissions": str(PermissionFlags.administrator.value)},
+        {"id": "3", "name": "writers", "permissions": send}
+      ],
+      "channels" : [{"id": "4", "type": 0, "name": "staff", "permission_overwrites": [
+        {"id": "1", "type": 0, "allow": "0", "deny": view},
+        {"id": "3", "type": 0, "allow": view, "deny": "0"},
+        {"id": "11", "type": 1, "allow": "0", "deny": send},
+        {"id": "13", "type": 1, "allow": send, "deny": "0"}
+      ]}],
+      "members"  : [{"user": {"id": str(member_id), "username": f"user{member_id}"}, "roles": roles} for member_id, roles in members.items()]
+    }
+  )
+
+
+def test_guild_permissions_combine_roles() -> None:
+  guild : Guild = resolved_guild()
+  assert int(guild.permissions_for(guild.members.get(13))) == PermissionFlags.view_channel.value
+  assert int(guild.permissions_for(guild.members.get(11))) == PermissionFlags.view_channel.value | PermissionFlags.send_messages.value
+  assert guild.permissions_for(guild.members.get(12)) is Permissions.all()
+  assert guild.permissions_for(guild.members.get(10)) is Permissions.all()
+
+
+def test_overwrites_apply_everyone_then_roles_then_member() -> None:
+  guild   : Guild        = resolved_guild()
+  channel : GuildChannel = guild.channels.get(4)
+  assert int(guild.permissions_for(guild.members.get(11), channel)) == PermissionFlags.view_channel.value
+  assert int(guild.permissions_for(guild.members.get(13), channel)) == PermissionFlags.send_messages.value
+  assert guild.permissions_for(guild.members.get(12), channel) is Permissions.all()
+
+
+def test_results_are_memoized_until_invalidated() -> None:
+  guild   : Guild        = resolved_guild()
+  channel : GuildChannel = guild.channels.get(4)
+  writer  : Member       = guild.members.get(11)
+  other   : Member       = guild.members.get(13)
+  first   : Permissions  = guild.permissions_for(writer, channel)
+  guild.permissions_for(other, channel)
+  assert guild.permissions_for(writer, channel) is first
+  guild.roles.get(3)._update({"permissions": "0"})
+  guild.resolver.invalidate_role(3)
+  assert 11 not in guild.resolver._cache and 13 in guild.resolver._cache
+  assert int(guild.permissions_for(writer)) == PermissionFlags.view_channel.value
+  guild.resolver.invalidate_channel(4)
+  assert all(list(results) == [None] for results in guild.resolver._cache.values())
+  guild.resolver.invalidate_member(13)
+  assert 13 not in guild.resolver._cache
+  guild.resolver.invalidate_role(guild.id)
+  assert not guild.resolver._cache
\ No newline at end of file
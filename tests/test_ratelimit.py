@@ -0,0 +1,165 @@
+import json
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+from democord.errors    import RateLimited
+from democord.http      import HTTPClient
+from democord.ratelimit import Bucket
+from http.server        import (
+                               BaseHTTPRequestHandler,
+                               ThreadingHTTPServer
+                               )
+from threading          import (
+                               Lock,
+                               Thread
+                               )
+from time               import (
+                               monotonic,
+                               time
+                               )
+from typing             import *
+
+
+class FakeDiscord(ThreadingHTTPServer):
+  """
+  Local server enforcing a single rate limit bucket the way Discord does, answering requests beyond ` limit ` per ` per ` seconds with a 429
+  """
+
+  daemon_threads : bool = True
+
+  def __init__(
+    self,
+    limit : int   = 2,
+    per   : float = 0.3
+  ) -> None:
+    super().__init__(("127.0.0.1", 0), FakeHandler)
+    self.limit       : int             = limit
+    self.per         : float           = per
+    self.lock        : Lock            = Lock()
+    self.requests    : int             = 0
+    self.limited     : int             = 0
+    self.window      : float           = 0.0
+    self.used        : int             = 0
+    self.status      : Optional[int]   = None
+    self.always_429  : bool            = False
+
+
+  def take(
+    self
+  ) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+    with self.lock:
+      self.requests += 1
+      if self.status: return self.status, {}, {"message": "Internal Server Error", "code": 0}
+      now : float = monotonic()
+      if now >= self.window + self.per:
+        self.window : float = now
+        self.used   : int   = 0
+      reset_after : float = self.window + self.per - now
+      if self.always_429 or self.used >= self.limit:
+        self.limited += 1
+        return 429, {"Retry-After": f"{reset_after:.3f}"}, {"message": "You are being rate limited.", "retry_after": reset_after, "global": False}
+      self.used += 1
+      return 200, {
+        "X-RateLimit-Bucket"      : "fake",
+        "X-RateLimit-Limit"       : str(self.limit),
+        "X-RateLimit-Remaining"   : str(self.limit - self.used),
+        "X-RateLimit-Reset"       : f"{time() + reset_after:.3f}",
+        "X-RateLimit-Reset-After" : f"{reset_after:.3f}"
+      }, {"id": "1"}
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+  def do_GET(
+    self
+  ) -> None:
+    status, headers, body = self.server.take()
+    content : bytes = json.dumps(body).encode()
+    self.send_response(status)
+    for name, value in headers.items(): self.send_header(name, value)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Length", str(len(content)))
+    self.end_headers()
+    self.wfile.write(content)
+
+  do_PATCH = do_GET
+
+  def log_message(
+    self,
+    *args
+  ) -> None:
+    pass
+
+
+@pytest.fixture
+def server() -> Iterator[FakeDiscord]:
+  server : FakeDiscord = FakeDiscord()
+  thread : Thread      = Thread(target = server.serve_forever, daemon = True)
+  thread.start()
+  yield server
+  server.shutdown()
+  server.server_close()
+
+
+@pytest.fixture
+def client(
+  server : FakeDiscord
+) -> Iterator[HTTPClient]:
+  client     : HTTPClient = HTTPClient("token", max_retries = 2)
+  client.api : str        = f"http://127.0.0.1:{server.server_port}"
+  yield client
+  client.close()
+
+
+def test_bucket_holds_requests_until_reset(
+  server : FakeDiscord,
+  client : HTTPClient
+) -> None:
+  with ThreadPoolExecutor(8) as pool:
+    results : List[Any] = list(pool.map(lambda _: client.request("PATCH", "/guilds/1"), range(8)))
+  assert results == [{"id": "1"}] * 8
+  assert server.limited == 0
+  assert server.requests == 8
+
+
+def test_rate_limited_request_is_retried(
+  server : FakeDiscord,
+  client : HTTPClient
+) -> None:
+  bucket : Bucket = client.ratelimiter.bucket("PATCH", "/guilds/1")
+  bucket.unlimited : bool = True
+  for _ in range(3): assert client.request("PATCH", "/guilds/1") == {"id": "1"}
+  assert server.limited == 1
+
+
+def test_exhausted_retries_raise(
+  server : FakeDiscord,
+  client : HTTPClient
+) -> None:
+  server.always_429 : bool = True
+  with pytest.raises(RateLimited) as error:
+    client.request("PATCH", "/guilds/1")
+  assert server.requests == client.max_retries + 1
+  assert error.value.retry_after > 0
+
+
+def test_failed_discovery_does_not_mark_bucket_unlimited(
+  server : FakeDiscord,
+  client : HTTPClient
+) -> None:
+  server.status : int = 500
+  assert client.request("PATCH", "/guilds/1") == {"message": "Internal Server Error", "code": 0}
+  assert not client.ratelimiter.bucket("PATCH", "/guilds/1").unlimited
+  server.status : Optional[int] = None
+  with ThreadPoolExecutor(6) as pool:
+    list(pool.map(lambda _: client.request("PATCH", "/guilds/1"), range(6)))
+  assert server.limited == 0
+
+
+def test_successful_response_without_headers_marks_bucket_unlimited() -> None:
+  bucket : Bucket = Bucket()
+  bucket.acquire()
+  bucket.update(None, None, None, None, success = False)
+  assert not bucket.unlimited
+  bucket.acquire()
+  bucket.update(None, None, None, None)
+  assert bucket.unlimited
\ No newline at end of file
@@ -0,0 +1,63 @@
+from democord.payloads  import Payload
+from democord.sequencer import EventSequencer
+from typing             import *
+
+
+def dispatch(
+  sequence : Optional[int]
+) -> Payload:
+  return Payload(op = 0, d = {"s": sequence}, s = sequence, t = "MESSAGE_CREATE")
+
+
+def sequences(
+  payloads : List[Payload]
+) -> List[Optional[int]]:
+  return [payload.s for payload in payloads]
+
+
+def test_payloads_ahead_of_a_gap_wait_for_it() -> None:
+  sequencer : EventSequencer = EventSequencer()
+  assert sequences(sequencer.push(dispatch(1))) == [1]
+  assert sequences(sequencer.push(dispatch(4))) == []
+  assert sequences(sequencer.push(dispatch(3))) == []
+  assert len(sequencer) == 2
+  assert sequences(sequencer.push(dispatch(2))) == [2, 3, 4]
+  assert sequencer.last == 4 and not len(sequencer)
+
+
+def test_replayed_payloads_are_dropped() -> None:
+  sequencer : EventSequencer = EventSequencer()
+  for sequence in (1, 2, 3): sequencer.push(dispatch(sequence))
+  sequencer.push(dispatch(5))
+  assert sequences(sequencer.push(dispatch(2))) == []
+  assert sequences(sequencer.push(dispatch(5))) == []
+  assert sequencer.duplicates == 2
+  assert sequences(sequencer.push(dispatch(4))) == [4, 5]
+
+
+def test_gap_is_given_up_on_past_the_window() -> None:
+  sequencer : EventSequencer = EventSequencer(window = 3)
+  sequencer.push(dispatch(1))
+  for sequence in (6, 4, 5): assert sequences(sequencer.push(dispatch(sequence))) == []
+  assert sequences(sequencer.push(dispatch(3))) == [3, 4, 5, 6]
+  assert sequences(sequencer.push(dispatch(9))) == []
+  assert sequences(sequencer.push(dispatch(8))) == []
+  assert sequences(sequencer.push(dispatch(11))) == []
+  assert sequences(sequencer.push(dispatch(10))) == [8, 9, 10, 11]
+  assert sequencer.last == 11
+
+
+def test_unsequenced_payloads_pass_through() -> None:
+  sequencer : EventSequencer = EventSequencer()
+  sequencer.push(dispatch(1))
+  sequencer.push(dispatch(3))
+  assert sequences(sequencer.push(dispatch(None))) == [None]
+  assert sequencer.last == 1
+
+
+def test_reset_starts_a_new_session() -> None:
+  sequencer : EventSequencer = EventSequencer()
+  for sequence in (1, 2, 4): sequencer.push(dispatch(sequence))
+  sequencer.reset()
+  assert sequencer.last is None and not len(sequencer)
+  assert sequences(sequencer.push(dispatch(1))) == [1]
\ No newline at end of file
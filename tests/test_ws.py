@@ -0,0 +1,101 @@
+import json
+import pytest
+
+from democord.codec     import JSONCodec
+from democord.payloads  import Payload
+from democord.sequencer import EventSequencer
+from democord.ws        import DiscordWebSocket
+from types              import SimpleNamespace
+from typing             import *
+
+
+class CountingCodec(JSONCodec):
+  """
+  JSON codec counting the payloads it fully decodes
+  """
+
+  def __init__(
+    self
+  ) -> None:
+    super().__init__("json")
+    self.decoded : int                  = 0
+    self.loads   : Callable[[str], Any] = self.decode
+    self.decode  : Callable[[str], Any] = self.counted
+
+
+  def counted(
+    self,
+    data : str
+  ) -> Any:
+    self.decoded += 1
+    return self.loads(data)
+
+
+def frame(
+  event    : str,
+  sequence : int
+) -> str:
+  return json.dumps({"t": event, "s": sequence, "op": 0, "d": {"channel_id": "41771983423143937", "user_id": "80351110224678912"}}, separators = (",", ":"))
+
+
+@pytest.fixture
+def shard() -> DiscordWebSocket:
+  emitted : List[Tuple[str, int]] = []
+  shard   : DiscordWebSocket      = DiscordWebSocket.__new__(DiscordWebSocket)
+  shard.app           = SimpleNamespace(logger = None, events = SimpleNamespace(listeners = {}, waiters = {}, emit = lambda ws, payload, *args: emitted.append((getattr(payload.t, "value", payload.t), payload.s))))
+  shard.codec         = CountingCodec()
+  shard.connection    = object()
+  shard.emitted       = emitted
+  shard.inflator      = None
+  shard.last_sequence = None
+  shard.sequencer     = EventSequencer()
+  return shard
+
+
+def test_unsubscribed_event_is_counted_without_decoding(
+  shard : DiscordWebSocket
+) -> None:
+  shard.on_message(shard.connection, frame("TYPING_START", 1))
+  assert shard.codec.decoded == 0
+  assert shard.emitted == []
+  assert shard.last_sequence == 1
+
+
+def test_event_with_listener_is_decoded_and_emitted(
+  shard : DiscordWebSocket
+) -> None:
+  shard.app.events.listeners["TYPING_START"] = (lambda *args: None,)
+  shard.on_message(shard.connection, frame("TYPING_START", 1))
+  assert shard.codec.decoded == 1
+  assert shard.emitted == [("TYPING_START", 1)]
+
+
+def test_event_with_waiter_is_decoded_and_emitted(
+  shard : DiscordWebSocket
+) -> None:
+  shard.app.events.waiters["TYPING_START"] = {None: {}}
+  assert shard.subscribed("TYPING_START")
+  shard.on_message(shard.connection, frame("TYPING_START", 1))
+  assert shard.codec.decoded == 1
+  assert shard.emitted == [("TYPING_START", 1)]
+
+
+def test_skipped_event_fills_its_sequence_gap(
+  shard : DiscordWebSocket
+) -> None:
+  shard.app.events.listeners["MESSAGE_CREATE"] = (lambda *args: None,)
+  shard.on_message(shard.connection, frame("MESSAGE_CREATE", 1))
+  shard.on_message(shard.connection, frame("MESSAGE_CREATE", 3))
+  assert shard.emitted == [("MESSAGE_CREATE", 1)]
+  shard.on_message(shard.connection, frame("TYPING_START", 2))
+  assert shard.emitted == [("MESSAGE_CREATE", 1), ("MESSAGE_CREATE", 3)]
+  assert shard.codec.decoded == 2
+  assert shard.last_sequence == 3
+
+
+def test_consumed_events_are_always_subscribed(
+  shard : DiscordWebSocket
+) -> None:
+  assert shard.subscribed("GUILD_MEMBER_UPDATE")
+  assert shard.subscribed("READY")
+  assert not shard.subscribed("PRESENCE_UPDATE")
\ No newline at end of file